@@ -3,9 +3,14 @@
 from src.domain.domain.materials import (  # type: ignore
     get_concrete_properties,
     get_steel_properties,
+    get_stirrup_steel_properties,
 )
 
-__all__ = ["get_concrete_properties", "get_steel_properties"]
+__all__ = [
+    "get_concrete_properties",
+    "get_steel_properties",
+    "get_stirrup_steel_properties",
+]
 from importlib import import_module as _im
 
 _mod = _im("src.domain.domain.materials")
@@ -1,8 +1,11 @@
 # Compatibility shim: re-export methods_sle from src.methods.verification.methods_sle
 # Explicit re-export to satisfy static analyzers
-from src.methods.verification.methods_sle import compute_sle_verification  # type: ignore
+from src.methods.verification.methods_sle import (  # type: ignore
+    compute_sle_verification,
+    compute_sle_verification_batch,
+)
 
-__all__ = ["compute_sle_verification"]
+__all__ = ["compute_sle_verification", "compute_sle_verification_batch"]
 from importlib import import_module as _im
 
 _mod = _im("src.methods.verification.methods_sle")
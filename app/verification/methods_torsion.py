@@ -0,0 +1,13 @@
+# Compatibility shim: re-export methods_torsion from src.methods.verification.methods_torsion
+# Explicit re-export to satisfy static analyzers
+from src.methods.verification.methods_torsion import (  # type: ignore
+    apply_torsion_verification,
+)
+
+__all__ = ["apply_torsion_verification"]
+from importlib import import_module as _im
+
+_mod = _im("src.methods.verification.methods_torsion")
+for _name, _val in vars(_mod).items():
+    if not _name.startswith("_"):
+        globals()[_name] = _val
@@ -0,0 +1,206 @@
+"""Verifica di stabilità (carico di punta) dei pilastri in C.A. col metodo omega.
+
+Porting di `VerifStabilitàAstaCA` (ramo T.A.) e `f_OmegaCA` (PrincipCA_TA.bas,
+8. e 8.1). Il VB verifica un pilastro alla volta; qui ogni grandezza è un array
+NumPy con una voce per riga (pilastro, combinazione), per cui la distinta dei
+pilastri di un intero edificio si verifica con una sola chiamata.
+
+Per ogni riga compressa (N < 0):
+
+- snellezza lambda = beta * L / rho nei due piani e carico critico
+  Pcr = pi^2 * (0.4 Ec) * I / L0^2 (sezione omogeneizzata);
+- coefficiente omega(lambda) dall'abaco rd2229_omega (valore 10 oltre la tabella);
+- compressione centrata: sigma_c = omega * N / Aci <= sigma_c ridotta (f_Sigcar),
+  n * sigma_c <= sigma_fa;
+- con momento: anche le due verifiche a pressoflessione (omega*N, a_M*M) e
+  (N, a_M*M), con a_M = 1 / (1 - |N| / Pcr) nel piano del momento.
+
+Unità: lunghezze [cm], forze [kg], momenti [kg·cm], tensioni [kg/cm²].
+Sezione rettangolare b x h con armatura superiore e inferiore alla distanza
+`copriferro` (asse barre) dai lembi; il momento agisce nel piano di h ed è
+positivo quando comprime il lembo superiore. N > 0 trazione.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.core_calculus.core.abachi import get_abaco
+from src.core_calculus.core.crack_width import cracked_section_stresses
+
+# Tabella omega(lambda) di f_OmegaCA: abaco data/abachi/rd2229_omega.json
+OMEGA_ABACO = "rd2229_omega"
+OMEGA_FUORI_TABELLA = 10.0
+
+# Snellezza oltre la quale il VB segnala "limite che è opportuno non superare"
+LAMBDA_CONSIGLIATA = 100.0
+
+
+def omega_ca(lam):
+    """Coefficiente omega per una o più snellezze (f_OmegaCA)."""
+    abaco = get_abaco(OMEGA_ABACO)
+    lam = np.asarray(lam, dtype=float)
+    omega = np.where(lam <= abaco.x[-1], abaco("omega", lam), OMEGA_FUORI_TABELLA)
+    return omega[()] if omega.ndim == 0 else omega
+
+
+def sigma_c_ridotta(sigma_ca, b, h):
+    """Tensione ammissibile ridotta per compressione centrata (f_Sigcar).
+
+    0.7 * sigma_ca, ulteriormente ridotta del 3% per ogni cm in meno di 25 cm
+    del lato minore.
+    """
+    lato = np.minimum(np.asarray(b, dtype=float), np.asarray(h, dtype=float))
+    rid = np.where(lato < 25.0, 1.0 - 0.03 * (25.0 - lato), 1.0)
+    out = 0.7 * np.asarray(sigma_ca, dtype=float) * rid
+    return out[()] if out.ndim == 0 else out
+
+
+@dataclass
+class StabilitaRisultato:
+    """Risultati per riga di `verifica_stabilita_ta` (array NumPy)."""
+
+    lamda_y: np.ndarray  # piano di h (piano del momento)
+    lamda_z: np.ndarray  # piano di b
+    lamda: np.ndarray
+    P_cr: np.ndarray
+    sigma_cr: np.ndarray
+    omega: np.ndarray
+    a_M: np.ndarray  # 1 dove M = 0
+    sigma_c: np.ndarray  # massima compressione del cls tra le verifiche (valore assoluto)
+    sigma_s: np.ndarray  # massima tensione dell'acciaio tra le verifiche (valore assoluto)
+    necessaria: np.ndarray  # False per le righe non compresse
+    verificata: np.ndarray
+
+    @property
+    def snellezza_eccessiva(self) -> np.ndarray:
+        return self.necessaria & (self.lamda > LAMBDA_CONSIGLIATA)
+
+
+def verifica_stabilita_ta(
+    N,
+    L,
+    b,
+    h,
+    As_sup,
+    As_inf,
+    copriferro,
+    M=0.0,
+    *,
+    beta_y=1.0,
+    beta_z=1.0,
+    Ec,
+    sigma_ca,
+    sigma_fa,
+    n=15.0,
+) -> StabilitaRisultato:
+    """Verifica a carico di punta alle T.A. di una distinta di pilastri.
+
+    Tutti gli argomenti si combinano per broadcasting; `beta_y`, `beta_z` sono i
+    coefficienti di lunghezza libera nel piano di h e in quello di b.
+    """
+    arrays = np.broadcast_arrays(
+        *(
+            np.asarray(v, dtype=float)
+            for v in (
+                N,
+                L,
+                b,
+                h,
+                As_sup,
+                As_inf,
+                copriferro,
+                M,
+                beta_y,
+                beta_z,
+                Ec,
+                sigma_ca,
+                sigma_fa,
+                n,
+            )
+        )
+    )
+    shape = arrays[0].shape
+    N, L, b, h, As_s, As_i, a, M, beta_y, beta_z, Ec, sca, sfa, n = (v.ravel() for v in arrays)
+    # Sezione omogeneizzata (assi principali: la sezione è simmetrica in b)
+    As = As_s + As_i
+    Aci = b * h + n * As
+    yG = (b * h * h / 2.0 + n * (As_s * a + As_i * (h - a))) / Aci
+    I_y = (
+        b * h**3 / 12.0
+        + b * h * (h / 2.0 - yG) ** 2
+        + n * (As_s * (a - yG) ** 2 + As_i * (h - a - yG) ** 2)
+    )
+    # Barre di ciascuno strato distribuite uniformemente sulla larghezza utile
+    I_z = h * b**3 / 12.0 + n * As * (b / 2.0 - a) ** 2 / 3.0
+
+    L0_y, L0_z = beta_y * L, beta_z * L
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lamda_y = L0_y / np.sqrt(I_y / Aci)
+        lamda_z = L0_z / np.sqrt(I_z / Aci)
+        P_cr_y = np.pi**2 * 0.4 * Ec * I_y / L0_y**2
+        P_cr_z = np.pi**2 * 0.4 * Ec * I_z / L0_z**2
+    lamda = np.maximum(lamda_y, lamda_z)
+    P_cr = np.minimum(P_cr_y, P_cr_z)
+    omega = np.asarray(omega_ca(lamda))
+    sigcar = np.asarray(sigma_c_ridotta(sca, b, h))
+
+    compresso = N < 0.0
+    # 1^ verifica: sforzo normale amplificato
+    sigma_c = np.abs(omega * N / Aci)
+    sigma_s = n * sigma_c
+    ok = (sigma_c <= sigcar) & (sigma_s <= sfa)
+
+    # 2^ e 3^ verifica: pressoflessione con momento amplificato
+    a_M = np.ones_like(N)
+    flesso = np.flatnonzero(compresso & (M != 0.0))
+    if flesso.size:
+        Nf, Mf = N[flesso], M[flesso]
+        stabile = np.abs(Nf) < P_cr_y[flesso]
+        with np.errstate(divide="ignore"):
+            aM = np.where(stabile, 1.0 / (1.0 - np.abs(Nf) / P_cr_y[flesso]), np.inf)
+        a_M[flesso] = aM
+        sez = (b[flesso], h[flesso], As_i[flesso], a[flesso], As_s[flesso], a[flesso])
+        for N_v in (omega[flesso] * Nf, Nf):
+            st = cracked_section_stresses(*sez, N_v, np.where(stabile, aM * Mf, 0.0), n[flesso])
+            sc = st.sigma_c
+            ss = np.maximum(np.abs(st.sigma_s_tensile), np.abs(st.sigma_s_compressed))
+            ok[flesso] &= (
+                stabile
+                & st.converged
+                & (sc <= sca[flesso])
+                & (ss <= sfa[flesso])
+                & (np.abs(N_v) / Aci[flesso] <= sigcar[flesso])
+            )
+            sigma_c[flesso] = np.maximum(sigma_c[flesso], sc)
+            sigma_s[flesso] = np.maximum(sigma_s[flesso], ss)
+
+    return StabilitaRisultato(
+        **{
+            name: value.reshape(shape)
+            for name, value in (
+                ("lamda_y", lamda_y),
+                ("lamda_z", lamda_z),
+                ("lamda", lamda),
+                ("P_cr", P_cr),
+                ("sigma_cr", P_cr / Aci),
+                ("omega", omega),
+                ("a_M", a_M),
+                ("sigma_c", np.where(compresso, sigma_c, 0.0)),
+                ("sigma_s", np.where(compresso, sigma_s, 0.0)),
+                ("necessaria", compresso),
+                ("verificata", ~compresso | ok),
+            )
+        }
+    )
+
+
+__all__ = [
+    "OMEGA_ABACO",
+    "StabilitaRisultato",
+    "omega_ca",
+    "sigma_c_ridotta",
+    "verifica_stabilita_ta",
+]
@@ -3,8 +3,10 @@ from __future__ import annotations
 import json
 import logging
 import shutil
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 from uuid import uuid4
 
 logger = logging.getLogger(__name__)
@@ -73,6 +75,51 @@ class Material:
         )
 
 
+def numeric_property(material: Any, keys: Iterable[str]) -> float | None:
+    """Primo valore numerico trovato tra gli attributi (o le chiavi, se il materiale
+    è un dizionario) e poi in ``properties``."""
+    if isinstance(material, Mapping):
+        fields, props = material, material.get("properties") or {}
+    else:
+        fields = {key: getattr(material, key) for key in keys if hasattr(material, key)}
+        props = getattr(material, "properties", {}) or {}
+    for key in keys:
+        val = fields.get(key)
+        if isinstance(val, (int, float)):
+            return float(val)
+    for key in keys:
+        if key in props and isinstance(props[key], (int, float)):
+            return float(props[key])
+    return None
+
+
+@dataclass(frozen=True)
+class MaterialValues:
+    """Vista numerica immutabile di un materiale (valori già estratti).
+
+    Evita di ripetere il probing di attributi/proprietà ad ogni riga di verifica.
+    """
+
+    fck: float | None = None  # MPa
+    fyk: float | None = None  # MPa
+    Ec: float | None = None
+    Es: float | None = None
+
+    FCK_KEYS = ("fck_MPa", "fck_mpa", "fck")
+    FYK_KEYS = ("fyk_MPa", "fyk_mpa", "fyk")
+    EC_KEYS = ("Ec", "E")
+    ES_KEYS = ("Es",)
+
+    @classmethod
+    def from_material(cls, material: Any) -> MaterialValues:
+        return cls(
+            fck=numeric_property(material, cls.FCK_KEYS),
+            fyk=numeric_property(material, cls.FYK_KEYS),
+            Ec=numeric_property(material, cls.EC_KEYS),
+            Es=numeric_property(material, cls.ES_KEYS),
+        )
+
+
 # Historical materials module is provided in `historical_materials.py` as a
 # single authoritative source
 try:
@@ -207,6 +254,12 @@ class MaterialRepository:
 
     def __init__(self, json_file: str = DEFAULT_JSON_FILE) -> None:
         self._materials: dict[str, Material] = {}
+        # Indici secondari (nome/codice → id) e viste numeriche, ricostruiti
+        # alla prima ricerca dopo ogni modifica dell'archivio
+        self._by_name: dict[str, str] | None = None
+        self._by_code: dict[str, str] | None = None
+        # nome → (materiale da cui è stata estratta la vista, vista)
+        self._values: dict[str, tuple[Material, MaterialValues]] = {}
         self._json_file = json_file
         # Flag per repository in-memory (es. json_file=":memory:") usato nei test
         self._in_memory = json_file == ":memory:"
@@ -223,6 +276,7 @@ class MaterialRepository:
 
     def add(self, mat: Material) -> None:
         self._materials[mat.id] = mat
+        self._invalidate_indexes()
         logger.debug("Materiale aggiunto: %s (%s)", mat.id, mat.name)
         # Salva in file JSON
         self.save_to_file()
@@ -269,11 +323,59 @@ class MaterialRepository:
         )
 
     def find_by_name(self, name: str) -> Material | None:
-        for m in self._materials.values():
-            if m.name == name:
-                return m
+        return self._find_indexed("name", name)
+
+    def find_by_code(self, code: str) -> Material | None:
+        if not code:
+            return None
+        return self._find_indexed("code", code)
+
+    def _find_indexed(self, attr: str, value: str) -> Material | None:
+        for attempt in range(2):
+            if self._by_name is None or self._by_code is None:
+                self._build_indexes()
+            index = self._by_name if attr == "name" else self._by_code
+            material = self._materials.get(index.get(value, ""))
+            if material is None or getattr(material, attr) == value:
+                return material
+            # Materiale modificato in place senza `update`: ricostruisci gli indici
+            if attempt == 0:
+                self._invalidate_indexes()
         return None
 
+    def get_values(self, name: str) -> MaterialValues | None:
+        """Vista numerica (fck/fyk/Ec/Es) del materiale con il nome dato, memorizzata.
+
+        La vista memorizzata vale finché il nome risolve allo stesso oggetto:
+        materiali sostituiti o rinominati la ricalcolano.
+        """
+        material = self.find_by_name(name)
+        if material is None:
+            self._values.pop(name, None)
+            return None
+        cached = self._values.get(name)
+        if cached is not None and cached[0] is material:
+            return cached[1]
+        values = MaterialValues.from_material(material)
+        self._values[name] = (material, values)
+        return values
+
+    def _build_indexes(self) -> None:
+        by_name: dict[str, str] = {}
+        by_code: dict[str, str] = {}
+        for m in self._materials.values():
+            # A parità di nome/codice vince il primo materiale, come nella scansione lineare
+            by_name.setdefault(m.name, m.id)
+            if m.code:
+                by_code.setdefault(m.code, m.id)
+        self._by_name = by_name
+        self._by_code = by_code
+
+    def _invalidate_indexes(self) -> None:
+        self._by_name = None
+        self._by_code = None
+        self._values.clear()
+
     def find_by_id(self, material_id: str) -> Material | None:
         return self._materials.get(material_id)
 
@@ -286,6 +388,7 @@ class MaterialRepository:
         # Preserva l'ID originale
         updated_material.id = material_id
         self._materials[material_id] = updated_material
+        self._invalidate_indexes()
         logger.debug("Materiale aggiornato: %s (%s)", material_id, updated_material.name)
 
         # Salva in file JSON
@@ -301,6 +404,7 @@ class MaterialRepository:
         """Elimina un materiale dal repository."""
         material = self._materials.pop(material_id, None)
         if material:
+            self._invalidate_indexes()
             logger.debug("Materiale eliminato: %s (%s)", material_id, material.name)
 
             # Salva in file JSON
@@ -315,6 +419,7 @@ class MaterialRepository:
     def clear(self) -> None:
         """Elimina tutti i materiali."""
         self._materials.clear()
+        self._invalidate_indexes()
 
         # Salva in file JSON
         self.save_to_file()
@@ -335,6 +440,7 @@ class MaterialRepository:
             return []
 
     def _populate_from_raw(self, raw_data: list, path: Path, *, backup: bool = False) -> None:
+        self._invalidate_indexes()
         for idx, item in enumerate(raw_data):
             try:
                 material = Material.from_dict(item)
@@ -359,8 +465,10 @@ class MaterialRepository:
         # Se il repository è in-memory (test special case), non facciamo I/O
         if getattr(self, "_in_memory", False):
             self._materials.clear()
+            self._invalidate_indexes()
             return
         self._materials.clear()
+        self._invalidate_indexes()
 
         if self._try_load_sources():
             return
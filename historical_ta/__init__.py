@@ -5,7 +5,43 @@ PrincipCA_TA.bas (see comments in modules for mappings).
 """
 
 from .checks import AllowableCheckResult, AllowableStresses, check_allowable_stresses_ta
-from .geometry import SectionGeometry, SectionProperties, compute_section_properties
+from .confinement import (
+    ConfinedConcrete,
+    FRPConfinement,
+    SteelJacketConfinement,
+    StirrupConfinement,
+    clear_confinement_cache,
+    confined_concrete,
+    confined_concrete_law,
+)
+from .design import (
+    DesignMaterials,
+    RebarDesignProblem,
+    RebarDesignResult,
+    RebarLayout,
+    design_reinforcement,
+    design_reinforcement_many,
+    enumerate_layouts,
+    prune_layouts,
+)
+from .domain import (
+    DomainCheckResult,
+    ResistanceDomain,
+    UltimateDomain,
+    allowable_domain_for,
+    build_allowable_domain,
+    build_ultimate_domain,
+    check_domain_batch,
+    ultimate_domain_for,
+)
+from .fiber import FiberSection, FiberSolution, fiber_section_for, solve_fiber_section
+from .geometry import (
+    PolygonEdges,
+    SectionGeometry,
+    SectionProperties,
+    clip_polygon_half_plane,
+    compute_section_properties,
+)
 from .materials import ConcreteLawTA, SteelLawTA
 from .stress import LoadState, StressResult, compute_normal_stresses_ta
 
@@ -13,12 +49,41 @@ __all__ = [
     "SectionGeometry",
     "SectionProperties",
     "compute_section_properties",
+    "PolygonEdges",
+    "clip_polygon_half_plane",
     "ConcreteLawTA",
     "SteelLawTA",
+    "StirrupConfinement",
+    "FRPConfinement",
+    "SteelJacketConfinement",
+    "ConfinedConcrete",
+    "confined_concrete",
+    "confined_concrete_law",
+    "clear_confinement_cache",
     "LoadState",
     "StressResult",
     "compute_normal_stresses_ta",
+    "FiberSection",
+    "FiberSolution",
+    "fiber_section_for",
+    "solve_fiber_section",
+    "UltimateDomain",
+    "build_ultimate_domain",
+    "ultimate_domain_for",
+    "ResistanceDomain",
+    "DomainCheckResult",
+    "build_allowable_domain",
+    "allowable_domain_for",
+    "check_domain_batch",
     "AllowableStresses",
     "AllowableCheckResult",
     "check_allowable_stresses_ta",
+    "DesignMaterials",
+    "RebarDesignProblem",
+    "RebarLayout",
+    "RebarDesignResult",
+    "enumerate_layouts",
+    "prune_layouts",
+    "design_reinforcement",
+    "design_reinforcement_many",
 ]
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import math
+from dataclasses import astuple, dataclass, replace
+from functools import lru_cache
+
+from .materials import ConcreteLawTA
+
+# Confined concrete (VB PrincipCA_TA.bas: ClsConfinatoStaffe 4.6, ClsConfinatoFRP
+# 4.11, ClsConfinatoCalastr 4.12). Each model turns an unconfined ultimate law
+# into a ConcreteLawTA with increased fcd and strains; the result is a plain law,
+# so it is passed unchanged to solve_fiber_section and ultimate_domain_for (whose
+# domain cache is keyed on the law values).
+#
+# Confined laws are memoized on (base law, confinement layout): sweeping
+# retrofitting options over many load cases computes each law once. The cached
+# ConfinedConcrete objects are shared and must not be modified.
+#
+# Only rectangular and full circular sections, as in the VB routines; for circular
+# sections b is the diameter and h is ignored.
+#
+# Units: lengths [cm], areas [cm²], stresses and moduli [kg/cm²], angles [deg].
+
+
+@dataclass(frozen=True)
+class StirrupConfinement:
+    """Closed stirrups and ties (ClsConfinatoStaffe, NTC 2018 4.1.2.1.2.1).
+
+    `legs_y`/`legs_z` are the stirrup legs parallel to y (along b) and z (along h);
+    `bars_y`/`bars_z` the longitudinal bars along each side held by a stirrup
+    corner or tie (less than 2 on a side means alpha_n = 1). `spiral` marks
+    continuous spirals in circular sections, single hoops otherwise.
+    """
+
+    b: float
+    h: float
+    cover: float
+    stirrup_diameter: float
+    step: float
+    fyk: float
+    legs_y: int = 2
+    legs_z: int = 2
+    bars_y: int = 2
+    bars_z: int = 2
+    bar_diameter: float = 0.0
+    circular: bool = False
+    spiral: bool = False
+
+
+@dataclass(frozen=True)
+class FRPConfinement:
+    """FRP wrapping (ClsConfinatoFRP, CNR-DT 200).
+
+    `corner_radius` is the rounding of the section corners, `thickness`, `width`
+    and `spacing` those of the strips (continuous wrapping when `continuous`),
+    `eps_fd` the design ultimate strain of the fibres, `angle` their inclination
+    on the section plane.
+    """
+
+    b: float
+    h: float
+    corner_radius: float
+    thickness: float
+    width: float
+    spacing: float
+    E_frp: float
+    eps_fd: float
+    fpk: float
+    continuous: bool = True
+    angle: float = 0.0
+    circular: bool = False
+
+
+@dataclass(frozen=True)
+class SteelJacketConfinement:
+    """Steel jacket of corner angles and battens (ClsConfinatoCalastr).
+
+    `thickness`, `width` and `spacing` are those of the battens, `fyd` their
+    design yield strength.
+    """
+
+    b: float
+    h: float
+    corner_radius: float
+    thickness: float
+    width: float
+    spacing: float
+    fyd: float
+    circular: bool = False
+
+
+@dataclass(frozen=True)
+class ConfinedConcrete:
+    """Confined law with the parameters reported by the VB routines.
+
+    `efficiency` is alpha = alpha_n alpha_s (stirrups, jacket) or Keff (FRP);
+    `reinforcement_ratio` is w_wd for stirrups and the geometric ratio of the
+    wrapping (Ro_f, Ro_s) otherwise.
+    """
+
+    law: ConcreteLawTA
+    efficiency: float
+    lateral_pressure: float
+    effective_pressure: float
+    reinforcement_ratio: float
+
+
+def _wrapping_ratio(c) -> tuple[float, float, float]:
+    """alpha_n / Kh, geometric ratio of the wrapping and minimum dimension."""
+    if c.circular:
+        return 1.0, 4.0 * c.thickness * c.width / (c.b * c.spacing), c.b
+    bp, hp = c.b - 2.0 * c.corner_radius, c.h - 2.0 * c.corner_radius
+    k_h = 1.0 - (bp**2 + hp**2) / (3.0 * c.b * c.h)
+    rho = 2.0 * (c.b + c.h) * c.thickness * c.width / (c.b * c.h * c.spacing)
+    return k_h, rho, min(c.b, c.h)
+
+
+def _stirrups(law: ConcreteLawTA, c: StirrupConfinement, fck: float, fyd: float):
+    leg = math.pi * c.stirrup_diameter**2 / 4.0
+    s = c.step
+    if c.circular:
+        d0 = c.b - 2.0 * c.cover + c.stirrup_diameter
+        alpha_n = 1.0
+        if c.spiral:
+            alpha_s = 1.0 - s / (2.0 * d0)
+            v_st = leg * math.pi * d0 / 2.0
+        else:
+            alpha_s = (1.0 - s / (2.0 * d0)) ** 2
+            v_st = leg * math.pi * d0
+        sig_l = 2.0 * leg * c.fyk / (d0 * s)
+        v_core = math.pi * d0**2 / 4.0 * s
+    else:
+        by = c.b - 2.0 * c.cover + c.stirrup_diameter
+        bz = c.h - 2.0 * c.cover + c.stirrup_diameter
+        if c.bars_y < 2 or c.bars_z < 2:
+            sum_bi2 = 0.0
+        else:
+            # Bars evenly spaced along each side: sum of the squared distances
+            # between consecutive restrained bars around the perimeter
+            edge = c.cover + c.bar_diameter / 2.0
+            gap_y = (c.b - 2.0 * edge) / (c.bars_y - 1)
+            gap_z = (c.h - 2.0 * edge) / (c.bars_z - 1)
+            sum_bi2 = 2.0 * (c.bars_y - 1) * gap_y**2 + 2.0 * (c.bars_z - 1) * gap_z**2
+        alpha_n = 1.0 - sum_bi2 / (6.0 * by * bz)
+        alpha_s = (1.0 - s / (2.0 * by)) * (1.0 - s / (2.0 * bz))
+        asw_y, asw_z = c.legs_y * leg, c.legs_z * leg
+        sig_l = math.sqrt(asw_y * c.fyk / (bz * s) * asw_z * c.fyk / (by * s))
+        v_st = asw_y * by + asw_z * bz
+        v_core = by * bz * s
+    alpha = alpha_n * alpha_s
+    sig2 = alpha * sig_l
+    if sig2 <= 0.05 * fck:
+        fck_c = fck * (1.0 + 5.0 * sig2 / fck)
+    else:
+        fck_c = fck * (1.125 + 2.5 * sig2 / fck)
+    # fcd_c = 0.85 fck_c / gamma_c, i.e. law.fcd scaled by fck_c / fck
+    fcd_c = law.fcd * fck_c / fck
+    eps_c2 = law.eps_c2 * (fck_c / fck) ** 2
+    eps_cu = law.eps_cu + 0.2 * sig2 / fck
+    w_wd = v_st * fyd / (v_core * law.fcd)
+    return fcd_c, eps_c2, eps_cu, alpha, sig_l, sig2, w_wd
+
+
+def _frp(law: ConcreteLawTA, c: FRPConfinement):
+    k_h, rho, d_min = _wrapping_ratio(c)
+    k_v = 1.0 if c.continuous else (1.0 - (c.spacing - c.width) / (2.0 * d_min)) ** 2
+    k_a = 1.0 / (1.0 + math.tan(math.radians(c.angle)) ** 2)
+    k_eff = min(k_h * k_v * k_a, 1.0)
+    f_lat = 0.5 * rho * c.E_frp * min(c.eps_fd, 0.004)
+    f_eff = k_eff * f_lat
+    fccd = law.fcd * (1.0 + 2.6 * (f_eff / law.fcd) ** (2.0 / 3.0))
+    # Ultimate strain with the full fibre strain, limited to 0.6 fpk / E
+    f_eff_u = k_eff * 0.5 * rho * c.E_frp * min(c.eps_fd, 0.6 * c.fpk / c.E_frp)
+    eps_cu = 0.0035 + 0.015 * math.sqrt(f_eff_u / law.fcd)
+    return fccd, law.eps_c2, eps_cu, k_eff, f_lat, f_eff, rho
+
+
+def _jacket(law: ConcreteLawTA, c: SteelJacketConfinement):
+    alpha_n, rho, _ = _wrapping_ratio(c)
+    gap = c.spacing - c.width
+    if c.circular:
+        alpha_s = (1.0 - gap / (2.0 * c.b)) ** 2
+    else:
+        alpha_s = (1.0 - gap / (2.0 * c.b)) * (1.0 - gap / (2.0 * c.h))
+    f_lat = 0.5 * rho * c.fyd
+    f_eff = alpha_n * alpha_s * f_lat
+    fccd = law.fcd * (1.0 + 3.7 * (f_eff / law.fcd) ** 0.86)
+    eps_cu = 0.0035 + 0.5 * f_eff / fccd
+    eps_c2 = law.eps_c2 * (1.0 + 5.0 * (fccd / law.fcd - 1.0))
+    return fccd, eps_c2, eps_cu, alpha_n * alpha_s, f_lat, f_eff, rho
+
+
+@lru_cache(maxsize=512)
+def _cached_confined(
+    law: tuple, confinement, fck: float | None, fyd: float | None
+) -> ConfinedConcrete:
+    base = ConcreteLawTA(*law)
+    if isinstance(confinement, StirrupConfinement):
+        if fck is None:
+            raise ValueError("fck is required for confinement by stirrups")
+        params = _stirrups(base, confinement, fck, confinement.fyk / 1.15 if fyd is None else fyd)
+    elif isinstance(confinement, FRPConfinement):
+        params = _frp(base, confinement)
+    elif isinstance(confinement, SteelJacketConfinement):
+        params = _jacket(base, confinement)
+    else:
+        raise TypeError(f"unsupported confinement: {type(confinement).__name__}")
+    fcd, eps_c2, eps_cu, efficiency, f_lat, f_eff, ratio = params
+    # The pivot of region 6 (historical_ta.domain) needs eps_cu >= eps_c2
+    confined = replace(base, fcd=fcd, eps_c2=eps_c2, eps_cu=max(eps_cu, eps_c2))
+    return ConfinedConcrete(confined, efficiency, f_lat, f_eff, ratio)
+
+
+def confined_concrete(
+    law: ConcreteLawTA,
+    confinement: StirrupConfinement | FRPConfinement | SteelJacketConfinement,
+    fck: float | None = None,
+    fyd: float | None = None,
+) -> ConfinedConcrete:
+    """Return the (cached) confined version of the ultimate law `law`.
+
+    `fck` [kg/cm²] is needed by the stirrup model (fck_c / fck scales law.fcd);
+    `fyd` of the stirrups only enters w_wd and defaults to fyk / 1.15.
+    """
+    return _cached_confined(astuple(law), confinement, fck, fyd)
+
+
+def confined_concrete_law(
+    law: ConcreteLawTA,
+    confinement: StirrupConfinement | FRPConfinement | SteelJacketConfinement,
+    fck: float | None = None,
+) -> ConcreteLawTA:
+    """Shortcut for `confined_concrete(...).law`, to feed the fiber and domain solvers."""
+    return confined_concrete(law, confinement, fck).law
+
+
+def clear_confinement_cache() -> None:
+    _cached_confined.cache_clear()
@@ -0,0 +1,512 @@
+from __future__ import annotations
+
+import math
+import os
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from .domain import allowable_domain_for, ultimate_domain_for
+from .geometry import Bar, SectionGeometry
+from .materials import ConcreteLawTA, SteelLawTA, sigma_s_array
+
+# Longitudinal reinforcement design of rectangular sections (ProgCA, 5.).
+#
+# ProgCA starts from the bar counts that respect the maximum spacing (Nbh, Nbv),
+# corrects them for the code minima and then adds one bar at a time to the
+# tensioned side, running the full verification after each step. Here the whole
+# space of layouts is enumerated instead:
+#
+#   - top and bottom packets: (count, diameter) pairs with pitch <= p_max and
+#     clear spacing >= s_min (f_sL); corner bars belong to these packets;
+#   - side packets (symmetric, as Nbp(3) = Nbp(4) in the VB): internal bars,
+#     possibly none, with the same spacing limits along the height.
+#
+# The Cartesian product is pruned with necessary conditions that cost a few array
+# operations: the code limits on the total area and, for every load combination,
+# the equilibrium bounds below (bar forces <= fs * A, concrete never in tension).
+# Taking moments about each edge of the section,
+#
+#     sum(F_i * dist_i) = N * dist_G + M_edge
+#
+# where dist is the distance from that edge and F > 0 in tension; the left side is
+# bounded by a rigid-plastic relaxation (bar forces within +-fs * A, concrete
+# stress within fc, no compatibility), see _edge_capacity. Survivors are verified against their
+# (cached) TA or SLU domain in order of weight, one wave of chunks at a time in a
+# process pool, until the requested number of passing layouts is found: all the
+# lighter layouts have then been verified, so the result is the lightest.
+
+STEEL_DENSITY = 0.785  # kg/m per cm^2 of bar area
+DEFAULT_DIAMETERS = (1.2, 1.4, 1.6, 2.0, 2.4)  # cm
+DESIGN_ANGLES = 36
+DESIGN_STRAIN_STEPS = 12
+
+
+@dataclass(frozen=True)
+class DesignMaterials:
+    """Verification used for the candidates: "TA" (allowable stresses, Ec and
+    limits in kg/cm^2) or "SLU" (ultimate laws)."""
+
+    method: str
+    n_homog: float = 15.0
+    Ec: float = 0.0
+    sigma_c_allow: float = 0.0
+    sigma_s_allow: float = 0.0
+    concrete_law: ConcreteLawTA | None = None
+    steel_law: SteelLawTA | None = None
+
+    @classmethod
+    def ta(
+        cls, Ec: float, sigma_c_allow: float, sigma_s_allow: float, n_homog: float = 15.0
+    ) -> DesignMaterials:
+        return cls("TA", n_homog, Ec, sigma_c_allow, sigma_s_allow)
+
+    @classmethod
+    def slu(
+        cls, concrete_law: ConcreteLawTA, steel_law: SteelLawTA, n_homog: float = 15.0
+    ) -> DesignMaterials:
+        return cls("SLU", n_homog, concrete_law=concrete_law, steel_law=steel_law)
+
+    def strength_bounds(self) -> tuple[float, float]:
+        """Upper bounds (fc, fs) of the concrete and bar stresses [kg/cm^2]."""
+        if self.method == "TA":
+            return self.sigma_c_allow, self.sigma_s_allow
+        if self.concrete_law is None or self.steel_law is None:
+            raise ValueError("SLU design requires concrete_law and steel_law")
+        eps = np.array([self.steel_law.eps_yd, self.steel_law.eps_su])
+        fs = max(self.steel_law.fyd, float(np.abs(sigma_s_array(eps, self.steel_law)).max()))
+        return self.concrete_law.fcd, fs
+
+
+@dataclass(frozen=True)
+class RebarDesignProblem:
+    """Rectangular section B x H [cm] with clear cover `cover` [cm] and load
+    combinations (N [kg], My, Mz [kg·m]) in the conventions of the domain module
+    (axes origin at the bottom-left corner, N > 0 tension)."""
+
+    B: float
+    H: float
+    cover: float
+    loads: tuple[tuple[float, float, float], ...]
+    materials: DesignMaterials
+    diameters: tuple[float, ...] = DEFAULT_DIAMETERS
+    p_max: float = 30.0  # Pmax, maximum bar pitch
+    s_min: float = 2.5  # sLmin, minimum clear spacing
+    As_min: float = 0.0
+    As_max: float | None = None  # default 0.06 * B * H (LimitiArmaturaLong)
+    name: str = ""
+
+
+@dataclass(frozen=True)
+class RebarLayout:
+    """Bars of one layout: top and bottom packets (corners included) and
+    `n_side` internal bars on each vertical side. Diameters in [cm]."""
+
+    n_top: int
+    d_top: float
+    n_bottom: int
+    d_bottom: float
+    n_side: int
+    d_side: float
+    safety_factor: float = math.nan
+
+    @classmethod
+    def from_row(cls, row: Sequence[float], safety_factor: float = math.nan) -> RebarLayout:
+        """Layout from one row of `enumerate_layouts`."""
+        n_top, d_top, n_bottom, d_bottom, n_side, d_side = row
+        return cls(
+            int(n_top),
+            float(d_top),
+            int(n_bottom),
+            float(d_bottom),
+            int(n_side),
+            float(d_side),
+            safety_factor,
+        )
+
+    @property
+    def area(self) -> float:
+        return (
+            self.n_top * math.pi * self.d_top**2
+            + self.n_bottom * math.pi * self.d_bottom**2
+            + 2 * self.n_side * math.pi * self.d_side**2
+        ) / 4.0
+
+    @property
+    def weight(self) -> float:
+        """Steel weight per metre of member [kg/m]."""
+        return STEEL_DENSITY * self.area
+
+    def bars(self, problem: RebarDesignProblem) -> list[Bar]:
+        B, H, cf = problem.B, problem.H, problem.cover
+        z_top = H - cf - self.d_top / 2.0
+        z_bot = cf + self.d_bottom / 2.0
+        bars: list[Bar] = []
+        for n, d, z in ((self.n_top, self.d_top, z_top), (self.n_bottom, self.d_bottom, z_bot)):
+            for y in np.linspace(cf + d / 2.0, B - cf - d / 2.0, n):
+                bars.append((float(y), z, d))
+        for z in np.linspace(z_bot, z_top, self.n_side + 2)[1:-1]:
+            for y in (cf + self.d_side / 2.0, B - cf - self.d_side / 2.0):
+                bars.append((y, float(z), self.d_side))
+        return bars
+
+    def geometry(self, problem: RebarDesignProblem) -> SectionGeometry:
+        B, H = problem.B, problem.H
+        return SectionGeometry(
+            polygons=[[(0.0, 0.0), (B, 0.0), (B, H), (0.0, H)]],
+            bars=self.bars(problem),
+            n_homog=problem.materials.n_homog,
+        )
+
+    def describe(self) -> str:
+        text = f"sup {self.n_top}Ø{self.d_top * 10:g}"
+        text += f" + inf {self.n_bottom}Ø{self.d_bottom * 10:g}"
+        if self.n_side:
+            text += f" + lati 2x{self.n_side}Ø{self.d_side * 10:g}"
+        return text
+
+
+@dataclass
+class RebarDesignResult:
+    problem: RebarDesignProblem
+    layouts: list[RebarLayout]  # lightest passing layouts, by increasing weight
+    n_candidates: int
+    n_pruned: int
+    n_verified: int
+    messages: list[str] = field(default_factory=list)
+
+    @property
+    def best(self) -> RebarLayout | None:
+        return self.layouts[0] if self.layouts else None
+
+
+def _packet_options(
+    length: float, cover: float, diameters: Sequence[float], p_max: float, s_min: float
+) -> list[tuple[int, float]]:
+    """(count, diameter) of a horizontal packet including the corner bars (Nbh, f_sL)."""
+    options = []
+    for d in diameters:
+        free = length - 2.0 * cover
+        n = 2
+        while n * d <= free:
+            clear = (free - n * d) / (n - 1)  # f_sL
+            if clear < s_min:
+                break
+            if clear + d <= p_max:
+                options.append((n, float(d)))
+            n += 1
+    return options
+
+
+def _side_options(
+    length: float, cover: float, diameters: Sequence[float], p_max: float, s_min: float
+) -> list[tuple[int, float]]:
+    """(count, diameter) of the internal bars of a vertical side (Nbv)."""
+    options = []
+    for d in diameters:
+        span = length - 2.0 * cover - d
+        n = 0
+        while True:
+            pitch = span / (n + 1)
+            if pitch - d < s_min:
+                break
+            if pitch <= p_max:
+                options.append((n, 0.0 if n == 0 else float(d)))
+            n += 1
+    # Layouts without side bars are listed once
+    return sorted(set(options))
+
+
+def enumerate_layouts(problem: RebarDesignProblem) -> np.ndarray:
+    """All layouts respecting the spacing rules, as an (n, 6) array of
+    (n_top, d_top, n_bottom, d_bottom, n_side, d_side)."""
+    args = (problem.cover, problem.diameters, problem.p_max, problem.s_min)
+    horizontal = np.array(_packet_options(problem.B, *args), dtype=float).reshape(-1, 2)
+    vertical = np.array(_side_options(problem.H, *args), dtype=float).reshape(-1, 2)
+    i, j, k = np.meshgrid(
+        np.arange(len(horizontal)),
+        np.arange(len(horizontal)),
+        np.arange(len(vertical)),
+        indexing="ij",
+    )
+    return np.column_stack(
+        (horizontal[i.ravel()], horizontal[j.ravel()], vertical[k.ravel()])
+    ).reshape(-1, 6)
+
+
+def _edge_capacity(
+    depth: np.ndarray,
+    area: np.ndarray,
+    N: float,
+    fs: float,
+    fc: float,
+    width: float,
+    length: float,
+    linear_concrete: bool = False,
+) -> np.ndarray:
+    """Upper bound of sum(F * depth) over the internal forces, depth measured from
+    one edge of the section, for every layout (rows of `depth`, `area`).
+
+    Relaxation of the section equilibrium without compatibility: bar forces in
+    [-fs*A, fs*A] summing with the concrete compression C to N, concrete stress
+    <= fc so that its resultant lies at least C / (2 * fc * width) from the edge.
+    For a given C the bar term is a fractional knapsack (deepest bars in tension
+    first, concave in C); the concave total is maximized over the finite set of
+    breakpoints and stationary points. -inf where N cannot be equilibrated.
+
+    With `linear_concrete` (TA, neutral axis parallel to the edge) the concrete
+    stress is linear in the depth: its moment is at least that of the triangle
+    with peak fc, 2 C^2 / (3 fc width), then of the trapezoid over the whole depth.
+    """
+    order = np.argsort(-depth, axis=1)
+    d = np.take_along_axis(depth, order, axis=1)
+    cap = 2.0 * fs * np.take_along_axis(area, order, axis=1)
+    K = np.cumsum(cap, axis=1)
+    As = area.sum(axis=1)
+    base = -fs * (area * depth).sum(axis=1)  # every bar at -fs*A
+
+    C_lo = np.maximum(0.0, -N - fs * As)
+    C_hi = np.minimum(fc * width * length, fs * As - N)
+    C_tri = 0.5 * fc * width * length  # full-depth triangle
+    if linear_concrete:
+        stationary = (0.75 * fc * width * d, np.full((len(d), 1), C_tri))
+    else:
+        stationary = (fc * width * d,)
+    points = np.concatenate(
+        (C_lo[:, None], C_hi[:, None], *stationary, K - N - fs * As[:, None]), axis=1
+    )
+    C = np.clip(points, C_lo[:, None], np.maximum(C_hi, C_lo)[:, None])
+    R = N + C + fs * As[:, None]  # increase of the bar forces from all at -fs*A
+    K_prev = np.concatenate((np.zeros((len(d), 1)), K[:, :-1]), axis=1)
+    raised = np.clip(R[:, :, None] - K_prev[:, None, :], 0.0, cap[:, None, :])
+    if linear_concrete:
+        concrete = np.where(
+            C <= C_tri,
+            2.0 * C**2 / (3.0 * fc * width),
+            2.0 * C * length / 3.0 - fc * width * length**2 / 6.0,
+        )
+    else:
+        concrete = C**2 / (2.0 * fc * width)
+    value = base[:, None] + (raised * d[:, None, :]).sum(axis=2) - concrete
+    return np.where(C_lo <= C_hi, value.max(axis=1), -np.inf)
+
+
+def _layout_levels(problem: RebarDesignProblem, layouts: np.ndarray):
+    """Bar levels along the height (top, bottom, side bars; zero padded) as
+    (z, area) arrays, total area and homogenized centroid height of each layout."""
+    B, H, cf = problem.B, problem.H, problem.cover
+    n_top, d_top, n_bot, d_bot, n_side, d_side = layouts.T
+    a_top = n_top * np.pi * d_top**2 / 4.0
+    a_bot = n_bot * np.pi * d_bot**2 / 4.0
+    a_side = 2.0 * n_side * np.pi * d_side**2 / 4.0
+    z_top = H - cf - d_top / 2.0
+    z_bot = cf + d_bot / 2.0
+    k = np.arange(1, int(n_side.max(initial=0)) + 1)
+    z_side = z_bot[:, None] + k * ((z_top - z_bot) / (n_side + 1.0))[:, None]
+    a_level = np.where(k <= n_side[:, None], (a_side / np.maximum(n_side, 1.0))[:, None], 0.0)
+    z = np.column_stack((z_top, z_bot, z_side))
+    a = np.column_stack((a_top, a_bot, a_level))
+    As = a.sum(axis=1)
+    # Reference point of the domain moments: centroid of the homogenized section
+    n = problem.materials.n_homog
+    zG = (B * H * H / 2.0 + n * (a * z).sum(axis=1)) / (B * H + n * As)
+    return z, a, As, zG
+
+
+def _cheap_bounds(problem: RebarDesignProblem, layouts: np.ndarray) -> np.ndarray:
+    """Code limits on As and the edge bounds with bars only (concrete term dropped)."""
+    B, H = problem.B, problem.H
+    fc, fs = problem.materials.strength_bounds()
+    z, a, As, zG = _layout_levels(problem, layouts)
+    As_max = problem.As_max if problem.As_max is not None else 0.06 * B * H
+    ok = (As >= problem.As_min) & (As <= As_max)
+    Q_bottom = (a * z).sum(axis=1)
+    Q_top = As * H - Q_bottom
+    # Every packet is symmetric about the vertical axis: yG = B/2, Q_left = Q_right
+    yG = B / 2.0
+    Q_side = As * B / 2.0
+    for N, My, Mz in problem.loads:
+        My, Mz = 100.0 * My, 100.0 * Mz
+        ok &= N * zG + My <= fs * Q_bottom
+        ok &= N * (H - zG) - My <= fs * Q_top
+        ok &= N * yG - Mz <= fs * Q_side
+        ok &= N * (B - yG) + Mz <= fs * Q_side
+        ok &= (-N <= fc * B * H + fs * As) & (N <= fs * As)
+    return ok
+
+
+def _plastic_bounds(problem: RebarDesignProblem, layouts: np.ndarray) -> np.ndarray:
+    """Rigid-plastic edge bounds about the top and bottom edge (_edge_capacity)."""
+    B, H = problem.B, problem.H
+    fc, fs = problem.materials.strength_bounds()
+    z, a, _, zG = _layout_levels(problem, layouts)
+    ok = np.ones(len(layouts), dtype=bool)
+    for N, My, Mz in problem.loads:
+        My = 100.0 * My
+        linear = problem.materials.method == "TA" and Mz == 0.0
+        ok &= N * zG + My <= _edge_capacity(z, a, N, fs, fc, B, H, linear)
+        ok &= N * (H - zG) - My <= _edge_capacity(H - z, a, N, fs, fc, B, H, linear)
+    return ok
+
+
+def prune_layouts(problem: RebarDesignProblem, layouts: np.ndarray) -> np.ndarray:
+    """Boolean mask of the layouts that satisfy all the necessary conditions."""
+    ok = _cheap_bounds(problem, layouts)
+    rows = np.flatnonzero(ok)
+    if rows.size:
+        ok[rows] = _plastic_bounds(problem, layouts[rows])
+    return ok
+
+
+def _verify_chunk(
+    problem: RebarDesignProblem, rows: list[tuple[int, RebarLayout]]
+) -> list[tuple[int, float]]:
+    """Worker: minimum safety factor over all loads of each (index, layout) row."""
+    demands = np.asarray(problem.loads, dtype=float).reshape(-1, 3)
+    mats = problem.materials
+    mesh = max(problem.B, problem.H) / 20.0
+    out = []
+    for index, layout in rows:
+        geom = layout.geometry(problem)
+        if mats.method == "TA":
+            domain = allowable_domain_for(
+                geom,
+                mats.Ec,
+                mats.sigma_c_allow,
+                mats.sigma_s_allow,
+                DESIGN_ANGLES,
+                DESIGN_STRAIN_STEPS,
+                mesh,
+            )
+        else:
+            domain = ultimate_domain_for(
+                geom,
+                mats.concrete_law,
+                mats.steel_law,
+                DESIGN_ANGLES,
+                DESIGN_STRAIN_STEPS,
+                mesh,
+            )
+        out.append((index, float(domain.check(demands).safety_factor.min())))
+    return out
+
+
+class _Search:
+    """Weight-ordered verification state of one problem."""
+
+    def __init__(self, problem: RebarDesignProblem, n_results: int) -> None:
+        self.problem = problem
+        self.n_results = n_results
+        layouts = enumerate_layouts(problem)
+        self.n_candidates = len(layouts)
+        if problem.materials.method not in ("TA", "SLU"):
+            raise ValueError(f"Unknown design method '{problem.materials.method}'")
+        # Cheap bounds on everything; the plastic bounds are applied lazily to the
+        # blocks about to be verified, as the search usually stops early
+        survivors = layouts[_cheap_bounds(problem, layouts)] if len(layouts) else layouts
+        n_bars = survivors[:, 0] + survivors[:, 2] + 2.0 * survivors[:, 4]
+        area = (
+            survivors[:, 0] * survivors[:, 1] ** 2
+            + survivors[:, 2] * survivors[:, 3] ** 2
+            + 2.0 * survivors[:, 4] * survivors[:, 5] ** 2
+        )
+        # Lightest first; fewer bars first among equal weights
+        self.queue = survivors[np.lexsort((n_bars, np.round(area, 9)))]
+        self.n_pruned = self.n_candidates - len(self.queue)
+        self.n_verified = 0
+        self.position = 0
+        self.passed: list[RebarLayout] = []
+
+    @property
+    def done(self) -> bool:
+        return len(self.passed) >= self.n_results or self.position >= len(self.queue)
+
+    def next_wave(self, size: int) -> list[tuple]:
+        rows: list[tuple] = []
+        while len(rows) < size and self.position < len(self.queue):
+            stop = min(self.position + 4 * size, len(self.queue))
+            block = np.arange(self.position, stop)
+            keep = _plastic_bounds(self.problem, self.queue[block])
+            self.n_pruned += int(np.count_nonzero(~keep))
+            for i in block[keep][: size - len(rows)]:
+                rows.append((int(i), RebarLayout.from_row(self.queue[i])))
+            # Resume after the last taken row (the pruned ones before it are counted)
+            last = rows[-1][0] + 1 if len(rows) == size else stop
+            self.n_pruned -= int(np.count_nonzero(~keep[block >= last]))
+            self.position = last
+        self.n_verified += len(rows)
+        return rows
+
+    def collect(self, results: list[tuple[int, float]]) -> None:
+        for index, factor in sorted(results):
+            if factor >= 1.0:
+                self.passed.append(RebarLayout.from_row(self.queue[index], factor))
+
+    def result(self) -> RebarDesignResult:
+        messages = []
+        if not self.passed:
+            messages.append("No reinforcement layout passes the verification (OutNoProg)")
+        return RebarDesignResult(
+            problem=self.problem,
+            layouts=self.passed[: self.n_results],
+            n_candidates=self.n_candidates,
+            n_pruned=self.n_pruned,
+            n_verified=self.n_verified,
+            messages=messages,
+        )
+
+
+def design_reinforcement_many(
+    problems: Sequence[RebarDesignProblem],
+    n_results: int = 3,
+    *,
+    max_workers: int | None = None,
+    chunk_size: int = 16,
+    executor: Executor | None = None,
+) -> list[RebarDesignResult]:
+    """Design the longitudinal reinforcement of many sections (e.g. a storey).
+
+    Every wave submits the next lightest candidates of all unfinished problems to
+    one shared process pool. `max_workers=1` verifies in the calling process.
+    """
+    searches = [_Search(problem, n_results) for problem in problems]
+    own_pool = executor is None and max_workers != 1
+    pool = ProcessPoolExecutor(max_workers=max_workers) if own_pool else executor
+    workers = 1 if pool is None else max_workers or os.cpu_count() or 1
+    wave = max(n_results, chunk_size * workers)
+    try:
+        while True:
+            active = [s for s in searches if not s.done]
+            if not active:
+                break
+            jobs = []
+            for search in active:
+                rows = search.next_wave(wave)
+                for start in range(0, len(rows), chunk_size):
+                    chunk = rows[start : start + chunk_size]
+                    if pool is None:
+                        search.collect(_verify_chunk(search.problem, chunk))
+                    else:
+                        jobs.append((search, pool.submit(_verify_chunk, search.problem, chunk)))
+            for search, future in jobs:
+                search.collect(future.result())
+    finally:
+        if own_pool and pool is not None:
+            pool.shutdown()
+    return [search.result() for search in searches]
+
+
+def design_reinforcement(
+    problem: RebarDesignProblem,
+    n_results: int = 3,
+    *,
+    max_workers: int | None = None,
+    chunk_size: int = 16,
+    executor: Executor | None = None,
+) -> RebarDesignResult:
+    """Lightest layouts of one section passing every load combination."""
+    return design_reinforcement_many(
+        [problem], n_results, max_workers=max_workers, chunk_size=chunk_size, executor=executor
+    )[0]
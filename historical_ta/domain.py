@@ -0,0 +1,420 @@
+from __future__ import annotations
+
+from dataclasses import astuple, dataclass
+from functools import cached_property, lru_cache
+
+import numpy as np
+
+from .fiber import FiberSection, _geometry_key, fiber_section_for
+from .geometry import SectionGeometry
+from .materials import ConcreteLawTA, SteelLawTA, concrete_slu_response, steel_response
+
+# Ultimate N-My-Mz resistance domain (VB CA_SLU.bas: DominioRotturaMyMz 4.7.1 and
+# Nu_Myu_Mzu_Regione1..6).
+#
+# For each rotation angle alpha of the neutral axis the failure strain planes are
+# swept through the six regions of the ultimate domain, measuring the depth d of a
+# point from the most compressed edge along (cos alpha, sin alpha):
+#
+#   regions 1-2  pivot A: eps = +eps_su at the deepest bar (Hu), top fibre from
+#                +eps_su (uniform tension) to -eps_cu
+#   regions 3-5  pivot B: top fibre at -eps_cu, strain at Hu from +eps_su until the
+#                neutral axis reaches the opposite edge (x = H)
+#   region 6     pivot C: -eps_c2 at dd = (eps_cu - eps_c2) / eps_cu * H, down to
+#                uniform compression -eps_c2
+#
+# Instead of bisecting the neutral axis for one Nx at a time (as the VB routine
+# does), every strain configuration of an angle is evaluated at once on the fiber
+# mesh of historical_ta.fiber: the result is a structured (angle x configuration)
+# grid of points on the resistance surface. Cutting the surface at any N is then an
+# interpolation along each meridian, so checking load combinations needs no solve.
+#
+# The allowable-stress (TA) domain is built on the same grid: with elastic
+# no-tension concrete and n-homogenized bars the stresses are positively homogeneous
+# in the loads, so every strain plane scaled until sigma_c or sigma_s reaches its
+# allowable value gives a point of the TA boundary.
+#
+# Safety factors of load combinations are found by intersecting the load rays from
+# the origin with the triangulated grid (ResistanceDomain.check), all combinations
+# against all triangles at once.
+#
+# Sign conventions as in the TA solvers: N [kg] positive in tension, My, Mz [kg·m]
+# with My = sum(sigma dA (z - zG)), Mz = -sum(sigma dA (y - yG)).
+
+DEFAULT_ANGLES = 72
+DEFAULT_STRAIN_STEPS = 24
+# Pairs (combinations x triangles) evaluated per chunk by the ray checker
+_RAY_CHUNK = 2_000_000
+_RAY_TOL = 1e-9
+
+
+def _failure_strain_planes(
+    H: float, Hu: float, concrete_law: ConcreteLawTA, steel_law: SteelLawTA, n_steps: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Strain at the compressed edge and gradient along the depth for all ultimate
+    configurations, ordered from uniform tension to uniform compression."""
+    eps_su, eps_cu, eps_c2 = steel_law.eps_su, concrete_law.eps_cu, concrete_law.eps_c2
+    t = np.linspace(0.0, 1.0, n_steps, endpoint=False)
+    # Regions 1-2: rotation about the deepest bar
+    top_a = eps_su + (-eps_cu - eps_su) * t
+    grad_a = (eps_su - top_a) / Hu
+    # Regions 3-5: rotation about the crushed top fibre
+    eps_hu = eps_su + (-eps_cu * (H - Hu) / H - eps_su) * t
+    grad_b = (eps_hu + eps_cu) / Hu
+    top_b = np.full(n_steps, -eps_cu)
+    # Region 6: rotation about C, last step included (uniform -eps_c2)
+    dd = (eps_cu - eps_c2) / eps_cu * H
+    eps_h = -eps_c2 * np.linspace(0.0, 1.0, n_steps + 1)
+    grad_c = (eps_h + eps_c2) / (H - dd)
+    top_c = -eps_c2 - grad_c * dd
+    return np.concatenate((top_a, top_b, top_c)), np.concatenate((grad_a, grad_b, grad_c))
+
+
+def _allowable_strain_planes(H: float, n_steps: int) -> tuple[np.ndarray, np.ndarray]:
+    """Strain planes up to a positive factor, from uniform tension to uniform
+    compression: (top, bottom) strains on the unit circle between (1, 1) and (-1, -1)."""
+    theta = np.linspace(0.25 * np.pi, 1.25 * np.pi, 3 * n_steps + 1)
+    top, bottom = np.cos(theta), np.sin(theta)
+    return top, (bottom - top) / H
+
+
+@dataclass
+class DomainCheckResult:
+    """Batch check of load combinations against a resistance domain.
+
+    `safety_factor` is the factor that brings each demand onto the boundary along
+    its load ray (>= 1 inside, inf for a null demand); `boundary` holds those
+    boundary points (N [kg], My, Mz [kg·m]).
+    """
+
+    safety_factor: np.ndarray
+    inside: np.ndarray
+    boundary: np.ndarray
+
+    @property
+    def n_failed(self) -> int:
+        return int(np.count_nonzero(~self.inside))
+
+
+@dataclass(frozen=True)
+class ResistanceDomain:
+    """Points of an N-My-Mz resistance surface on an (angle x configuration) grid.
+
+    Along each row (one neutral-axis direction) the configurations go from uniform
+    tension (N = N_max) to uniform compression (N = N_min).
+    """
+
+    angles: np.ndarray
+    N: np.ndarray
+    My: np.ndarray
+    Mz: np.ndarray
+
+    @property
+    def N_max(self) -> float:
+        return float(self.N.max())
+
+    @property
+    def N_min(self) -> float:
+        return float(self.N.min())
+
+    def _meridians(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # N increasing along each meridian (reverse order, guarded against plateaus)
+        N = np.maximum.accumulate(self.N[:, ::-1], axis=1)
+        return N, self.My[:, ::-1], self.Mz[:, ::-1]
+
+    def section_at(self, N) -> tuple[np.ndarray, np.ndarray]:
+        """My-Mz contour(s) of the domain at axial force `N`.
+
+        Scalar N -> two arrays of shape (n_angles,); array N of shape (n,) -> two
+        arrays of shape (n, n_angles).
+        """
+        N_in = np.asarray(N, dtype=float)
+        Nm, Mym, Mzm = self._meridians()
+        flat = np.atleast_1d(N_in).ravel()
+        my = np.empty((flat.size, Nm.shape[0]))
+        mz = np.empty_like(my)
+        for a in range(Nm.shape[0]):
+            my[:, a] = np.interp(flat, Nm[a], Mym[a])
+            mz[:, a] = np.interp(flat, Nm[a], Mzm[a])
+        if N_in.ndim == 0:
+            return my[0], mz[0]
+        return my, mz
+
+    def contains(self, N, My, Mz) -> np.ndarray:
+        """Vectorized membership test for load combinations (N [kg], My, Mz [kg·m])."""
+        N = np.atleast_1d(np.asarray(N, dtype=float))
+        My = np.atleast_1d(np.asarray(My, dtype=float))
+        Mz = np.atleast_1d(np.asarray(Mz, dtype=float))
+        N, My, Mz = np.broadcast_arrays(N, My, Mz)
+        shape = N.shape
+        N, My, Mz = N.ravel(), My.ravel(), Mz.ravel()
+        cy, cz = self.section_at(N)
+        # Crossing-number test of each point against its own contour
+        ny, nz = np.roll(cy, -1, axis=1), np.roll(cz, -1, axis=1)
+        p_y, p_z = My[:, None], Mz[:, None]
+        straddles = (cz > p_z) != (nz > p_z)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            y_cross = cy + (p_z - cz) * (ny - cy) / (nz - cz)
+        crossings = np.count_nonzero(straddles & (p_y < y_cross), axis=1)
+        inside = (crossings % 2 == 1) & (N >= self.N_min) & (N <= self.N_max)
+        return inside.reshape(shape)
+
+    @cached_property
+    def _triangles(self) -> tuple[np.ndarray, ...]:
+        # Points scaled to comparable magnitudes; the quad between configurations c,
+        # c + 1 of meridians a, a + 1 is split in triangles 2 * (a * (n_conf - 1) + c)
+        # and the next one. Degenerate triangles (at the poles) get null vectors.
+        m_max = max(np.abs(self.My).max(), np.abs(self.Mz).max(), 1e-12)
+        scale = np.array([max(np.abs(self.N).max(), 1e-12), m_max, m_max])
+        P = np.stack((self.N, self.My, self.Mz), axis=-1) / scale
+        nxt = np.roll(P, -1, axis=0)
+        p00, p10 = P[:, :-1], nxt[:, :-1]
+        p01, p11 = P[:, 1:], nxt[:, 1:]
+        v0 = np.stack((p00, p00), axis=2).reshape(-1, 3)
+        v1 = np.stack((p10, p11), axis=2).reshape(-1, 3)
+        v2 = np.stack((p11, p01), axis=2).reshape(-1, 3)
+        e1, e2 = v1 - v0, v2 - v0
+        normal = np.cross(e1, e2)
+        normal[np.linalg.norm(normal, axis=1) <= 1e-14] = 0.0
+        # Moller-Trumbore with the ray origin at 0, rewritten as dot products with
+        # per-triangle vectors: a = -D.n, u = D.(e2 x s) / a, v = D.(s x e1) / a,
+        # t = e2.(s x e1) / a with s = -v0
+        s = -v0
+        w = np.cross(e2, s)
+        q = np.cross(s, e1)
+        norms = np.linalg.norm(P, axis=-1, keepdims=True)
+        directions = np.divide(P, norms, out=np.zeros_like(P), where=norms > 0)
+        return scale, -normal, w, q, np.einsum("ij,ij->i", e2, q), directions.reshape(-1, 3)
+
+    @staticmethod
+    def _first_hit(a, u_num, v_num, t_num) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            inv = np.where(a != 0.0, 1.0 / a, 0.0)
+            u, v, t = u_num * inv, v_num * inv, t_num * inv
+        hit = (
+            (inv != 0.0)
+            & (u >= -_RAY_TOL)
+            & (v >= -_RAY_TOL)
+            & (u + v <= 1.0 + _RAY_TOL)
+            & (t > 0.0)
+        )
+        return np.where(hit, t, np.inf).min(axis=-1)
+
+    def check(self, demands) -> DomainCheckResult:
+        """Safety factors of an (n, 3) array of (N [kg], My, Mz [kg·m]) demands
+        along their load rays, with inside/outside flags.
+
+        Each ray is tested first against the triangles around the grid vertex
+        closest to its direction, and against the whole grid only if none is hit.
+        """
+        D = np.atleast_2d(np.asarray(demands, dtype=float))
+        if D.shape[-1] != 3:
+            raise ValueError(f"demands must have shape (n, 3), got {D.shape}")
+        scale, minus_n, w, q, tq, directions = self._triangles
+        n_ang, n_conf = self.N.shape
+        Ds = D / scale
+        factor = np.full(D.shape[0], np.inf)
+
+        # Local search: 2 meridians and 2 configurations on each side of the vertex
+        da, dc = np.meshgrid(np.arange(-2, 2), np.arange(-2, 2), indexing="ij")
+        da, dc = da.ravel(), dc.ravel()
+        step = max(1, _RAY_CHUNK // max(1, directions.shape[0]))
+        for start in range(0, D.shape[0], step):
+            rays = Ds[start : start + step]
+            nearest = np.argmax(rays @ directions.T, axis=1)
+            a0, c0 = np.divmod(nearest, n_conf)
+            quad_a = (a0[:, None] + da) % n_ang
+            quad_c = np.clip(c0[:, None] + dc, 0, n_conf - 2)
+            tri = 2 * (quad_a * (n_conf - 1) + quad_c)
+            tri = np.concatenate((tri, tri + 1), axis=1)
+            r = rays[:, None, :]
+            factor[start : start + step] = self._first_hit(
+                (r * minus_n[tri]).sum(-1),
+                (r * w[tri]).sum(-1),
+                (r * q[tri]).sum(-1),
+                tq[tri],
+            )
+
+        missed = np.flatnonzero(np.isinf(factor) & Ds.any(axis=1))
+        step = max(1, _RAY_CHUNK // max(1, tq.size))
+        for start in range(0, missed.size, step):
+            idx = missed[start : start + step]
+            rays = Ds[idx]
+            factor[idx] = self._first_hit(rays @ minus_n.T, rays @ w.T, rays @ q.T, tq)
+
+        null = ~Ds.any(axis=1)
+        with np.errstate(invalid="ignore"):
+            boundary = np.where(np.isfinite(factor)[:, None], D * factor[:, None], np.nan)
+        boundary[null] = 0.0
+        return DomainCheckResult(safety_factor=factor, inside=factor >= 1.0, boundary=boundary)
+
+
+UltimateDomain = ResistanceDomain
+
+
+def _sweep_domain(section: FiberSection, n_angles: int, configurations) -> ResistanceDomain:
+    """Integrate the strain planes returned by `configurations(H, Hu, depth)` as
+    (sigma_concrete, sigma_bars) arrays for `n_angles` neutral-axis directions."""
+    yc = np.concatenate((section.y, section.bar_y)) - section.y_ref
+    zc = np.concatenate((section.z, section.bar_z)) - section.z_ref
+    vy = section.vertex_y - section.y_ref
+    vz = section.vertex_z - section.z_ref
+    by = section.bar_y - section.y_ref
+    bz = section.bar_z - section.z_ref
+    n_c = section.n_fibers
+    areas = np.concatenate((section.area, section.bar_area))
+
+    angles = np.linspace(0.0, 2.0 * np.pi, n_angles, endpoint=False)
+    rows: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+    for alpha in angles:
+        c, s = np.cos(alpha), np.sin(alpha)
+        # Depth below the compressed edge (CoordinateSezRuotata_e_H_Hu_x23_x34_dd)
+        proj_v = vy * c + vz * s
+        s_min = proj_v.min()
+        H = proj_v.max() - s_min
+        Hu = (by * c + bz * s).max() - s_min if by.size else H
+        Hu = Hu if Hu > 0 else H
+        depth = yc * c + zc * s - s_min
+        sigma_c, sigma_s = configurations(H, Hu, depth[:n_c], depth[n_c:])
+        force = np.concatenate((sigma_c, sigma_s), axis=1) * areas
+        rows.append((force.sum(axis=1), force @ zc / 100.0, -(force @ yc) / 100.0))
+    N, My, Mz = (np.array(v) for v in zip(*rows))
+    return ResistanceDomain(angles=angles, N=N, My=My, Mz=Mz)
+
+
+def build_ultimate_domain(
+    section: FiberSection,
+    concrete_law: ConcreteLawTA,
+    steel_law: SteelLawTA,
+    n_angles: int = DEFAULT_ANGLES,
+    n_strain: int = DEFAULT_STRAIN_STEPS,
+) -> ResistanceDomain:
+    """Sweep the failure strain planes of `n_angles` neutral-axis directions.
+
+    `n_strain` configurations are taken in each of the three pivot groups.
+    """
+
+    def configurations(H, Hu, depth_c, depth_s):
+        top, grad = _failure_strain_planes(H, Hu, concrete_law, steel_law, n_strain)
+        eps_c = top[:, None] + grad[:, None] * depth_c[None, :]
+        eps_s = top[:, None] + grad[:, None] * depth_s[None, :]
+        return concrete_slu_response(eps_c, concrete_law), steel_response(eps_s, steel_law)[0]
+
+    return _sweep_domain(section, n_angles, configurations)
+
+
+def build_allowable_domain(
+    section: FiberSection,
+    Ec: float,
+    n_homog: float,
+    sigma_c_allow: float,
+    sigma_s_allow: float,
+    n_angles: int = DEFAULT_ANGLES,
+    n_strain: int = DEFAULT_STRAIN_STEPS,
+) -> ResistanceDomain:
+    """TA domain: linear no-tension concrete (Ec), bars with n * Ec, each strain
+    plane scaled until |sigma_c| = sigma_c_allow or |sigma_s| = sigma_s_allow."""
+
+    def configurations(H, Hu, depth_c, depth_s):
+        top, grad = _allowable_strain_planes(H, n_strain)
+        sigma_c = Ec * np.minimum(top[:, None] + grad[:, None] * depth_c[None, :], 0.0)
+        sigma_s = n_homog * Ec * (top[:, None] + grad[:, None] * depth_s[None, :])
+        # Peak concrete stress at the compressed edge (depth 0), not at a fiber centroid
+        ratio = Ec * np.maximum(-top, 0.0) / sigma_c_allow if depth_c.size else np.zeros(top.size)
+        if sigma_s.size:
+            ratio = np.maximum(ratio, np.abs(sigma_s).max(axis=1) / sigma_s_allow)
+        # Planes with no stressed material (tension without bars) collapse to 0
+        factor = np.divide(1.0, ratio, out=np.zeros_like(ratio), where=ratio > 0)
+        return sigma_c * factor[:, None], sigma_s * factor[:, None]
+
+    return _sweep_domain(section, n_angles, configurations)
+
+
+@lru_cache(maxsize=64)
+def _cached_domain(
+    key: tuple,
+    concrete: tuple,
+    steel: tuple,
+    n_angles: int,
+    n_strain: int,
+    mesh_size: float | None,
+) -> ResistanceDomain:
+    polygons, bars, n_homog = key
+    geom = SectionGeometry(
+        polygons=[list(ring) for ring in polygons], bars=list(bars), n_homog=n_homog
+    )
+    return build_ultimate_domain(
+        fiber_section_for(geom, mesh_size=mesh_size),
+        ConcreteLawTA(*concrete),
+        SteelLawTA(*steel),
+        n_angles=n_angles,
+        n_strain=n_strain,
+    )
+
+
+def ultimate_domain_for(
+    geom: SectionGeometry,
+    concrete_law: ConcreteLawTA,
+    steel_law: SteelLawTA,
+    n_angles: int = DEFAULT_ANGLES,
+    n_strain: int = DEFAULT_STRAIN_STEPS,
+    mesh_size: float | None = None,
+) -> ResistanceDomain:
+    """Return the (cached) ultimate domain of `geom` with the given materials: the
+    surface is built once per section, reinforcement and material parameters."""
+    return _cached_domain(
+        _geometry_key(geom),
+        astuple(concrete_law),
+        astuple(steel_law),
+        n_angles,
+        n_strain,
+        mesh_size,
+    )
+
+
+@lru_cache(maxsize=64)
+def _cached_allowable_domain(
+    key: tuple,
+    limits: tuple[float, float, float],
+    n_angles: int,
+    n_strain: int,
+    mesh_size: float | None,
+) -> ResistanceDomain:
+    polygons, bars, n_homog = key
+    geom = SectionGeometry(
+        polygons=[list(ring) for ring in polygons], bars=list(bars), n_homog=n_homog
+    )
+    Ec, sigma_c_allow, sigma_s_allow = limits
+    return build_allowable_domain(
+        fiber_section_for(geom, mesh_size=mesh_size),
+        Ec,
+        n_homog,
+        sigma_c_allow,
+        sigma_s_allow,
+        n_angles=n_angles,
+        n_strain=n_strain,
+    )
+
+
+def allowable_domain_for(
+    geom: SectionGeometry,
+    Ec: float,
+    sigma_c_allow: float,
+    sigma_s_allow: float,
+    n_angles: int = DEFAULT_ANGLES,
+    n_strain: int = DEFAULT_STRAIN_STEPS,
+    mesh_size: float | None = None,
+) -> ResistanceDomain:
+    """Return the (cached) TA domain of `geom` (bars homogenized with geom.n_homog)."""
+    return _cached_allowable_domain(
+        _geometry_key(geom),
+        (float(Ec), float(sigma_c_allow), float(sigma_s_allow)),
+        n_angles,
+        n_strain,
+        mesh_size,
+    )
+
+
+def check_domain_batch(domain: ResistanceDomain, demands) -> DomainCheckResult:
+    """Check an (n, 3) array of (N, My, Mz) demands against `domain`."""
+    return domain.check(demands)
@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from .geometry import Point, SectionGeometry, compute_section_properties
+from .materials import ConcreteLawTA, SteelLawTA, concrete_ta_response, steel_response
+
+# Fiber (strip-mesh) solver for the normal-stress problem of CalcoloTensNormali (4.3).
+#
+# The polygons of a SectionGeometry are cut once on a regular grid: every grid cell
+# becomes one fiber with the exact area and centroid of the section part inside the
+# cell (holes are rings with opposite orientation, so their signed areas subtract).
+# Bars are point fibers. The strain plane
+#
+#     eps(y, z) = e0 + k_y * (z - zG) + k_z * (y - yG)
+#
+# is then found by Newton iteration on the 3x3 equilibrium
+#
+#     [sum(sigma dA), sum(sigma (z - zG) dA), sum(sigma (y - yG) dA)] = [Nx, My, -Mz]
+#
+# (same pairing as the Soll vector of the VB routine) with the tangent stiffness of
+# the vectorized constitutive laws. Linear strain fields are integrated exactly on
+# any mesh; the mesh size only affects the cells crossed by the neutral axis.
+
+DEFAULT_DIVISIONS = 40
+
+
+def _clip_axis(poly: list[Point], axis: int, value: float, keep_above: bool) -> list[Point]:
+    """Sutherland-Hodgman clip of a ring against the line coord[axis] = value."""
+    if not poly:
+        return []
+
+    def inside(p: Point) -> bool:
+        return p[axis] >= value if keep_above else p[axis] <= value
+
+    out: list[Point] = []
+    prev = poly[-1]
+    prev_in = inside(prev)
+    for cur in poly:
+        cur_in = inside(cur)
+        if cur_in != prev_in:
+            t = (value - prev[axis]) / (cur[axis] - prev[axis])
+            out.append((prev[0] + t * (cur[0] - prev[0]), prev[1] + t * (cur[1] - prev[1])))
+        if cur_in:
+            out.append(cur)
+        prev, prev_in = cur, cur_in
+    return out
+
+
+def _ring_area_moments(poly: list[Point]) -> tuple[float, float, float]:
+    """Signed area and first moments (integral of y dA, integral of z dA) of a ring."""
+    if len(poly) < 3:
+        return 0.0, 0.0, 0.0
+    a = sy = sz = 0.0
+    for i in range(len(poly)):
+        y0, z0 = poly[i]
+        y1, z1 = poly[(i + 1) % len(poly)]
+        cross = y0 * z1 - y1 * z0
+        a += cross
+        sy += (y0 + y1) * cross
+        sz += (z0 + z1) * cross
+    return 0.5 * a, sy / 6.0, sz / 6.0
+
+
+@lru_cache(maxsize=64)
+def _mesh_polygons(
+    polygons: tuple[tuple[Point, ...], ...], mesh_size: float | None, n_div: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, float]:
+    """Concrete fibers (y, z, area), vertices and mesh size of a set of rings.
+
+    Cached on the polygons alone: sections differing only in their bars (e.g. the
+    candidates of a reinforcement design) share the same concrete mesh.
+    """
+    rings = [list(ring) for ring in polygons if len(ring) >= 3]
+    vertices = [p for ring in rings for p in ring]
+    if vertices:
+        ys = [p[0] for p in vertices]
+        zs = [p[1] for p in vertices]
+        y_min, y_max, z_min, z_max = min(ys), max(ys), min(zs), max(zs)
+    else:
+        y_min = y_max = z_min = z_max = 0.0
+    extent = max(y_max - y_min, z_max - z_min)
+    if mesh_size is None or mesh_size <= 0:
+        mesh_size = extent / max(1, n_div) if extent > 0 else 1.0
+    n_y = max(1, math.ceil((y_max - y_min) / mesh_size))
+    n_z = max(1, math.ceil((z_max - z_min) / mesh_size))
+    y_edges = y_min + mesh_size * np.arange(n_y + 1)
+    z_edges = z_min + mesh_size * np.arange(n_z + 1)
+
+    cell_a = np.zeros((n_z, n_y))
+    cell_sy = np.zeros((n_z, n_y))
+    cell_sz = np.zeros((n_z, n_y))
+    for ring in rings:
+        ring_zs = [p[1] for p in ring]
+        k0 = max(0, int((min(ring_zs) - z_min) // mesh_size))
+        k1 = min(n_z, int((max(ring_zs) - z_min) // mesh_size) + 1)
+        for k in range(k0, k1):
+            strip = _clip_axis(ring, 1, z_edges[k], True)
+            strip = _clip_axis(strip, 1, z_edges[k + 1], False)
+            if len(strip) < 3:
+                continue
+            j0 = max(0, int((min(p[0] for p in strip) - y_min) // mesh_size))
+            j1 = min(n_y, int((max(p[0] for p in strip) - y_min) // mesh_size) + 1)
+            for j in range(j0, j1):
+                cell = _clip_axis(strip, 0, y_edges[j], True)
+                cell = _clip_axis(cell, 0, y_edges[j + 1], False)
+                a, sy, sz = _ring_area_moments(cell)
+                if a:
+                    cell_a[k, j] += a
+                    cell_sy[k, j] += sy
+                    cell_sz[k, j] += sz
+
+    total = float(np.abs(cell_a).sum())
+    keep = np.abs(cell_a) > 1e-12 * max(total, 1.0)
+    area = cell_a[keep]
+    fy = cell_sy[keep] / area
+    fz = cell_sz[keep] / area
+    vertex_y = np.array([p[0] for p in vertices], dtype=float)
+    vertex_z = np.array([p[1] for p in vertices], dtype=float)
+    for arr in (fy, fz, area, vertex_y, vertex_z):
+        arr.flags.writeable = False  # shared between the cached sections
+    return fy, fz, area, vertex_y, vertex_z, float(mesh_size)
+
+
+@dataclass(frozen=True)
+class FiberSection:
+    """Discretized section: concrete fibers and bars as NumPy arrays.
+
+    Units: coordinates [cm], areas [cm^2]. `y_ref`, `z_ref` is the centroid of the
+    homogenized gross section (the point the curvatures refer to).
+    """
+
+    y: np.ndarray
+    z: np.ndarray
+    area: np.ndarray
+    bar_y: np.ndarray
+    bar_z: np.ndarray
+    bar_area: np.ndarray
+    vertex_y: np.ndarray
+    vertex_z: np.ndarray
+    y_ref: float
+    z_ref: float
+    mesh_size: float
+
+    @property
+    def n_fibers(self) -> int:
+        return int(self.area.size)
+
+    @classmethod
+    def from_geometry(
+        cls,
+        geom: SectionGeometry,
+        mesh_size: float | None = None,
+        n_div: int = DEFAULT_DIVISIONS,
+    ) -> FiberSection:
+        """Discretize `geom` on a square grid of side `mesh_size`
+        (default: largest section dimension / `n_div`)."""
+        polygons = tuple(tuple((float(y), float(z)) for y, z in ring) for ring in geom.polygons)
+        fy, fz, area, vertex_y, vertex_z, mesh_size = _mesh_polygons(polygons, mesh_size, n_div)
+
+        bar_y = np.array([b[0] for b in geom.bars], dtype=float)
+        bar_z = np.array([b[1] for b in geom.bars], dtype=float)
+        bar_area = np.array([math.pi * b[2] ** 2 / 4.0 for b in geom.bars], dtype=float)
+
+        props = compute_section_properties(geom)
+        return cls(
+            y=fy,
+            z=fz,
+            area=area,
+            bar_y=bar_y,
+            bar_z=bar_z,
+            bar_area=bar_area,
+            vertex_y=vertex_y,
+            vertex_z=vertex_z,
+            y_ref=props.yG,
+            z_ref=props.zG,
+            mesh_size=mesh_size,
+        )
+
+
+def _geometry_key(geom: SectionGeometry) -> tuple:
+    return (
+        tuple(tuple((float(y), float(z)) for y, z in ring) for ring in geom.polygons),
+        tuple((float(y), float(z), float(d)) for y, z, d in geom.bars),
+        float(geom.n_homog),
+    )
+
+
+@lru_cache(maxsize=256)
+def _cached_fiber_section(key: tuple, mesh_size: float | None, n_div: int) -> FiberSection:
+    polygons, bars, n_homog = key
+    geom = SectionGeometry(
+        polygons=[list(ring) for ring in polygons], bars=list(bars), n_homog=n_homog
+    )
+    return FiberSection.from_geometry(geom, mesh_size=mesh_size, n_div=n_div)
+
+
+def fiber_section_for(
+    geom: SectionGeometry, mesh_size: float | None = None, n_div: int = DEFAULT_DIVISIONS
+) -> FiberSection:
+    """Return the (cached) discretization of `geom`: repeated solves on the same
+    section reuse the fiber arrays."""
+    return _cached_fiber_section(_geometry_key(geom), mesh_size, n_div)
+
+
+@dataclass
+class FiberSolution:
+    """Strain plane and fiber stresses at equilibrium.
+
+    e0 [-], k_y, k_z [1/cm] as in eps = e0 + k_y * (z - zG) + k_z * (y - yG);
+    stresses in [kg/cm^2] (negative = compression).
+    """
+
+    e0: float
+    k_y: float
+    k_z: float
+    sigma_c: np.ndarray
+    sigma_s: np.ndarray
+    eps_s: np.ndarray
+    iterations: int
+    converged: bool
+    residual: float
+
+    @property
+    def strains(self) -> np.ndarray:
+        return np.array([self.e0, self.k_y, self.k_z])
+
+    def strain_at(self, section: FiberSection, y, z) -> np.ndarray:
+        y = np.asarray(y, dtype=float)
+        z = np.asarray(z, dtype=float)
+        return self.e0 + self.k_y * (z - section.z_ref) + self.k_z * (y - section.y_ref)
+
+
+def solve_fiber_section(
+    section: FiberSection,
+    Nx: float,
+    My: float,
+    Mz: float,
+    concrete_law: ConcreteLawTA,
+    steel_law: SteelLawTA,
+    *,
+    allow_concrete_tension: bool = False,
+    x0: np.ndarray | None = None,
+    max_iter: int = 50,
+    tol: float = 1e-9,
+) -> FiberSolution:
+    """Newton solve of the section equilibrium.
+
+    Loads: Nx [kg], My, Mz [kg·cm]. `x0` = (e0, k_y, k_z) warm start (e.g. the
+    solution of a neighbouring load case); the default start is the uncracked
+    homogenized solution.
+    """
+    # Fiber matrix B = [1, z - zG, y - yG] for concrete fibers followed by bars
+    zc = section.z - section.z_ref
+    yc = section.y - section.y_ref
+    zs = section.bar_z - section.z_ref
+    ys = section.bar_y - section.y_ref
+    n_c = section.n_fibers
+    B = np.column_stack(
+        (np.ones(n_c + zs.size), np.concatenate((zc, zs)), np.concatenate((yc, ys)))
+    )
+    areas = np.concatenate((section.area, section.bar_area))
+    target = np.array([Nx, My, -Mz], dtype=float)
+
+    def response(x: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        eps = B @ x
+        sig_c, tan_c = concrete_ta_response(eps[:n_c], concrete_law, allow_concrete_tension)
+        sig_s, tan_s = steel_response(eps[n_c:], steel_law)
+        sigma = np.concatenate((sig_c, sig_s))
+        tangent = np.concatenate((tan_c, tan_s))
+        return sigma, tangent, eps
+
+    def residual(sigma: np.ndarray) -> np.ndarray:
+        return B.T @ (sigma * areas) - target
+
+    # Residual scale: loads, or a 1 kg/cm^2 stress over the section for zero components
+    extent = float(np.abs(B[:, 1:]).max()) if B.size else 1.0
+    a_tot = float(np.abs(areas).sum()) or 1.0
+    scale = np.maximum(np.abs(target), a_tot * np.array([1.0, extent, extent]))
+
+    if x0 is None:
+        if not target.any():
+            x = np.zeros(3)
+        else:
+            # Uncracked start: concrete reacting in tension too, elastic steel
+            w = (
+                np.concatenate((np.full(n_c, concrete_law.Ec), np.full(zs.size, steel_law.Es)))
+                * areas
+            )
+            K0 = (B.T * w) @ B
+            x = np.linalg.lstsq(K0, target, rcond=None)[0]
+    else:
+        x = np.asarray(x0, dtype=float).copy()
+
+    sigma, tangent, eps = response(x)
+    F = residual(sigma)
+    r = float(np.linalg.norm(F / scale))
+    iterations = 0
+    converged = r <= tol
+    while not converged and iterations < max_iter:
+        iterations += 1
+        K = (B.T * (tangent * areas)) @ B
+        try:
+            dx = np.linalg.solve(K, -F)
+        except np.linalg.LinAlgError:
+            dx = np.linalg.lstsq(K, -F, rcond=None)[0]
+        # Backtracking line search on the scaled residual norm
+        t = 1.0
+        while True:
+            x_new = x + t * dx
+            sigma_new, tangent_new, eps_new = response(x_new)
+            F_new = residual(sigma_new)
+            r_new = float(np.linalg.norm(F_new / scale))
+            if r_new < r or t < 1e-4:
+                break
+            t *= 0.5
+        x, sigma, tangent, eps, F, r = x_new, sigma_new, tangent_new, eps_new, F_new, r_new
+        converged = r <= tol
+
+    return FiberSolution(
+        e0=float(x[0]),
+        k_y=float(x[1]),
+        k_z=float(x[2]),
+        sigma_c=sigma[:n_c],
+        sigma_s=sigma[n_c:],
+        eps_s=eps[n_c:],
+        iterations=iterations,
+        converged=converged,
+        residual=r,
+    )
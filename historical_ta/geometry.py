@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from math import pi
 
+import numpy as np
+
 # This module corresponds to VB routines: DatiSezioneCA, CalcoloAreaMomStaticiMomInerziaSezReagente,
 # SezioneParzializzata (support functions) and CoordBaricentriTondini.
 # The functions here are pure and operate on provided data structures (no Excel interaction).
@@ -157,3 +159,136 @@ def compute_section_properties(geom: SectionGeometry) -> SectionProperties:
         Sy=Sy_pr,
         Sz=Sz_pr,
     )
+
+
+# ----------------------------------------------------------------------
+# Exact half-plane clipping of the reacting section (SezioneParzializzata, PuntoP)
+# ----------------------------------------------------------------------
+#
+# The integrals over a polygon are sums of line integrals over its edges (Green), so
+# the part of the section on one side of a line is integrated exactly from:
+#   - the full contribution of every edge lying inside the half-plane (precomputed once),
+#   - the partial contribution of the edges cut by the line,
+#   - the chords along the line. Line integrals along one line are additive, so the
+#     chords contribute sum(C(R -> entry)) - sum(C(R -> exit)) for any point R on the
+#     line, without having to pair exit and entry points (works for non-convex rings).
+
+# Integral order used by the edge arrays: A, Sy = int y dA, Sz = int z dA,
+# Iy = int z^2 dA, Iz = int y^2 dA, Iyz = int y z dA (same conventions as above)
+INTEGRALS = ("A", "Sy", "Sz", "Iy", "Iz", "Iyz")
+
+
+def _edge_integrals(y0, z0, y1, z1) -> np.ndarray:
+    """Green line-integral contributions of the directed segments (y0,z0)->(y1,z1).
+
+    Accepts scalars or arrays; returns an array of shape (..., 6) in `INTEGRALS` order.
+    """
+    y0, z0, y1, z1 = (np.asarray(v, dtype=float) for v in (y0, z0, y1, z1))
+    cross = y0 * z1 - y1 * z0
+    return np.stack(
+        (
+            cross / 2.0,
+            (y0 + y1) * cross / 6.0,
+            (z0 + z1) * cross / 6.0,
+            (z0 * z0 + z0 * z1 + z1 * z1) * cross / 12.0,
+            (y0 * y0 + y0 * y1 + y1 * y1) * cross / 12.0,
+            (y0 * z1 + 2 * y0 * z0 + 2 * y1 * z1 + y1 * z0) * cross / 24.0,
+        ),
+        axis=-1,
+    )
+
+
+@dataclass(frozen=True)
+class PolygonEdges:
+    """Edge data of all section rings, precomputed once and reused by every clip.
+
+    Coordinates are relative to `origin` (e.g. the centroid of the homogenized
+    section), so the integrals returned by `clip_integrals` refer to that point.
+    """
+
+    y0: np.ndarray
+    z0: np.ndarray
+    y1: np.ndarray
+    z1: np.ndarray
+    full: np.ndarray  # (n_edges, 6) contributions of the whole edges
+    origin: Point = (0.0, 0.0)
+
+    @classmethod
+    def from_polygons(cls, polygons: list[list[Point]], origin: Point = (0.0, 0.0)) -> PolygonEdges:
+        y0: list[float] = []
+        z0: list[float] = []
+        y1: list[float] = []
+        z1: list[float] = []
+        oy, oz = origin
+        for ring in polygons:
+            if len(ring) < 3:
+                continue
+            for i, (ya, za) in enumerate(ring):
+                yb, zb = ring[(i + 1) % len(ring)]
+                y0.append(ya - oy)
+                z0.append(za - oz)
+                y1.append(yb - oy)
+                z1.append(zb - oz)
+        arrays = [np.asarray(v, dtype=float) for v in (y0, z0, y1, z1)]
+        return cls(*arrays, full=_edge_integrals(*arrays), origin=(float(oy), float(oz)))
+
+    def integrals(self) -> np.ndarray:
+        """(A, Sy, Sz, Iy, Iz, Iyz) of the whole section."""
+        return self.full.sum(axis=0)
+
+    def clip_integrals(self, a: float, b: float, c: float) -> np.ndarray:
+        """Integrals of the part of the section where a*y + b*z + c <= 0.
+
+        (y, z) are relative to `origin`. A degenerate line (a = b = 0) keeps the whole
+        section if c <= 0 and nothing otherwise.
+        """
+        if a == 0.0 and b == 0.0:
+            return self.integrals() if c <= 0.0 else np.zeros(len(INTEGRALS))
+        s0 = a * self.y0 + b * self.z0 + c
+        s1 = a * self.y1 + b * self.z1 + c
+        in0 = s0 <= 0.0
+        in1 = s1 <= 0.0
+
+        total = self.full[in0 & in1].sum(axis=0)
+
+        cut = in0 != in1
+        if not cut.any():
+            return total
+        t = s0[cut] / (s0[cut] - s1[cut])
+        py = self.y0[cut] + t * (self.y1[cut] - self.y0[cut])
+        pz = self.z0[cut] + t * (self.z1[cut] - self.z0[cut])
+        exits = in0[cut]  # inside -> outside: keep start..P, P is an exit point
+        ya = np.where(exits, self.y0[cut], py)
+        za = np.where(exits, self.z0[cut], pz)
+        yb = np.where(exits, py, self.y1[cut])
+        zb = np.where(exits, pz, self.z1[cut])
+        total = total + _edge_integrals(ya, za, yb, zb).sum(axis=0)
+
+        # Chords along the line, from each exit point to an entry point
+        norm2 = a * a + b * b
+        ry, rz = -a * c / norm2, -b * c / norm2  # foot of the perpendicular from the origin
+        from_r = _edge_integrals(ry, rz, py, pz)
+        total = total + from_r[~exits].sum(axis=0) - from_r[exits].sum(axis=0)
+        return total
+
+
+def clip_polygon_half_plane(poly: list[Point], a: float, b: float, c: float) -> list[Point]:
+    """Port of SezioneParzializzata (linear law): the part of ring `poly` where
+    a*y + b*z + c <= 0, with the zero-stress points (PuntoP) interpolated exactly.
+
+    Non-convex rings split by the line are returned as one ring joined along the line
+    (zero-area bridges), which integrates correctly with the polygon formulas.
+    """
+    n = len(poly)
+    out: list[Point] = []
+    for i in range(n):
+        ya, za = poly[i]
+        yb, zb = poly[(i + 1) % n]
+        sa = a * ya + b * za + c
+        sb = a * yb + b * zb + c
+        if sa <= 0.0:
+            out.append((ya, za))
+        if (sa <= 0.0) != (sb <= 0.0):
+            t = sa / (sa - sb)
+            out.append((ya + t * (yb - ya), za + t * (zb - za)))
+    return out
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
+
 # Mapping to VB: f_Sigc (4.3.3) and f_Sigf (4.3.4)
 # We implement parameterized constitutive laws capturing the same branches used in the VB code.
 
@@ -105,3 +107,61 @@ def sigma_s(eps: float, law: SteelLawTA) -> float:
         return sign * (law.fyd + law.Kincr * law.Es * eps_pl)
     # default plastic plateau
     return sign * law.fyd
+
+
+# Vectorized laws used by the fiber solver (historical_ta.fiber). Each returns the
+# stress array and the tangent modulus array for the Newton Jacobian.
+
+
+def concrete_ta_response(
+    eps: np.ndarray, law: ConcreteLawTA, allow_tension: bool | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """TA concrete: linear elastic (sigma = Ec * eps) in compression, no tension.
+
+    `allow_tension` overrides `law.allow_tension` when given.
+    Returns (sigma [kg/cm^2], tangent [kg/cm^2]).
+    """
+    eps = np.asarray(eps, dtype=float)
+    tension = law.allow_tension if allow_tension is None else allow_tension
+    active = np.ones(eps.shape, dtype=bool) if tension else eps < 0.0
+    tangent = np.where(active, law.Ec, 0.0)
+    return tangent * eps, tangent
+
+
+def concrete_slu_response(eps: np.ndarray, law: ConcreteLawTA) -> np.ndarray:
+    """Vectorized ultimate-state concrete law (VB f_Sigc, unconfined, no tension).
+
+    Parabola-rectangle (`law.parab_rect`) or triangle-rectangle (eps_c3) up to
+    eps_cu, zero stress beyond it. Returns sigma [kg/cm^2] (negative = compression).
+    """
+    eps = np.asarray(eps, dtype=float)
+    comp = np.maximum(-eps, 0.0)
+    if law.parab_rect:
+        ratio = np.minimum(comp / law.eps_c2, 1.0)
+        sigma = -law.fcd * ratio * (2.0 - ratio)
+    else:
+        sigma = -law.fcd * np.minimum(comp / law.eps_c3, 1.0)
+    # Round(Eps, 5) <= Eps_cu in the VB code: crushed fibres beyond eps_cu carry nothing
+    return np.where(comp <= law.eps_cu + 5e-6, sigma, 0.0)
+
+
+def sigma_s_array(eps: np.ndarray, law: SteelLawTA) -> np.ndarray:
+    """Vectorized `sigma_s`."""
+    return steel_response(eps, law)[0]
+
+
+def steel_response(eps: np.ndarray, law: SteelLawTA) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized `sigma_s` with its tangent modulus. Returns (sigma, tangent)."""
+    eps = np.asarray(eps, dtype=float)
+    sign = np.where(eps >= 0.0, 1.0, -1.0)
+    eps_abs = np.abs(eps)
+    elastic = eps_abs <= law.eps_yd
+    if law.bilinear:
+        plastic_sigma = law.fyd + law.Kincr * law.Es * (eps_abs - law.eps_yd)
+        plastic_tangent = law.Kincr * law.Es
+    else:
+        plastic_sigma = np.full(eps.shape, law.fyd)
+        plastic_tangent = 0.0
+    sigma = sign * np.where(elastic, law.Es * eps_abs, plastic_sigma)
+    tangent = np.where(elastic, law.Es, plastic_tangent)
+    return sigma, tangent
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
-from .geometry import SectionGeometry, SectionProperties
-from .materials import ConcreteLawTA, SteelLawTA, sigma_c, sigma_s
+import numpy as np
+
+from .fiber import fiber_section_for, solve_fiber_section
+from .geometry import PolygonEdges, SectionGeometry, SectionProperties
+from .materials import ConcreteLawTA, SteelLawTA, concrete_ta_response, sigma_c, sigma_s
 
 # Mapping: VB CalcoloTensNormali (4.3), PointP (util to find zero-stress point) and SezioneParzializzata.
 
@@ -26,6 +29,9 @@ class StressResult:
     sigma_s_max: float
     sigma_s_array: list[float]
     sigma_vertices: list[float]
+    # Solver diagnostics (set by the fiber method)
+    iterations: int | None = None
+    converged: bool | None = None
 
 
 def _build_MM(props: SectionProperties):
@@ -77,6 +83,8 @@ def compute_normal_stresses_ta(
     allow_concrete_tension: bool = False,
     max_iter: int = 50,
     tol: float = 1e-6,
+    method: str = "vertex",
+    mesh_size: float | None = None,
 ) -> StressResult:
     """Compute normal stresses using TA method (translation of CalcoloTensNormali 4.3).
 
@@ -101,8 +109,43 @@ def compute_normal_stresses_ta(
     - if concrete in tension and !allow_concrete_tension: approximate parzializzazione by excluding tensile
       vertex contributions and recompute iteratively until convergence
 
+    With ``method="exact"`` each iteration clips the polygons exactly at the
+    zero-stress line (`PolygonEdges.clip_integrals`, port of SezioneParzializzata
+    with the linear law): A, S and I of the reacting section are recomputed
+    analytically and the iteration converges in a few steps for any polygon
+    resolution. Bars are homogenized with n (sigma_s = n * Ec * eps).
+
+    With ``method="fiber"`` the section is discretized once on a grid of side
+    `mesh_size` [cm] (see `historical_ta.fiber`) and the cracked equilibrium is
+    solved by Newton iteration instead of the vertex approximation below. The
+    steel law keeps its fyd but takes Es = n * Ec, as for the other methods.
+
     Returns StressResult containing global extrema and per-bar stresses.
     """
+    if method == "fiber":
+        return _compute_normal_stresses_fiber(
+            geom,
+            props,
+            loads,
+            concrete_law,
+            steel_law,
+            allow_concrete_tension=allow_concrete_tension,
+            max_iter=max_iter,
+            mesh_size=mesh_size,
+        )
+    if method == "exact":
+        return _compute_normal_stresses_exact(
+            geom,
+            props,
+            loads,
+            concrete_law,
+            allow_concrete_tension=allow_concrete_tension,
+            max_iter=max_iter,
+            tol=tol,
+        )
+    if method != "vertex":
+        raise ValueError(f"Unknown method: {method!r} (expected 'vertex', 'exact' or 'fiber')")
+
     # initial properties
     section_props = props
 
@@ -302,6 +345,126 @@ def compute_normal_stresses_ta(
     )
 
 
+def _compute_normal_stresses_fiber(
+    geom: SectionGeometry,
+    props: SectionProperties,
+    loads: LoadState,
+    concrete_law: ConcreteLawTA,
+    steel_law: SteelLawTA,
+    *,
+    allow_concrete_tension: bool,
+    max_iter: int,
+    mesh_size: float | None,
+) -> StressResult:
+    section = fiber_section_for(geom, mesh_size=mesh_size)
+    # Bars homogenized with n as in the vertex/exact methods: Es = n * Ec, same fyd
+    Es = geom.n_homog * concrete_law.Ec
+    steel_law = replace(steel_law, Es=Es, eps_yd=steel_law.fyd / Es)
+    sol = solve_fiber_section(
+        section,
+        loads.Nx,
+        loads.My * 100.0,  # [kg·m] -> [kg·cm]
+        loads.Mz * 100.0,
+        concrete_law,
+        steel_law,
+        allow_concrete_tension=allow_concrete_tension,
+        max_iter=max_iter,
+    )
+    # The strain field is linear: concrete extremes are attained at polygon vertices
+    eps_v = sol.strain_at(section, section.vertex_y, section.vertex_z)
+    sigma_v, _ = concrete_ta_response(eps_v, concrete_law, allow_concrete_tension)
+    sigma_vertices = sigma_v.tolist()
+    sigma_bars = sol.sigma_s.tolist()
+
+    sigma_c_max = max(sigma_vertices) if sigma_vertices else 0.0
+    sigma_c_min = min(sigma_vertices) if sigma_vertices else 0.0
+    return StressResult(
+        sigma_c_max=sigma_c_max,
+        sigma_c_min=sigma_c_min,
+        sigma_c_pos=max(0.0, sigma_c_max),
+        sigma_c_neg=min(0.0, sigma_c_min),
+        sigma_c_med=(loads.Nx / props.area_equivalent if props.area_equivalent != 0 else 0.0),
+        sigma_s_max=max(sigma_bars) if sigma_bars else 0.0,
+        sigma_s_array=sigma_bars,
+        sigma_vertices=sigma_vertices,
+        iterations=sol.iterations,
+        converged=sol.converged,
+    )
+
+
+def _compute_normal_stresses_exact(
+    geom: SectionGeometry,
+    props: SectionProperties,
+    loads: LoadState,
+    concrete_law: ConcreteLawTA,
+    *,
+    allow_concrete_tension: bool,
+    max_iter: int,
+    tol: float,
+) -> StressResult:
+    Ec = concrete_law.Ec
+    n = geom.n_homog
+    yG, zG = props.yG, props.zG
+    # Edge data relative to the homogenized centroid, computed once for all iterations
+    edges = PolygonEdges.from_polygons(geom.polygons, origin=(yG, zG))
+    bar_y = np.array([b[0] for b in geom.bars], dtype=float) - yG
+    bar_z = np.array([b[1] for b in geom.bars], dtype=float) - zG
+    bar_area = n * np.array([math.pi * b[2] ** 2 / 4.0 for b in geom.bars], dtype=float)
+    bars = np.array(
+        [
+            bar_area.sum(),
+            (bar_area * bar_y).sum(),
+            (bar_area * bar_z).sum(),
+            (bar_area * bar_z**2).sum(),
+            (bar_area * bar_y**2).sum(),
+            (bar_area * bar_y * bar_z).sum(),
+        ]
+    )
+
+    def stiffness(integrals: np.ndarray) -> np.ndarray:
+        # Rows pair with [Nx, My, -Mz] and columns with (e0, k_y, k_z)
+        A, Sy, Sz, Iy, Iz, Iyz = integrals + bars
+        return np.array([[A, Sz, Sy], [Sz, Iy, Iyz], [Sy, Iyz, Iz]])
+
+    soll = np.array([loads.Nx, loads.My * 100.0, -loads.Mz * 100.0])
+    # 1st iteration: whole section reacting (VB CalcoloTensNormali)
+    eps = np.linalg.solve(stiffness(edges.integrals()), soll) / Ec
+    iterations = 1
+    converged = allow_concrete_tension or not soll.any()
+    while not converged and iterations < max_iter:
+        iterations += 1
+        # Reacting part: e0 + k_y * z + k_z * y <= 0
+        reacting = edges.clip_integrals(eps[2], eps[1], eps[0])
+        try:
+            new_eps = np.linalg.solve(stiffness(reacting), soll) / Ec
+        except np.linalg.LinAlgError:
+            break
+        change = np.linalg.norm(new_eps - eps)
+        eps = new_eps
+        converged = change <= tol * max(np.linalg.norm(eps), 1e-300)
+
+    e0, k_y, k_z = eps
+    eps_v = [e0 + k_y * (z - zG) + k_z * (y - yG) for ring in geom.polygons for y, z in ring]
+    sigma_v, _ = concrete_ta_response(np.asarray(eps_v), concrete_law, allow_concrete_tension)
+    sigma_vertices = sigma_v.tolist()
+    sigma_bars = (n * Ec * (e0 + k_y * bar_z + k_z * bar_y)).tolist()
+
+    sigma_c_max = max(sigma_vertices) if sigma_vertices else 0.0
+    sigma_c_min = min(sigma_vertices) if sigma_vertices else 0.0
+    return StressResult(
+        sigma_c_max=sigma_c_max,
+        sigma_c_min=sigma_c_min,
+        sigma_c_pos=max(0.0, sigma_c_max),
+        sigma_c_neg=min(0.0, sigma_c_min),
+        sigma_c_med=(loads.Nx / props.area_equivalent if props.area_equivalent != 0 else 0.0),
+        sigma_s_max=max(sigma_bars) if sigma_bars else 0.0,
+        sigma_s_array=sigma_bars,
+        sigma_vertices=sigma_vertices,
+        iterations=iterations,
+        converged=converged,
+    )
+
+
 # helper: compute polygon centroid and area and inertias, but return raw sums used earlier
 def _poly_aux(poly):
     from .geometry import _polygon_area_centroid_inertia
@@ -13,6 +13,7 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+from core_models.materials import MaterialValues
 from tools import materials_manager
 
 # Defaults in case event bus is unavailable (e.g., in tests)
@@ -47,6 +48,13 @@ class MaterialsRepository:
     def __init__(self) -> None:
         self._materials: list[dict[str, Any]] = []
         self.path: str | None = None
+        # Indici nome/codice → posizione in `_materials` e viste numeriche;
+        # invalidati da ogni operazione che modifica la lista
+        self._by_name: dict[str, int] | None = None
+        self._by_code: dict[str, int] | None = None
+        self._indexed: list[dict[str, Any]] | None = None
+        # nome → (dizionario da cui è stata estratta la vista, vista)
+        self._values: dict[str, tuple[dict[str, Any], MaterialValues]] = {}
 
     def load_from_jsonm(self, path: str) -> list[dict[str, Any]]:
         if not path.lower().endswith(".jsonm"):
@@ -55,6 +63,7 @@ class MaterialsRepository:
             mats = materials_manager.load_materials(path)
             # store in-memory
             self._materials = [m.copy() for m in mats]
+            self._invalidate_indexes()
             self.path = path
             # notify listeners
             if EventBus is not None:
@@ -91,10 +100,53 @@ class MaterialsRepository:
         return [m.copy() for m in self._materials]
 
     def get_by_name(self, name: str) -> dict[str, Any] | None:
-        for m in self._materials:
-            if m.get("name") == name:
-                return m.copy()
-        return None
+        idx = self._lookup("name", name)
+        return self._materials[idx].copy() if idx is not None else None
+
+    def get_by_code(self, code: str) -> dict[str, Any] | None:
+        idx = self._lookup("code", code) if code else None
+        return self._materials[idx].copy() if idx is not None else None
+
+    def get_values(self, name: str) -> MaterialValues | None:
+        """Vista numerica immutabile (fck/fyk/Ec/Es) del materiale, senza copie del dict.
+
+        La vista memorizzata vale finché il nome risolve allo stesso dizionario:
+        materiali sostituiti (update, lista ricaricata o riassegnata) la ricalcolano.
+        """
+        idx = self._lookup("name", name)
+        if idx is None:
+            self._values.pop(name, None)
+            return None
+        material = self._materials[idx]
+        cached = self._values.get(name)
+        if cached is not None and cached[0] is material:
+            return cached[1]
+        values = MaterialValues.from_material(material)
+        self._values[name] = (material, values)
+        return values
+
+    def _lookup(self, key: str, value: str) -> int | None:
+        if self._indexed is not self._materials:
+            # Lista riassegnata senza passare dal repository (es. GUI)
+            self._invalidate_indexes()
+        if self._by_name is None or self._by_code is None:
+            by_name: dict[str, int] = {}
+            by_code: dict[str, int] = {}
+            for i, m in enumerate(self._materials):
+                # A parità di nome/codice vince il primo, come nella scansione lineare
+                if m.get("name") is not None:
+                    by_name.setdefault(m["name"], i)
+                if m.get("code"):
+                    by_code.setdefault(m["code"], i)
+            self._by_name, self._by_code = by_name, by_code
+            self._indexed = self._materials
+        index = self._by_name if key == "name" else self._by_code
+        return index.get(value)
+
+    def _invalidate_indexes(self) -> None:
+        self._by_name = None
+        self._by_code = None
+        self._values.clear()
 
     def add(self, material: dict[str, Any]) -> None:
         # Check duplicate by name
@@ -108,6 +160,7 @@ class MaterialsRepository:
             # best-effort: ignore errors in derived field computation
             logger.debug("Derived field computation failed: %s", exc)
         self._materials.append(material.copy())
+        self._invalidate_indexes()
         if EventBus is not None:
             try:
                 EventBus().emit(
@@ -127,6 +180,7 @@ class MaterialsRepository:
                 except Exception as exc:  # noqa: B902
                     logger.debug("Derived field computation failed during update: %s", exc)
                 self._materials[i] = new
+                self._invalidate_indexes()
                 if EventBus is not None:
                     try:
                         EventBus().emit(
@@ -146,6 +200,7 @@ class MaterialsRepository:
         # find deleted ids
         deleted = [m for m in self._materials if m.get("name") == name]
         self._materials = new
+        self._invalidate_indexes()
         if EventBus is not None:
             try:
                 for d in deleted:
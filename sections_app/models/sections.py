@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from math import degrees, pi, radians, sqrt
 from uuid import uuid4
 
@@ -242,6 +244,12 @@ class Section:
         logger.debug("Proprietà calcolate per %s: %s", self.section_type, self.properties)
         return self.properties
 
+    def ensure_properties(self) -> SectionProperties | None:
+        """Ritorna le proprietà, calcolandole solo se non ancora disponibili."""
+        if self.properties is None:
+            return self.compute_properties()
+        return self.properties
+
     def _collect_dimensions(self) -> dict[str, float | None]:
         """Raccoglie tutte le dimensioni possibili in un dizionario con chiavi fisse.
 
@@ -1796,3 +1804,101 @@ def create_section_from_dict(data: dict[str, str]) -> Section:
 def _ensure_positive(value: float, label: str) -> None:
     if value <= 0:
         raise ValueError(f"{label} deve essere positivo")
+
+
+# ------------------------------------------------------------------
+# Proprietà persistite (caricamento senza ricalcolo)
+# ------------------------------------------------------------------
+
+# Da incrementare quando cambia il calcolo di `compute_properties`: invalida
+# le proprietà salvate negli archivi, che verranno ricalcolate al caricamento
+PROPERTIES_SCHEMA_VERSION = 1
+PROPERTIES_HASH_KEY = "properties_hash"
+
+# Chiave di `to_dict()` → campo di `SectionProperties`
+_PERSISTED_PROPERTIES = {
+    "area": "area",
+    "A_y": "shear_area_y",
+    "A_z": "shear_area_z",
+    "x_G": "centroid_x",
+    "y_G": "centroid_y",
+    "Ix": "ix",
+    "Iy": "iy",
+    "Ixy": "ixy",
+    "I1": "principal_ix",
+    "I2": "principal_iy",
+    "principal_angle_deg": "principal_angle_deg",
+    "principal_rx": "principal_rx",
+    "principal_ry": "principal_ry",
+    "Qx": "qx",
+    "Qy": "qy",
+    "rx": "rx",
+    "ry": "ry",
+    "core_x": "core_x",
+    "core_y": "core_y",
+    "ellipse_a": "ellipse_a",
+    "ellipse_b": "ellipse_b",
+}
+_HASH_INPUT_KEYS = ["section_type", "rotation_angle_deg", *DIMENSION_KEYS, "kappa_y", "kappa_z"]
+_SCHEMA_SIGNATURE = [
+    PROPERTIES_SCHEMA_VERSION,
+    [f.name for f in fields(SectionProperties)],
+    sorted(DEFAULT_SHEAR_KAPPAS.items()),
+]
+
+
+def properties_hash(data: dict) -> str:
+    """Impronta dei dati da cui dipendono le proprietà (schema + tipo + dimensioni + kappa).
+
+    Se l'impronta salvata in archivio coincide con quella ricalcolata dai dati,
+    le proprietà persistite sono ancora valide.
+    """
+    values = []
+    for key in _HASH_INPUT_KEYS:
+        value = data.get(key)
+        if value is not None and value != "" and key != "section_type":
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                pass
+        values.append(value)
+    payload = json.dumps([_SCHEMA_SIGNATURE, values], default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def properties_from_dict(data: dict) -> SectionProperties | None:
+    """Ricostruisce `SectionProperties` dai valori salvati da `Section.to_dict()`."""
+    if data.get("area") in (None, ""):
+        return None
+    props = SectionProperties()
+    for key, attr in _PERSISTED_PROPERTIES.items():
+        value = data.get(key)
+        if value is not None and value != "":
+            setattr(props, attr, float(value))
+    return props
+
+
+def section_to_persisted_dict(section: Section) -> dict:
+    """`to_dict()` più l'impronta delle proprietà, per gli archivi su file."""
+    data = section.to_dict()
+    if section.properties is not None:
+        data[PROPERTIES_HASH_KEY] = properties_hash(data)
+    return data
+
+
+def section_from_persisted_dict(data: dict, *, lazy: bool = True) -> Section:
+    """Crea la sezione da un record d'archivio.
+
+    Con `lazy=True` le proprietà salvate vengono riusate senza ricalcolo se
+    l'impronta (`properties_hash`) corrisponde ai dati; altrimenti, o con
+    `lazy=False`, viene eseguito `compute_properties()`.
+    """
+    section = create_section_from_dict(data)
+    if lazy and data.get(PROPERTIES_HASH_KEY) == properties_hash(data):
+        props = properties_from_dict(data)
+        if props is not None:
+            section.properties = props
+            section.dimensions = section._collect_dimensions()
+            return section
+    section.compute_properties()
+    return section
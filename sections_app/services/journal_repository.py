@@ -0,0 +1,213 @@
+"""Archivio sezioni con journal append-only (JSON-lines) e snapshot compattato.
+
+Il file principale resta uno snapshot nel formato canonico (lista JSON, leggibile da
+`load_sections_from_json` e dal `SectionRepository` standard). Ogni modifica viene
+aggiunta in coda al journal `<file>.journal` come record JSON su una riga::
+
+    {"op": "add", "id": "...", "section": {...}}
+    {"op": "update", "id": "...", "section": {...}}
+    {"op": "delete", "id": "..."}
+    {"op": "clear"}
+
+Una singola modifica costa quindi un piccolo append invece della riscrittura
+dell'intero archivio. Superata la soglia `compact_every`, il journal viene compattato
+in un nuovo snapshot (file temporaneo + rename atomico) e poi troncato.
+
+Recovery: all'apertura si carica lo snapshot (o il suo backup) e si riapplicano i
+record del journal. I record sono idempotenti (stato finale della sezione, non
+differenze), quindi un crash tra il rename dello snapshot e il troncamento del
+journal non altera l'archivio; un'ultima riga troncata da un crash viene scartata.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+
+from sections_app.models.sections import section_from_persisted_dict, section_to_persisted_dict
+from sections_app.services.repository import GeometryRepository
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_SUFFIX = ".journal"
+
+
+class JournalSectionRepository(GeometryRepository):
+    """`SectionRepository` che registra le modifiche in un journal append-only."""
+
+    def __init__(
+        self,
+        json_file: str | None = None,
+        auto_migrate: bool | None = None,
+        *,
+        autosave_delay: float | None = None,
+        lazy_properties: bool = False,
+        compact_every: int = 1000,
+        fsync: bool = True,
+    ) -> None:
+        """`compact_every`: numero di record nel journal oltre il quale viene scritto
+        un nuovo snapshot. `fsync`: forza su disco ogni append (più lento, più sicuro).
+        """
+        self._compact_every = max(1, int(compact_every))
+        self._fsync = fsync
+        self._pending: list[tuple[str, str | None]] = []
+        self._journal_records = 0
+        super().__init__(
+            json_file,
+            auto_migrate,
+            autosave_delay=autosave_delay,
+            lazy_properties=lazy_properties,
+        )
+
+    @property
+    def journal_path(self) -> Path:
+        return Path(str(self._file_path) + JOURNAL_SUFFIX)
+
+    @property
+    def journal_records(self) -> int:
+        """Numero di record presenti nel journal dall'ultimo snapshot."""
+        return self._journal_records
+
+    def compact(self) -> None:
+        """Scrive un nuovo snapshot completo e svuota il journal."""
+        with self._save_lock:
+            self._cancel_flush_timer()
+            written = self._write_snapshot()
+            # Snapshot fallito: le modifiche restano in sospeso per il prossimo flush
+            if written:
+                self._pending.clear()
+            self._dirty = not written
+
+    # ------------------------------------------------------------------
+    # Persistenza
+    # ------------------------------------------------------------------
+
+    def _persist(self, op: str, section_id: str | None = None) -> None:
+        with self._save_lock:
+            self._pending.append((op, section_id))
+        super()._persist(op, section_id)
+
+    def _write_file(self) -> bool:
+        pending, self._pending = self._pending, []
+        if (
+            not pending  # salvataggio esplicito senza modifiche tracciate
+            or not self._file_path.exists()
+            or self._journal_records + len(pending) > self._compact_every
+        ):
+            return self._write_snapshot()
+        try:
+            self._append_records(pending)
+            return True
+        except Exception:
+            logger.exception("Errore scrittura journal %s, compatto lo snapshot", self.journal_path)
+            return self._write_snapshot()
+
+    def _append_records(self, pending: list[tuple[str, str | None]]) -> None:
+        lines = []
+        for op, section_id in pending:
+            record: dict = {"op": op}
+            if section_id is not None:
+                record["id"] = section_id
+            if op in ("add", "update"):
+                section = self._sections.get(section_id) if section_id else None
+                if section is None:
+                    # Sezione già rimossa: il record di delete successivo basta
+                    continue
+                record["section"] = section_to_persisted_dict(section)
+            lines.append(json.dumps(record, ensure_ascii=False))
+        if not lines:
+            return
+
+        journal = self.journal_path
+        if journal.parent.exists() is False and str(journal.parent) != ".":
+            journal.parent.mkdir(parents=True, exist_ok=True)
+        with journal.open("a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+            f.flush()
+            if self._fsync:
+                os.fsync(f.fileno())
+        self._journal_records += len(lines)
+        logger.debug("Aggiunti %d record al journal %s", len(lines), journal)
+
+    def _write_snapshot(self) -> bool:
+        # Snapshot con backup + file temporaneo + rename atomico (vedi GeometryRepository)
+        if not super()._write_file():
+            # Snapshot non scritto: il journal resta l'unica copia delle modifiche
+            return False
+        try:
+            self.journal_path.unlink(missing_ok=True)
+            self._journal_records = 0
+            logger.debug("Journal compattato in %s", self._file_path)
+        except OSError:
+            logger.exception("Impossibile troncare il journal %s", self.journal_path)
+        return True
+
+    # ------------------------------------------------------------------
+    # Recovery
+    # ------------------------------------------------------------------
+
+    def _finish_load(self) -> None:
+        self._journal_records = 0
+        torn = False
+        journal = self.journal_path
+        if journal.exists():
+            torn = self._replay_journal(journal)
+        super()._finish_load()
+        if torn:
+            # Elimina la coda danneggiata riscrivendo uno snapshot coerente
+            self.compact()
+
+    def _replay_journal(self, journal: Path) -> bool:
+        """Riapplica il journal; ritorna True se è stata trovata una riga danneggiata."""
+        applied = 0
+        with journal.open("r", encoding="utf-8") as f:
+            for lineno, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    self._apply_record(record)
+                except Exception:
+                    logger.warning(
+                        "Record %d del journal %s non valido: replay interrotto", lineno, journal
+                    )
+                    self._journal_records = applied
+                    return True
+                applied += 1
+        self._journal_records = applied
+        if applied:
+            logger.info("Riapplicati %d record dal journal %s", applied, journal)
+        return False
+
+    def _apply_record(self, record: dict) -> None:
+        op = record["op"]
+        if op == "clear":
+            for sid, sec in list(self._sections.items()):
+                if not self._is_seeded(sec):
+                    self._remove_loaded(sid)
+            return
+
+        section_id = record["id"]
+        if op == "delete":
+            self._remove_loaded(section_id)
+            return
+        if op not in ("add", "update"):
+            raise ValueError(f"Operazione journal sconosciuta: {op}")
+
+        section = section_from_persisted_dict(record["section"], lazy=self._lazy_properties)
+        section.id = section_id
+        self._remove_loaded(section_id)
+        self._sections[section_id] = section
+        self._keys[section.logical_key()] = section_id
+        self._index_name(section)
+
+    def _remove_loaded(self, section_id: str) -> None:
+        section = self._sections.pop(section_id, None)
+        if section is None:
+            return
+        key = section.logical_key()
+        if self._keys.get(key) == section_id:
+            del self._keys[key]
+        self._unindex_name(section_id)
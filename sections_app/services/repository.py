@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import atexit
 import csv
 import json
 import logging
 import os
 import random
 import shutil
-from collections.abc import Iterable
+import threading
+import weakref
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 from sections_app.models.sections import (
@@ -24,6 +28,8 @@ from sections_app.models.sections import (
     TSection,
     VSection,
     create_section_from_dict,
+    section_from_persisted_dict,
+    section_to_persisted_dict,
 )
 from sections_app.services.event_bus import (
     SECTIONS_ADDED,
@@ -42,21 +48,64 @@ DEFAULT_JSON_FILE = os.path.abspath(
 )
 
 
+def _flush_at_exit(repo: GeometryRepository) -> None:
+    """Registra il salvataggio delle modifiche in sospeso all'uscita dell'interprete."""
+    ref = weakref.ref(repo)
+
+    def _flush() -> None:
+        target = ref()
+        if target is not None:
+            target.flush()
+
+    atexit.register(_flush)
+
+
 class GeometryRepository:
     """Archivio in memoria delle sezioni con persistenza JSON."""
 
     DEFAULT_JSON_FILE = DEFAULT_JSON_FILE
 
-    def __init__(self, json_file: str | None = None, auto_migrate: bool | None = None) -> None:
+    def __init__(
+        self,
+        json_file: str | None = None,
+        auto_migrate: bool | None = None,
+        *,
+        autosave_delay: float | None = None,
+        lazy_properties: bool = False,
+    ) -> None:
         """Se `json_file` è None → usiamo il file canonico `DEFAULT_JSON_FILE` e
         abilitiamo la migrazione automatica da `sections.json` a `sec_repository/...jsons`
         (a meno che l'env var `RD2229_NO_AUTO_MIGRATE` sia attiva).
 
         Se `json_file` è esplicito (es. 'sections.json') → lo rispettiamo e non
         eseguiamo migrazioni automatiche.
+
+        Con `autosave_delay` (secondi) le modifiche non vengono scritte subito ma
+        raggruppate: il file viene salvato una sola volta dopo `autosave_delay`
+        secondi senza nuove modifiche (oppure con `flush()` / all'uscita).
+
+        Con `lazy_properties=True` il caricamento riusa le proprietà geometriche già
+        salvate nell'archivio invece di ricalcolarle; il ricalcolo avviene solo se i
+        dati della sezione (o la versione del calcolo) non corrispondono più
+        all'impronta salvata (vedi `section_from_persisted_dict`).
         """
         self._sections: dict[str, Section] = {}
         self._keys: dict[tuple, str] = {}
+        # Indici per la ricerca per nome: nome → id (nell'ordine di inserimento),
+        # nome normalizzato (case-insensitive) → id, e id → nome indicizzato
+        self._names: dict[str, list[str]] = {}
+        self._normalized_names: dict[str, list[str]] = {}
+        self._indexed_names: dict[str, str] = {}
+        self._lazy_properties = lazy_properties
+
+        # Stato della persistenza differita (vedi `batch()` e `autosave_delay`)
+        self._autosave_delay = autosave_delay
+        self._batch_depth = 0
+        self._dirty = False
+        self._flush_timer: threading.Timer | None = None
+        self._save_lock = threading.RLock()
+        if autosave_delay:
+            _flush_at_exit(self)
 
         # Decidi se la migrazione automatica è abilitata (default: True)
         if auto_migrate is None:
@@ -172,10 +221,11 @@ class GeometryRepository:
             return False
         self._sections[section.id] = section
         self._keys[key] = section.id
+        self._index_name(section)
         logger.debug("Sezione aggiunta: %s", section.id)
 
-        # Salva in file JSON
-        self.save_to_file()
+        # Salva in file JSON (subito, o differito se in batch/autosave)
+        self._persist("add", section.id)
 
         # Emetti evento
         EventBus().emit(SECTIONS_ADDED, section_id=section.id, section_name=section.name)
@@ -223,10 +273,12 @@ class GeometryRepository:
         updated_section.id = section_id
         self._sections[section_id] = updated_section
         self._keys[new_key] = section_id
+        self._unindex_name(section_id)
+        self._index_name(updated_section)
         logger.debug("Sezione aggiornata: %s", section_id)
 
-        # Salva in file JSON
-        self.save_to_file()
+        # Salva in file JSON (subito, o differito se in batch/autosave)
+        self._persist("update", section_id)
 
         # Emetti evento
         EventBus().emit(SECTIONS_UPDATED, section_id=section_id, section_name=updated_section.name)
@@ -240,10 +292,11 @@ class GeometryRepository:
             return
         if section:
             self._keys.pop(section.logical_key(), None)
+            self._unindex_name(section_id)
             logger.debug("Sezione eliminata: %s", section_id)
 
-            # Salva in file JSON
-            self.save_to_file()
+            # Salva in file JSON (subito, o differito se in batch/autosave)
+            self._persist("delete", section_id)
 
             # Emetti evento
             EventBus().emit(SECTIONS_DELETED, section_id=section_id, section_name=section.name)
@@ -254,6 +307,69 @@ class GeometryRepository:
     def find_by_id(self, section_id: str) -> Section | None:
         return self._sections.get(section_id)
 
+    def find_by_name(self, name: str, *, case_sensitive: bool = True) -> Section | None:
+        """Ritorna la prima sezione registrata con il nome dato (ricerca O(1)).
+
+        Con ``case_sensitive=False`` il confronto avviene sul nome normalizzato
+        (spazi esterni rimossi, maiuscole/minuscole ignorate). Gli indici sono
+        mantenuti da add/update/delete: le sezioni rinominate modificandole
+        direttamente vanno registrate con `update_section`.
+        """
+        if not name:
+            return None
+        section = self._lookup_name(name, case_sensitive)
+        if section is not None and not self._name_matches(section, name, case_sensitive):
+            # Indice non più allineato (sezione rinominata in place): ricostruisci
+            self._rebuild_name_index()
+            section = self._lookup_name(name, case_sensitive)
+        return section
+
+    @staticmethod
+    def _normalize_name(name: str) -> str:
+        return name.strip().casefold()
+
+    def _name_matches(self, section: Section, name: str, case_sensitive: bool) -> bool:
+        current = section.name or ""
+        if case_sensitive:
+            return current == name
+        return self._normalize_name(current) == self._normalize_name(name)
+
+    def _lookup_name(self, name: str, case_sensitive: bool) -> Section | None:
+        if case_sensitive:
+            ids = self._names.get(name)
+        else:
+            ids = self._normalized_names.get(self._normalize_name(name))
+        return self._sections.get(ids[0]) if ids else None
+
+    def _index_name(self, section: Section) -> None:
+        name = getattr(section, "name", None) or ""
+        if not name:
+            return
+        self._indexed_names[section.id] = name
+        self._names.setdefault(name, []).append(section.id)
+        self._normalized_names.setdefault(self._normalize_name(name), []).append(section.id)
+
+    def _unindex_name(self, section_id: str) -> None:
+        name = self._indexed_names.pop(section_id, None)
+        if name is None:
+            return
+        for index, key in (
+            (self._names, name),
+            (self._normalized_names, self._normalize_name(name)),
+        ):
+            ids = index.get(key)
+            if ids and section_id in ids:
+                ids.remove(section_id)
+                if not ids:
+                    del index[key]
+
+    def _rebuild_name_index(self) -> None:
+        self._names.clear()
+        self._normalized_names.clear()
+        self._indexed_names.clear()
+        for section in self._sections.values():
+            self._index_name(section)
+
     def clear(self) -> None:
         seeded = {sid: sec for sid, sec in self._sections.items() if self._is_seeded(sec)}
         self._sections.clear()
@@ -261,13 +377,76 @@ class GeometryRepository:
         for sid, sec in seeded.items():
             self._sections[sid] = sec
             self._keys[sec.logical_key()] = sid
+        self._rebuild_name_index()
 
-        # Salva in file JSON
-        self.save_to_file()
+        # Salva in file JSON (subito, o differito se in batch/autosave)
+        self._persist("clear")
 
         # Emetti evento
         EventBus().emit(SECTIONS_CLEARED)
 
+    @contextmanager
+    def batch(self) -> Iterator[GeometryRepository]:
+        """Raggruppa più modifiche in un'unica scrittura su file.
+
+        Dentro il blocco add/update/delete/clear aggiornano solo la memoria; all'uscita
+        dal blocco più esterno l'archivio viene salvato una sola volta (con le stesse
+        garanzie di `save_to_file`: backup, file temporaneo e rename atomico)::
+
+            with repo.batch():
+                for section in sections:
+                    repo.add_section(section)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self.flush()
+
+    @property
+    def has_pending_changes(self) -> bool:
+        """True se ci sono modifiche non ancora scritte su file."""
+        return self._dirty
+
+    def flush(self) -> None:
+        """Scrive subito le modifiche in sospeso (no-op se l'archivio è già salvato)."""
+        with self._save_lock:
+            if self._dirty:
+                self.save_to_file()
+
+    def _persist(self, op: str, section_id: str | None = None) -> None:
+        """Rende persistente una modifica (`op` = add/update/delete/clear).
+
+        `op` e `section_id` descrivono la modifica: il backend JSON riscrive comunque
+        l'intero archivio, i backend incrementali (es. journal) li usano per
+        registrare solo la variazione.
+        """
+        if self._batch_depth > 0:
+            self._dirty = True
+            return
+        if self._autosave_delay:
+            self._dirty = True
+            self._schedule_flush()
+            return
+        self.save_to_file()
+
+    def _schedule_flush(self) -> None:
+        """Debounce: ogni modifica rimanda il salvataggio di `autosave_delay` secondi."""
+        with self._save_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            timer = threading.Timer(self._autosave_delay or 0.0, self.flush)
+            timer.daemon = True
+            self._flush_timer = timer
+            timer.start()
+
+    def _cancel_flush_timer(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
     def _is_seeded(self, section: Section) -> bool:
         return bool(section.note) and SEED_TAG in section.note
 
@@ -278,19 +457,21 @@ class GeometryRepository:
         for sec in self._sections.values():
             sections_by_type.setdefault(sec.section_type, []).append(sec)
 
-        for section_type, factory in self._seed_factories().items():
-            existing = [s for s in sections_by_type.get(section_type, []) if self._is_seeded(s)]
-            for idx in range(len(existing), 3):
-                try:
-                    new_sec = factory(idx + 1, rng)
-                    added = self.add_section(new_sec)
-                    if added:
-                        logger.debug("Sezione seed aggiunta: %s (%s)", new_sec.id, section_type)
-                except Exception:
-                    logger.exception("Errore creazione sezione seed per %s", section_type)
+        # Le sezioni seed mancanti vengono salvate con un'unica scrittura
+        with self.batch():
+            for section_type, factory in self._seed_factories().items():
+                existing = [s for s in sections_by_type.get(section_type, []) if self._is_seeded(s)]
+                for idx in range(len(existing), 3):
+                    try:
+                        new_sec = factory(idx + 1, rng)
+                        added = self.add_section(new_sec)
+                        if added:
+                            logger.debug("Sezione seed aggiunta: %s (%s)", new_sec.id, section_type)
+                    except Exception:
+                        logger.exception("Errore creazione sezione seed per %s", section_type)
 
         for sec in self._sections.values():
-            if self._is_seeded(sec):
+            if self._is_seeded(sec) and not (self._lazy_properties and sec.properties):
                 try:
                     sec.compute_properties()
                 except Exception:
@@ -466,6 +647,7 @@ class GeometryRepository:
         """
         self._sections.clear()
         self._keys.clear()
+        self._rebuild_name_index()
 
         def _load(path: Path) -> list:
             """Helper per caricare dati da un file JSON."""
@@ -484,8 +666,7 @@ class GeometryRepository:
             # Carica le sezioni
             for idx, item in enumerate(raw_data):
                 try:
-                    section = create_section_from_dict(item)
-                    section.compute_properties()
+                    section = section_from_persisted_dict(item, lazy=self._lazy_properties)
 
                     # Ripristina l'ID originale dal JSON
                     if "id" in item and item["id"]:
@@ -494,12 +675,13 @@ class GeometryRepository:
                     self._sections[section.id] = section
                     key = section.logical_key()
                     self._keys[key] = section.id
+                    self._index_name(section)
                     logger.debug("Sezione caricata: %s (%s)", section.id, section.name)
                 except Exception as e:
                     logger.exception("Errore caricamento sezione %d dal JSON: %s", idx, e)
 
             logger.info("Caricate %d sezioni da %s", len(self._sections), self._file_path)
-            self._ensure_seed_sections()
+            self._finish_load()
             return
         except Exception:
             logger.exception("Errore nel caricamento di %s, provo il backup", self._file_path)
@@ -514,8 +696,7 @@ class GeometryRepository:
             # Carica le sezioni dal backup
             for idx, item in enumerate(raw_data):
                 try:
-                    section = create_section_from_dict(item)
-                    section.compute_properties()
+                    section = section_from_persisted_dict(item, lazy=self._lazy_properties)
 
                     # Ripristina l'ID originale dal JSON
                     if "id" in item and item["id"]:
@@ -524,6 +705,7 @@ class GeometryRepository:
                     self._sections[section.id] = section
                     key = section.logical_key()
                     self._keys[key] = section.id
+                    self._index_name(section)
                     logger.debug("Sezione caricata da backup: %s (%s)", section.id, section.name)
                 except Exception as e:
                     logger.exception("Errore caricamento sezione %d dal backup: %s", idx, e)
@@ -533,7 +715,7 @@ class GeometryRepository:
                 len(self._sections),
                 self._backup_path,
             )
-            self._ensure_seed_sections()
+            self._finish_load()
             return
         except Exception:
             logger.exception("Errore anche nel caricamento del backup %s", self._backup_path)
@@ -546,6 +728,11 @@ class GeometryRepository:
         )
         self._sections.clear()
         self._keys.clear()
+        self._rebuild_name_index()
+        self._finish_load()
+
+    def _finish_load(self) -> None:
+        """Completa il caricamento (sezioni seed); ridefinito dai backend incrementali."""
         self._ensure_seed_sections()
 
     def save_to_file(self) -> None:
@@ -556,10 +743,17 @@ class GeometryRepository:
         2. Scrive su file temporaneo (.json.tmp)
         3. Rename atomico del file temporaneo sul file principale
         """
+        with self._save_lock:
+            self._cancel_flush_timer()
+            # Un salvataggio fallito resta in sospeso e viene ritentato al prossimo flush
+            self._dirty = not self._write_file()
+
+    def _write_file(self) -> bool:
+        """Scrive l'archivio completo; ritorna False se il salvataggio è fallito."""
         try:
             data = []
-            for section in self._sections.values():
-                section_dict = section.to_dict()
+            for section in list(self._sections.values()):
+                section_dict = section_to_persisted_dict(section)
                 data.append(section_dict)
 
             # Crea la directory se non esiste
@@ -588,6 +782,7 @@ class GeometryRepository:
                     self._file_path,
                     self._backup_path,
                 )
+                return True
             except Exception:
                 logger.exception("Errore nel salvataggio del file sezioni")
                 # Elimina file temporaneo se esiste
@@ -596,6 +791,7 @@ class GeometryRepository:
                 raise
         except Exception as e:
             logger.exception("Errore salvataggio file JSON %s: %s", self._json_file, e)
+        return False
 
     def export_backup(self, destination: Path | str) -> None:
         """Esporta l'archivio sezioni nel percorso indicato.
@@ -794,28 +990,31 @@ def save_sections_to_json(sections: list[dict], json_file: str = DEFAULT_JSON_FI
     try:
         # Crea repository e svuota l'archivio
         repo = SectionRepository(json_file)
-        repo.clear()
 
-        # Aggiunge tutte le sezioni dalla lista
-        added_count = 0
-        for section_data in sections:
-            try:
-                # Crea oggetto Section dal dizionario
-                section = create_section_from_dict(section_data)
-                # Calcola proprietà e valida
-                section.compute_properties()
-                # Preserva l'ID se presente nel dizionario originale
-                if "id" in section_data and section_data["id"]:
-                    section.id = section_data["id"]
-                # Aggiunge al repository (che salva automaticamente)
-                if repo.add_section(section):
-                    added_count += 1
-            except Exception as e:
-                logger.warning(
-                    "Sezione non valida saltata durante salvataggio: %s - Errore: %s",
-                    section_data.get("name", "sconosciuta"),
-                    e,
-                )
+        # Svuota l'archivio e aggiunge le sezioni con un'unica scrittura su file
+        with repo.batch():
+            repo.clear()
+
+            # Aggiunge tutte le sezioni dalla lista
+            added_count = 0
+            for section_data in sections:
+                try:
+                    # Crea oggetto Section dal dizionario
+                    section = create_section_from_dict(section_data)
+                    # Calcola proprietà e valida
+                    section.compute_properties()
+                    # Preserva l'ID se presente nel dizionario originale
+                    if "id" in section_data and section_data["id"]:
+                        section.id = section_data["id"]
+                    # Aggiunge al repository (salvato all'uscita dal batch)
+                    if repo.add_section(section):
+                        added_count += 1
+                except Exception as e:
+                    logger.warning(
+                        "Sezione non valida saltata durante salvataggio: %s - Errore: %s",
+                        section_data.get("name", "sconosciuta"),
+                        e,
+                    )
 
         logger.info("Salvate %d sezioni su %d in %s", added_count, len(sections), json_file)
 
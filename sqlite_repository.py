@@ -0,0 +1,636 @@
+"""Backend SQLite (stdlib `sqlite3`) per sezioni, materiali ed elementi di verifica.
+
+Alternativa opzionale agli archivi JSON (`sec_repository.jsons`, `materials.json`,
+`verification_items.json`): un unico file locale con una tabella per archivio,
+colonne indicizzate per id/nome/codice/tipo sezione e modalità WAL.
+
+Le classi espongono le stesse API dei repository JSON:
+
+- `SqliteSectionRepository`       ↔ `sections_app.services.repository.SectionRepository`
+- `SqliteMaterialRepository`      ↔ `core_models.materials.MaterialRepository`
+- `SqliteVerificationItemsRepository` ↔ `verification_items_repository.VerificationItemsRepository`
+
+A differenza dei repository JSON nulla viene caricato all'apertura: le righe sono
+lette (e convertite in oggetti) solo quando richieste, e ogni modifica tocca una
+sola riga. Gli archivi JSON esistenti si importano con `import_json` (inserimento
+in blocco in un'unica transazione).
+
+Uso::
+
+    store = SqliteStore("rd2229.sqlite")
+    sections = SqliteSectionRepository(store)
+    sections.import_json("sec_repository/sec_repository.jsons")
+    sec = sections.find_by_name("Trave 30x50")
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from core_models.materials import HistoricalMaterial, Material, MaterialRepository, MaterialValues
+from sections_app.models.sections import (
+    Section,
+    section_from_persisted_dict,
+    section_to_persisted_dict,
+)
+from sections_app.services.event_bus import (
+    MATERIALS_ADDED,
+    MATERIALS_CLEARED,
+    MATERIALS_DELETED,
+    MATERIALS_UPDATED,
+    SECTIONS_ADDED,
+    SECTIONS_CLEARED,
+    SECTIONS_DELETED,
+    SECTIONS_UPDATED,
+    EventBus,
+)
+from sections_app.services.repository import SEED_TAG, CsvSectionSerializer
+from verification_items import VerificationItem
+from verification_items_repository import item_from_dict, item_to_dict
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_FILE = "rd2229.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sections (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL DEFAULT '',
+    name_key TEXT NOT NULL DEFAULT '',
+    section_type TEXT NOT NULL DEFAULT '',
+    logical_key TEXT NOT NULL UNIQUE,
+    seeded INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sections_name ON sections(name);
+CREATE INDEX IF NOT EXISTS idx_sections_name_key ON sections(name_key);
+CREATE INDEX IF NOT EXISTS idx_sections_type ON sections(section_type);
+
+CREATE TABLE IF NOT EXISTS materials (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL DEFAULT '',
+    code TEXT NOT NULL DEFAULT '',
+    type TEXT NOT NULL DEFAULT '',
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_materials_name ON materials(name);
+CREATE INDEX IF NOT EXISTS idx_materials_code ON materials(code);
+
+CREATE TABLE IF NOT EXISTS verification_items (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL DEFAULT '',
+    item_group TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_verification_items_name ON verification_items(name);
+"""
+
+
+def _load_json_list(path: str | Path) -> list:
+    with Path(path).open("r", encoding="utf-8") as f:
+        raw = json.load(f)
+    if not isinstance(raw, list):
+        raise ValueError(f"File JSON {path} non contiene una lista")
+    return raw
+
+
+class SqliteStore:
+    """Connessione condivisa al database SQLite (WAL, schema creato all'apertura).
+
+    `path=":memory:"` crea un database in memoria (utile nei test).
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_DB_FILE) -> None:
+        self.path = str(path)
+        if self.path != ":memory:":
+            parent = Path(self.path).parent
+            if not parent.exists():
+                parent.mkdir(parents=True, exist_ok=True)
+        # Accesso serializzato dal lock: la connessione può essere usata da più thread
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.RLock()
+        self._tx_depth = 0
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def execute(self, sql: str, params: Iterable[Any] = ()) -> list[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, tuple(params)).fetchall()
+
+    def executemany(self, sql: str, rows: Iterable[Iterable[Any]]) -> None:
+        with self.transaction():
+            self._conn.executemany(sql, rows)
+
+    @contextmanager
+    def transaction(self) -> Iterator[SqliteStore]:
+        """Transazione (annidabile): commit all'uscita del blocco più esterno,
+        rollback in caso di eccezione."""
+        with self._lock:
+            outer = self._tx_depth == 0
+            if outer:
+                self._conn.execute("BEGIN")
+            self._tx_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._tx_depth -= 1
+                if outer:
+                    self._conn.execute("ROLLBACK")
+                raise
+            self._tx_depth -= 1
+            if outer:
+                self._conn.execute("COMMIT")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _store(store: SqliteStore | str | Path | None) -> SqliteStore:
+    if isinstance(store, SqliteStore):
+        return store
+    return SqliteStore(store if store is not None else DEFAULT_DB_FILE)
+
+
+# ----------------------------------------------------------------------
+# Sezioni
+# ----------------------------------------------------------------------
+
+
+class SqliteSectionRepository:
+    """Archivio sezioni su SQLite con la stessa API di `SectionRepository`.
+
+    Le sezioni lette dal database sono tenute in una cache per id, così gli oggetti
+    restituiti restano stabili tra chiamate successive.
+    """
+
+    def __init__(self, store: SqliteStore | str | Path | None = None) -> None:
+        self._store = _store(store)
+        self._cache: dict[str, Section] = {}
+
+    @staticmethod
+    def _normalize_name(name: str) -> str:
+        return name.strip().casefold()
+
+    @staticmethod
+    def _is_seeded(section: Section) -> bool:
+        return bool(section.note) and SEED_TAG in section.note
+
+    def _row_values(self, section: Section) -> tuple:
+        name = section.name or ""
+        return (
+            section.id,
+            name,
+            self._normalize_name(name),
+            section.section_type,
+            json.dumps(section.logical_key()),
+            int(self._is_seeded(section)),
+            json.dumps(section_to_persisted_dict(section), ensure_ascii=False),
+        )
+
+    def _from_row(self, section_id: str, data: str) -> Section:
+        section = self._cache.get(section_id)
+        if section is None:
+            # Proprietà salvate riusate se ancora valide (vedi `section_from_persisted_dict`)
+            section = section_from_persisted_dict(json.loads(data))
+            section.id = section_id
+            self._cache[section_id] = section
+        return section
+
+    def _select(self, where: str = "", params: Iterable[Any] = ()) -> list[Section]:
+        sections = []
+        for section_id, data in self._store.execute(
+            f"SELECT id, data FROM sections {where} ORDER BY rowid", params
+        ):
+            try:
+                sections.append(self._from_row(section_id, data))
+            except Exception:
+                logger.exception("Errore caricamento sezione %s dal database", section_id)
+        return sections
+
+    def add_section(self, section: Section) -> bool:
+        """Aggiunge una sezione se non duplicata. Ritorna True se aggiunta."""
+        try:
+            section.compute_properties()
+        except Exception as e:
+            logger.exception("Calcolo proprietà fallito: %s", e)
+            return False
+        try:
+            self._store.execute(
+                "INSERT INTO sections (id, name, name_key, section_type, logical_key, seeded, data)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                self._row_values(section),
+            )
+        except sqlite3.IntegrityError:
+            logger.debug("Sezione duplicata ignorata: %s", section.logical_key())
+            return False
+        self._cache[section.id] = section
+        logger.debug("Sezione aggiunta: %s", section.id)
+        EventBus().emit(SECTIONS_ADDED, section_id=section.id, section_name=section.name)
+        return True
+
+    def update_section(self, section_id: str, updated_section: Section) -> None:
+        """Aggiorna una sezione esistente (KeyError se assente, ValueError se duplicata)."""
+        if not self._store.execute("SELECT 1 FROM sections WHERE id = ?", (section_id,)):
+            logger.warning("Attempted update on non-existing section: %s", section_id)
+            raise KeyError(f"Sezione non trovata: {section_id}")
+        updated_section.compute_properties()
+        updated_section.id = section_id
+        values = self._row_values(updated_section)
+        try:
+            self._store.execute(
+                "UPDATE sections SET name = ?, name_key = ?, section_type = ?, logical_key = ?,"
+                " seeded = ?, data = ? WHERE id = ?",
+                (*values[1:], section_id),
+            )
+        except sqlite3.IntegrityError as exc:
+            raise ValueError(
+                "Aggiornamento invalido: crea duplicato di una sezione esistente"
+            ) from exc
+        self._cache[section_id] = updated_section
+        logger.debug("Sezione aggiornata: %s", section_id)
+        EventBus().emit(SECTIONS_UPDATED, section_id=section_id, section_name=updated_section.name)
+
+    def delete_section(self, section_id: str) -> None:
+        rows = self._store.execute("SELECT name, seeded FROM sections WHERE id = ?", (section_id,))
+        if not rows:
+            return
+        name, seeded = rows[0]
+        if seeded:
+            logger.debug("Sezione seed protetta da eliminazione: %s", section_id)
+            return
+        self._store.execute("DELETE FROM sections WHERE id = ?", (section_id,))
+        self._cache.pop(section_id, None)
+        logger.debug("Sezione eliminata: %s", section_id)
+        EventBus().emit(SECTIONS_DELETED, section_id=section_id, section_name=name)
+
+    def clear(self) -> None:
+        self._store.execute("DELETE FROM sections WHERE seeded = 0")
+        self._cache = {sid: sec for sid, sec in self._cache.items() if self._is_seeded(sec)}
+        EventBus().emit(SECTIONS_CLEARED)
+
+    def get_all_sections(self) -> list[Section]:
+        return self._select()
+
+    def find_by_id(self, section_id: str) -> Section | None:
+        cached = self._cache.get(section_id)
+        if cached is not None:
+            return cached
+        found = self._select("WHERE id = ?", (section_id,))
+        return found[0] if found else None
+
+    def find_by_name(self, name: str, *, case_sensitive: bool = True) -> Section | None:
+        if not name:
+            return None
+        if case_sensitive:
+            rows = self._store.execute(
+                "SELECT id FROM sections WHERE name = ? ORDER BY rowid LIMIT 1", (name,)
+            )
+        else:
+            rows = self._store.execute(
+                "SELECT id FROM sections WHERE name_key = ? ORDER BY rowid LIMIT 1",
+                (self._normalize_name(name),),
+            )
+        return self.find_by_id(rows[0][0]) if rows else None
+
+    def find_by_type(self, section_type: str) -> list[Section]:
+        return self._select("WHERE section_type = ?", (section_type,))
+
+    def list_headers(self) -> list[tuple[str, str, str]]:
+        """(id, nome, tipo) di tutte le sezioni senza ricostruire gli oggetti."""
+        return [
+            (sid, name, stype)
+            for sid, name, stype in self._store.execute(
+                "SELECT id, name, section_type FROM sections ORDER BY rowid"
+            )
+        ]
+
+    def count(self) -> int:
+        return int(self._store.execute("SELECT COUNT(*) FROM sections")[0][0])
+
+    @contextmanager
+    def batch(self) -> Iterator[SqliteSectionRepository]:
+        """Esegue più modifiche in un'unica transazione."""
+        with self._store.transaction():
+            yield self
+
+    def import_json(self, json_file: str | Path) -> int:
+        """Importa in blocco un archivio JSON di sezioni; ritorna le sezioni inserite.
+
+        Le sezioni già presenti (stesso id o stessa chiave logica) vengono saltate.
+        """
+        rows = []
+        for idx, item in enumerate(_load_json_list(json_file)):
+            try:
+                section = section_from_persisted_dict(item)
+                if item.get("id"):
+                    section.id = item["id"]
+                rows.append(self._row_values(section))
+            except Exception as e:
+                logger.exception("Errore import sezione %d da %s: %s", idx, json_file, e)
+        before = self.count()
+        self._store.executemany(
+            "INSERT OR IGNORE INTO sections"
+            " (id, name, name_key, section_type, logical_key, seeded, data)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        added = self.count() - before
+        logger.info("Importate %d sezioni su %d da %s", added, len(rows), json_file)
+        return added
+
+    def load_from_file(self) -> None:
+        """Scarta la cache: le sezioni verranno rilette dal database."""
+        self._cache.clear()
+
+    def save_to_file(self) -> None:
+        """No-op: ogni modifica è già registrata nel database."""
+
+    def flush(self) -> None:
+        """No-op: ogni modifica è già registrata nel database."""
+
+    def export_backup(self, destination: Path | str) -> None:
+        """Esporta l'archivio in JSON (.json/.jsons) o CSV (.csv)."""
+        dest_path = Path(destination)
+        suffix = dest_path.suffix.lower()
+        if suffix not in (".json", ".jsons", ".csv"):
+            dest_path = dest_path.with_suffix(".jsons")
+            suffix = ".jsons"
+        if not dest_path.parent.exists():
+            dest_path.parent.mkdir(parents=True, exist_ok=True)
+        sections = self.get_all_sections()
+        if suffix == ".csv":
+            CsvSectionSerializer().export_to_csv(str(dest_path), sections)
+        else:
+            with dest_path.open("w", encoding="utf-8") as f:
+                json.dump([s.to_dict() for s in sections], f, indent=2, ensure_ascii=False)
+        logger.info("Esportate %d sezioni in %s", len(sections), dest_path)
+
+
+# ----------------------------------------------------------------------
+# Materiali
+# ----------------------------------------------------------------------
+
+
+class SqliteMaterialRepository:
+    """Archivio materiali su SQLite con la stessa API di `MaterialRepository`."""
+
+    # Conversione HistoricalMaterial → Material identica al repository JSON
+    import_historical_material = MaterialRepository.import_historical_material
+
+    def __init__(self, store: SqliteStore | str | Path | None = None) -> None:
+        self._store = _store(store)
+        self._cache: dict[str, Material] = {}
+        self._values: dict[str, MaterialValues] = {}
+
+    @staticmethod
+    def _row_values(mat: Material) -> tuple:
+        return (
+            mat.id,
+            mat.name or "",
+            mat.code or "",
+            mat.type or "",
+            json.dumps(mat.to_dict(), ensure_ascii=False),
+        )
+
+    def _select(self, where: str = "", params: Iterable[Any] = ()) -> list[Material]:
+        materials = []
+        for material_id, data in self._store.execute(
+            f"SELECT id, data FROM materials {where} ORDER BY rowid", params
+        ):
+            material = self._cache.get(material_id)
+            if material is None:
+                try:
+                    material = Material.from_dict(json.loads(data))
+                except Exception:
+                    logger.exception("Errore caricamento materiale %s dal database", material_id)
+                    continue
+                self._cache[material_id] = material
+            materials.append(material)
+        return materials
+
+    def _changed(self) -> None:
+        self._values.clear()
+
+    def add(self, mat: Material) -> None:
+        self._store.execute(
+            "INSERT OR REPLACE INTO materials (id, name, code, type, data) VALUES (?, ?, ?, ?, ?)",
+            self._row_values(mat),
+        )
+        self._cache[mat.id] = mat
+        self._changed()
+        logger.debug("Materiale aggiunto: %s (%s)", mat.id, mat.name)
+        EventBus().emit(MATERIALS_ADDED, material_id=mat.id, material_name=mat.name)
+
+    def get_all(self) -> list[Material]:
+        return self._select()
+
+    def find_by_id(self, material_id: str) -> Material | None:
+        cached = self._cache.get(material_id)
+        if cached is not None:
+            return cached
+        found = self._select("WHERE id = ?", (material_id,))
+        return found[0] if found else None
+
+    def find_by_name(self, name: str) -> Material | None:
+        found = self._select("WHERE name = ?", (name,))
+        return found[0] if found else None
+
+    def find_by_code(self, code: str) -> Material | None:
+        if not code:
+            return None
+        found = self._select("WHERE code = ?", (code,))
+        return found[0] if found else None
+
+    def get_values(self, name: str) -> MaterialValues | None:
+        """Vista numerica (fck/fyk/Ec/Es) del materiale con il nome dato, memorizzata."""
+        values = self._values.get(name)
+        if values is None:
+            material = self.find_by_name(name)
+            if material is None:
+                return None
+            values = MaterialValues.from_material(material)
+            self._values[name] = values
+        return values
+
+    def update(self, material_id: str, updated_material: Material) -> None:
+        if not self._store.execute("SELECT 1 FROM materials WHERE id = ?", (material_id,)):
+            logger.warning("Tentativo aggiornamento materiale non trovato: %s", material_id)
+            raise KeyError(f"Materiale non trovato: {material_id}")
+        updated_material.id = material_id
+        self._store.execute(
+            "UPDATE materials SET name = ?, code = ?, type = ?, data = ? WHERE id = ?",
+            (*self._row_values(updated_material)[1:], material_id),
+        )
+        self._cache[material_id] = updated_material
+        self._changed()
+        logger.debug("Materiale aggiornato: %s (%s)", material_id, updated_material.name)
+        EventBus().emit(
+            MATERIALS_UPDATED, material_id=material_id, material_name=updated_material.name
+        )
+
+    def delete(self, material_id: str) -> None:
+        rows = self._store.execute("SELECT name FROM materials WHERE id = ?", (material_id,))
+        if not rows:
+            return
+        self._store.execute("DELETE FROM materials WHERE id = ?", (material_id,))
+        self._cache.pop(material_id, None)
+        self._changed()
+        logger.debug("Materiale eliminato: %s (%s)", material_id, rows[0][0])
+        EventBus().emit(MATERIALS_DELETED, material_id=material_id, material_name=rows[0][0])
+
+    def clear(self) -> None:
+        self._store.execute("DELETE FROM materials")
+        self._cache.clear()
+        self._changed()
+        EventBus().emit(MATERIALS_CLEARED)
+
+    def import_json(self, json_file: str | Path) -> int:
+        """Importa in blocco un archivio JSON di materiali (sostituisce gli id già presenti)."""
+        rows = []
+        for idx, item in enumerate(_load_json_list(json_file)):
+            try:
+                rows.append(self._row_values(Material.from_dict(item)))
+            except Exception as e:
+                logger.exception("Errore import materiale %d da %s: %s", idx, json_file, e)
+        self._store.executemany(
+            "INSERT OR REPLACE INTO materials (id, name, code, type, data) VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+        self._cache.clear()
+        self._changed()
+        logger.info("Importati %d materiali da %s", len(rows), json_file)
+        return len(rows)
+
+    def import_historical_library(self, materials: Iterable[HistoricalMaterial]) -> int:
+        """Converte e inserisce in blocco i materiali di una libreria storica.
+
+        I materiali con lo stesso `code` di uno già presente lo aggiornano (ne
+        riprendono l'id): reimportare la libreria non duplica le righe.
+        """
+        ids_by_code = dict(
+            self._store.execute(
+                "SELECT code, id FROM materials WHERE code != '' ORDER BY rowid DESC"
+            )
+        )
+        converted = []
+        for hist in materials:
+            mat = self.import_historical_material(hist)
+            if mat.code:
+                mat.id = ids_by_code.setdefault(mat.code, mat.id)
+            converted.append(mat)
+        self._store.executemany(
+            "INSERT OR REPLACE INTO materials (id, name, code, type, data) VALUES (?, ?, ?, ?, ?)",
+            [self._row_values(mat) for mat in converted],
+        )
+        # Le righe sostituite (stesso id) non devono restare in cache con i vecchi dati
+        self._cache.update((mat.id, mat) for mat in converted)
+        self._changed()
+        return len(converted)
+
+    def load_from_file(self) -> None:
+        """Scarta la cache: i materiali verranno riletti dal database."""
+        self._cache.clear()
+        self._changed()
+
+    def save_to_file(self) -> None:
+        """No-op: ogni modifica è già registrata nel database."""
+
+    def export_backup(self, destination: Path | str) -> None:
+        """Esporta l'archivio materiali in JSON."""
+        dest_path = Path(destination)
+        if dest_path.suffix.lower() != ".json":
+            dest_path = dest_path.with_suffix(".json")
+        if not dest_path.parent.exists():
+            dest_path.parent.mkdir(parents=True, exist_ok=True)
+        data = [m.to_dict() for m in self.get_all()]
+        with dest_path.open("w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        logger.info("Esportati %d materiali in %s", len(data), dest_path)
+
+
+# ----------------------------------------------------------------------
+# Elementi di verifica
+# ----------------------------------------------------------------------
+
+
+class SqliteVerificationItemsRepository:
+    """Archivio elementi di verifica su SQLite (API di `VerificationItemsRepository`)."""
+
+    def __init__(self, store: SqliteStore | str | Path | None = None) -> None:
+        self._store = _store(store)
+
+    @staticmethod
+    def _row_values(item: VerificationItem) -> tuple:
+        return (item.id, item.name or "", item.group, json.dumps(item_to_dict(item)))
+
+    def _select(self, where: str = "", params: Iterable[Any] = ()) -> list[VerificationItem]:
+        items = []
+        for item_id, data in self._store.execute(
+            f"SELECT id, data FROM verification_items {where} ORDER BY rowid", params
+        ):
+            try:
+                items.append(item_from_dict(json.loads(data)))
+            except (TypeError, ValueError, KeyError) as exc:
+                logger.exception("Errore parsing VerificationItem %s: %s", item_id, exc)
+        return items
+
+    def get_all(self) -> list[VerificationItem]:
+        return self._select()
+
+    def get_by_id(self, item_id: str) -> VerificationItem | None:
+        found = self._select("WHERE id = ?", (item_id,))
+        return found[0] if found else None
+
+    def get_by_group(self, group: str | None) -> list[VerificationItem]:
+        if group is None:
+            return self._select("WHERE item_group IS NULL")
+        return self._select("WHERE item_group = ?", (group,))
+
+    def save(self, item: VerificationItem) -> None:
+        logger.debug("Saving VerificationItem id=%s name=%s", item.id, item.name)
+        self._store.execute(
+            "INSERT INTO verification_items (id, name, item_group, data) VALUES (?, ?, ?, ?)"
+            " ON CONFLICT(id) DO UPDATE SET"
+            " name = excluded.name, item_group = excluded.item_group, data = excluded.data",
+            self._row_values(item),
+        )
+
+    def delete(self, item_id: str) -> None:
+        logger.debug("Deleting VerificationItem id=%s", item_id)
+        self._store.execute("DELETE FROM verification_items WHERE id = ?", (item_id,))
+
+    def clear(self) -> None:
+        self._store.execute("DELETE FROM verification_items")
+
+    def import_json(self, json_file: str | Path) -> int:
+        """Importa in blocco un file `verification_items.json`."""
+        rows = []
+        for idx, raw in enumerate(_load_json_list(json_file)):
+            try:
+                item = item_from_dict(raw)
+                if item.id:
+                    rows.append(self._row_values(item))
+            except (TypeError, ValueError, KeyError, AttributeError) as exc:
+                logger.exception("Errore parsing VerificationItem #%s: %s", idx, exc)
+        self._store.executemany(
+            "INSERT OR REPLACE INTO verification_items (id, name, item_group, data)"
+            " VALUES (?, ?, ?, ?)",
+            rows,
+        )
+        logger.info("Importati %d elementi di verifica da %s", len(rows), json_file)
+        return len(rows)
+
+    def load_from_file(self) -> None:
+        """No-op: gli elementi sono letti dal database a ogni richiesta."""
+
+    def save_to_file(self) -> None:
+        """No-op: ogni modifica è già registrata nel database."""
@@ -8,7 +8,7 @@ from .geometry import (
     SectionGeometry,
     TSection,
 )
-from .interpolation import linear_interpolate
+from .interpolation import InterpTable1D, InterpTable2D, linear_interpolate
 from .materials import Concrete, Material, Steel
 from .reinforcement import RebarLayer, SectionReinforcement, Stirrups
 from .section_properties import SectionProperties, compute_section_properties
@@ -29,4 +29,6 @@ __all__ = [
     "SectionProperties",
     "compute_section_properties",
     "linear_interpolate",
+    "InterpTable1D",
+    "InterpTable2D",
 ]
@@ -0,0 +1,292 @@
+"""Digitized historical charts and tables (abachi) with array-backed lookup.
+
+Each abaco is a human-editable JSON file in data/abachi/ with either
+
+- a set of curves y(x), e.g. omega(lambda) or the allowable stresses versus Rck,
+  each sampled at its own abscissae and optionally labelled with a family
+  parameter ("param", e.g. the n of a group of curves); or
+- a set of double-entry tables z(x, y) sharing the same grid, e.g. the r and t
+  coefficients of the TA rectangular section versus sigma_c and sigma_f.
+
+Loading compiles the JSON once into NumPy arrays: the curves are resampled on
+the union of their abscissae (exact for piecewise-linear curves, which all clamp
+at their ends) so that all of them are evaluated with a single search. The
+arrays are cached in a .npz next to the source together with the hash of the
+JSON, and reloaded from there until the source changes.
+
+The registry is the single access point for calculations and GUI alike.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import tempfile
+import zipfile
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from .interpolation import InterpTable1D, InterpTable2D, locate
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ABACHI_DIR = Path(__file__).resolve().parents[3] / "data" / "abachi"
+# Bump when the layout of the .npz cache changes
+_CACHE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class AbacoAxis:
+    name: str
+    unit: str = ""
+
+
+@dataclass(frozen=True, eq=False)
+class Abaco:
+    """Compiled abaco.
+
+    Curves: `x` is the union of the abscissae, `values` has shape
+    (n_curves, x.size) and `params` holds the family parameter of each curve
+    (or is None). Tables: `x` and `y` are the grid axes and `values` has shape
+    (n_tables, x.size, y.size).
+    """
+
+    id: str
+    title: str
+    source: str
+    x_axis: AbacoAxis
+    y_axis: AbacoAxis | None
+    names: tuple[str, ...]
+    units: tuple[str, ...]
+    x: np.ndarray
+    y: np.ndarray | None
+    values: np.ndarray
+    params: np.ndarray | None = None
+    param_axis: AbacoAxis | None = None
+    _tables: dict = field(default_factory=dict, repr=False)
+
+    @property
+    def is_grid(self) -> bool:
+        return self.y is not None
+
+    def index(self, name: str) -> int:
+        try:
+            return self.names.index(name)
+        except ValueError:
+            raise KeyError(f"abaco {self.id!r} has no curve/table {name!r}") from None
+
+    def table(self, name: str) -> InterpTable1D | InterpTable2D:
+        """Interpolation table of one curve/table, compiled on first use."""
+        table = self._tables.get(name)
+        if table is None:
+            k = self.index(name)
+            if self.is_grid:
+                table = InterpTable2D(self.x, self.y, self.values[k])
+            else:
+                table = InterpTable1D(self.x, self.values[k])
+            self._tables[name] = table
+        return table
+
+    def __call__(self, name: str, x, y=None):
+        """Value of one curve at x (or of one table at (x, y))."""
+        if self.is_grid:
+            if y is None:
+                raise TypeError(f"abaco {self.id!r} needs both x and y")
+            return self.table(name)(x, y)
+        return self.table(name)(x)
+
+    def evaluate(self, x, y=None, names=None) -> np.ndarray:
+        """All (or the given) curves/tables at once: shape (n_names, *shape of x[, y])."""
+        rows = slice(None) if names is None else [self.index(n) for n in names]
+        V = self.values[rows]
+        i, tx = locate(self.x, x)
+        if not self.is_grid:
+            return V[:, i] + (V[:, i + 1] - V[:, i]) * tx
+        if y is None:
+            raise TypeError(f"abaco {self.id!r} needs both x and y")
+        j, ty = locate(self.y, y)
+        i, j = np.broadcast_arrays(i, j)
+        tx, ty = np.broadcast_arrays(tx, ty)
+        z0 = V[:, i, j] + (V[:, i, j + 1] - V[:, i, j]) * ty
+        z1 = V[:, i + 1, j] + (V[:, i + 1, j + 1] - V[:, i + 1, j]) * ty
+        return z0 + (z1 - z0) * tx
+
+    def family(self, param, x):
+        """Interpolate between the curves of a family at parameter `param`."""
+        if self.params is None:
+            raise ValueError(f"abaco {self.id!r} has no family parameter")
+        table = self._tables.get(None)
+        if table is None:
+            table = self._tables[None] = InterpTable2D(self.params, self.x, self.values)
+        return table(param, x)
+
+
+def _compile_source(data: dict) -> dict[str, np.ndarray]:
+    """Arrays of an abaco from its JSON description."""
+    x_axis = data["x"]
+    arrays: dict[str, np.ndarray] = {
+        "meta": np.array([data["id"], data.get("title", ""), data.get("source", "")]),
+        "x_axis": np.array([x_axis["name"], x_axis.get("unit", "")]),
+    }
+    if "tables" in data:
+        y_axis = data["y"]
+        x = np.asarray(x_axis["values"], dtype=float)
+        y = np.asarray(y_axis["values"], dtype=float)
+        ox, oy = np.argsort(x, kind="stable"), np.argsort(y, kind="stable")
+        values = []
+        for table in data["tables"]:
+            z = np.asarray(table["values"], dtype=float)
+            if z.shape != (x.size, y.size):
+                raise ValueError(
+                    f"table {table['name']!r}: shape {z.shape}, expected ({x.size}, {y.size})"
+                )
+            values.append(z[np.ix_(ox, oy)])
+        arrays.update(
+            y_axis=np.array([y_axis["name"], y_axis.get("unit", "")]),
+            x=x[ox],
+            y=y[oy],
+            values=np.asarray(values),
+            names=np.array([t["name"] for t in data["tables"]]),
+            units=np.array([t.get("unit", "") for t in data["tables"]]),
+        )
+        return arrays
+    curves = data["curves"]
+    samples = []
+    for curve in curves:
+        cx = np.asarray(curve["x"], dtype=float)
+        cy = np.asarray(curve["y"], dtype=float)
+        if cx.shape != cy.shape or cx.size < 2:
+            raise ValueError(f"curve {curve['name']!r}: needs matching x, y with 2+ points")
+        order = np.argsort(cx, kind="stable")
+        samples.append((cx[order], cy[order]))
+    x = np.unique(np.concatenate([cx for cx, _ in samples]))
+    arrays.update(
+        x=x,
+        values=np.asarray([np.interp(x, cx, cy) for cx, cy in samples]),
+        names=np.array([c["name"] for c in curves]),
+        units=np.array([c.get("unit", "") for c in curves]),
+    )
+    if "param" in data:
+        params = np.asarray([c["param"] for c in curves], dtype=float)
+        order = np.argsort(params, kind="stable")
+        arrays.update(
+            param_axis=np.array([data["param"]["name"], data["param"].get("unit", "")]),
+            params=params[order],
+            values=arrays["values"][order],
+            names=arrays["names"][order],
+            units=arrays["units"][order],
+        )
+    return arrays
+
+
+def _abaco_from_arrays(arrays) -> Abaco:
+    def axis(key):
+        return AbacoAxis(*(str(v) for v in arrays[key])) if key in arrays else None
+
+    x, values = np.array(arrays["x"]), np.array(arrays["values"])
+    y = np.array(arrays["y"]) if "y" in arrays else None
+    params = np.array(arrays["params"]) if "params" in arrays else None
+    for arr in (x, y, values, params):
+        if arr is not None:
+            arr.setflags(write=False)
+    ident, title, source = (str(v) for v in arrays["meta"])
+    return Abaco(
+        id=ident,
+        title=title,
+        source=source,
+        x_axis=axis("x_axis"),
+        y_axis=axis("y_axis"),
+        names=tuple(str(n) for n in arrays["names"]),
+        units=tuple(str(u) for u in arrays["units"]),
+        x=x,
+        y=y,
+        values=values,
+        params=params,
+        param_axis=axis("param_axis"),
+    )
+
+
+def _write_cache(cache: Path, digest: str, arrays: dict[str, np.ndarray]) -> None:
+    """Write the .npz cache atomically through a temp file of this writer only.
+
+    Process-pool workers may compile the same abaco at once on a fresh checkout:
+    each writes its own temp file and the last replace wins.
+    """
+    tmp = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            dir=cache.parent, prefix=cache.stem + ".", suffix=".tmp.npz", delete=False
+        ) as fh:
+            tmp = Path(fh.name)
+            np.savez(fh, digest=np.array(digest), **arrays)
+        tmp.replace(cache)
+    except OSError:
+        logger.warning("Impossibile scrivere la cache abaco %s", cache)
+        if tmp is not None:
+            tmp.unlink(missing_ok=True)
+
+
+def load_abaco(path: str | Path, use_cache: bool = True) -> Abaco:
+    """Load an abaco from its JSON source, through the .npz cache when current."""
+    path = Path(path)
+    raw = path.read_bytes()
+    digest = f"{_CACHE_VERSION}:{hashlib.sha1(raw).hexdigest()}"
+    cache = path.with_suffix(".npz")
+    if use_cache and cache.exists():
+        try:
+            with np.load(cache, allow_pickle=False) as npz:
+                if str(npz["digest"]) == digest:
+                    return _abaco_from_arrays({key: npz[key] for key in npz.files})
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            logger.warning("Cache abaco non leggibile, ricompilo: %s", cache)
+    arrays = _compile_source(json.loads(raw.decode("utf-8")))
+    if use_cache:
+        _write_cache(cache, digest, arrays)
+    return _abaco_from_arrays(arrays)
+
+
+class AbachiRegistry:
+    """Abachi of a directory, loaded lazily by id (the JSON file name)."""
+
+    def __init__(self, directory: str | Path | None = None, use_cache: bool = True):
+        self.directory = Path(directory) if directory is not None else DEFAULT_ABACHI_DIR
+        self.use_cache = use_cache
+        self._loaded: dict[str, Abaco] = {}
+
+    def ids(self) -> list[str]:
+        return sorted(p.stem for p in self.directory.glob("*.json"))
+
+    def __contains__(self, abaco_id: str) -> bool:
+        return abaco_id in self._loaded or (self.directory / f"{abaco_id}.json").exists()
+
+    def get(self, abaco_id: str) -> Abaco:
+        abaco = self._loaded.get(abaco_id)
+        if abaco is None:
+            path = self.directory / f"{abaco_id}.json"
+            if not path.exists():
+                raise KeyError(f"abaco {abaco_id!r} not found in {self.directory}")
+            abaco = self._loaded[abaco_id] = load_abaco(path, self.use_cache)
+        return abaco
+
+    __getitem__ = get
+
+    def reload(self, abaco_id: str | None = None) -> None:
+        """Forget loaded abachi (all, or one) so that edited sources are re-read."""
+        if abaco_id is None:
+            self._loaded.clear()
+        else:
+            self._loaded.pop(abaco_id, None)
+
+
+@lru_cache(maxsize=1)
+def default_abachi_registry() -> AbachiRegistry:
+    return AbachiRegistry()
+
+
+def get_abaco(abaco_id: str) -> Abaco:
+    """Abaco `abaco_id` of data/abachi (shared registry)."""
+    return default_abachi_registry().get(abaco_id)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from bisect import bisect_right
 from collections.abc import Iterable
 
+import numpy as np
+
 
 def linear_interpolate(x: float, x0: float, x1: float, y0: float, y1: float) -> float:
     if x1 == x0:
@@ -10,18 +13,123 @@ def linear_interpolate(x: float, x0: float, x1: float, y0: float, y1: float) ->
 
 
 def linear_interpolate_table(x: float, table: Iterable[tuple[float, float]]) -> float:
-    """Interpolazione lineare su tabella ordinata per x."""
-    items = sorted(table, key=lambda t: t[0])
-    if len(items) < 2:
-        raise ValueError("Tabella insufficiente per interpolazione")
+    """Interpolazione lineare su tabella (ordinata a ogni chiamata).
+
+    Per letture ripetute sulla stessa tabella usare `InterpTable1D`.
+    """
+    return InterpTable1D.from_pairs(table)(x)
+
+
+def _breakpoints(values, name: str) -> np.ndarray:
+    arr = np.asarray(values, dtype=float)
+    if arr.ndim != 1 or arr.size < 2:
+        raise ValueError(f"Tabella insufficiente per interpolazione ({name})")
+    return arr
+
+
+def _readonly(arr: np.ndarray) -> np.ndarray:
+    arr.setflags(write=False)
+    return arr
+
+
+def locate(axis: np.ndarray, v) -> tuple[np.ndarray, np.ndarray]:
+    """Tratto di `axis` (ordinato) che contiene ogni valore di `v` e peso del
+    punto successivo, con i valori bloccati agli estremi."""
+    v = np.clip(np.asarray(v, dtype=float), axis[0], axis[-1])
+    i = np.clip(np.searchsorted(axis, v, side="right") - 1, 0, axis.size - 2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (v - axis[i]) / (axis[i + 1] - axis[i])
+    return i, np.nan_to_num(t, nan=0.0, posinf=0.0, neginf=0.0)
+
+
+class InterpTable1D:
+    """Tabella y(x) compilata: ordinata una volta, interpolazione lineare.
+
+    Fuori dall'intervallo restituisce il valore dell'estremo (come
+    `linear_interpolate_table`). Uno scalare è valutato con `bisect` su liste
+    Python (O(log n), nessun array creato); un array con `np.interp`.
+    """
+
+    __slots__ = ("x", "y", "_xs", "_ys")
+
+    def __init__(self, x: Iterable[float], y: Iterable[float]):
+        x = _breakpoints(list(x), "x")
+        y = np.asarray(list(y), dtype=float)
+        if y.shape != x.shape:
+            raise ValueError("Tabella con numero di valori diverso dai punti x")
+        order = np.argsort(x, kind="stable")
+        self.x = _readonly(x[order])
+        self.y = _readonly(y[order])
+        self._xs = self.x.tolist()
+        self._ys = self.y.tolist()
+
+    @classmethod
+    def from_pairs(cls, table: Iterable[tuple[float, float]]) -> InterpTable1D:
+        pairs = list(table)
+        return cls([p[0] for p in pairs], [p[1] for p in pairs])
+
+    def __len__(self) -> int:
+        return len(self._xs)
+
+    def __call__(self, x):
+        if isinstance(x, (int, float)):
+            xs, ys = self._xs, self._ys
+            i = bisect_right(xs, x)
+            if i == 0:
+                return ys[0]
+            if i == len(xs):
+                return ys[-1]
+            x0, x1 = xs[i - 1], xs[i]
+            return ys[i - 1] + (ys[i] - ys[i - 1]) * (x - x0) / (x1 - x0)
+        return np.interp(x, self.x, self.y)
+
+
+class InterpTable2D:
+    """Tabella z(x, y) a doppia entrata con interpolazione bilineare.
+
+    `z` ha forma (len(x), len(y)); gli assi sono ordinati una volta. Fuori
+    dalla griglia i valori sono bloccati al bordo. Scalari con `bisect`,
+    array (anche di forme diverse, con broadcasting) con `np.searchsorted`.
+    """
+
+    __slots__ = ("x", "y", "z", "_xs", "_ys", "_zs")
 
-    if x <= items[0][0]:
-        return items[0][1]
-    if x >= items[-1][0]:
-        return items[-1][1]
+    def __init__(self, x: Iterable[float], y: Iterable[float], z):
+        x = _breakpoints(list(x), "x")
+        y = _breakpoints(list(y), "y")
+        z = np.asarray(z, dtype=float)
+        if z.shape != (x.size, y.size):
+            raise ValueError(f"Tabella z di forma {z.shape}, attesa ({x.size}, {y.size})")
+        ox, oy = np.argsort(x, kind="stable"), np.argsort(y, kind="stable")
+        self.x = _readonly(x[ox])
+        self.y = _readonly(y[oy])
+        self.z = _readonly(z[np.ix_(ox, oy)])
+        self._xs = self.x.tolist()
+        self._ys = self.y.tolist()
+        self._zs = self.z.tolist()
 
-    for (x0, y0), (x1, y1) in zip(items, items[1:]):
-        if x0 <= x <= x1:
-            return linear_interpolate(x, x0, x1, y0, y1)
+    @staticmethod
+    def _cell(axis: list[float], v: float) -> tuple[int, float]:
+        """Indice del tratto e peso del punto successivo (bloccato agli estremi)."""
+        i = bisect_right(axis, v) - 1
+        if i < 0:
+            return 0, 0.0
+        if i >= len(axis) - 1:
+            return len(axis) - 2, 1.0
+        return i, (v - axis[i]) / (axis[i + 1] - axis[i])
 
-    raise ValueError("Valore x fuori dalla tabella")
+    def __call__(self, x, y):
+        if isinstance(x, (int, float)) and isinstance(y, (int, float)):
+            i, tx = self._cell(self._xs, x)
+            j, ty = self._cell(self._ys, y)
+            row0, row1 = self._zs[i], self._zs[i + 1]
+            z0 = row0[j] + (row0[j + 1] - row0[j]) * ty
+            z1 = row1[j] + (row1[j + 1] - row1[j]) * ty
+            return z0 + (z1 - z0) * tx
+        x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+        i, tx = locate(self.x, x)
+        j, ty = locate(self.y, y)
+        z = self.z
+        z0 = z[i, j] + (z[i, j + 1] - z[i, j]) * ty
+        z1 = z[i + 1, j] + (z[i + 1, j + 1] - z[i + 1, j]) * ty
+        return z0 + (z1 - z0) * tx
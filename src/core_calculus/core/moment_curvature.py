@@ -0,0 +1,270 @@
+"""Moment-curvature diagrams of reinforced concrete sections.
+
+Port of CostruzioneDiagrMomentiCurvatura and Calcola_Nx_My_1/2/3 (CA_SLU.bas, 4.8).
+The VB routine fixes a neutral-axis position, bisects the controlling strain until
+the axial equilibrium holds and writes one (curvature, moment) pair at a time. Here
+the controlling strain is swept instead:
+
+- the strain of the compressed edge goes from the uniform strain that carries N
+  up to eps_cu (concrete crushing);
+- for each value the curvature satisfying the axial equilibrium is found by a
+  bracketed Newton iteration, warm-started from the previous point of the curve;
+- if the tensile bars reach eps_su first, the last point is recomputed with the
+  bar strain as controlling strain (pivot on the reinforcement).
+
+All axial levels are solved together: strains, stresses and tangents are
+(levels x fibers) arrays evaluated with vectorized constitutive laws (parabola-
+rectangle concrete without tension, elastic-perfectly plastic steel).
+
+Conventions as in verification_core: lengths [cm], forces [kg], stresses
+[kg/cm²], distances of the bars from the compressed edge, N > 0 tension, strains
+positive in compression, moments [kg·cm] about mid-height (positive when they
+compress the top edge).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from .solvers import safeguarded_newton
+from .verification_core import MaterialProperties, ReinforcementLayer, SectionGeometry
+
+
+def concrete_stress_tangent(
+    eps: np.ndarray, fcd: float, eps_c2: float = 0.002
+) -> tuple[np.ndarray, np.ndarray]:
+    """Parabola-rectangle law (compression positive, no tension): (sigma, tangent)."""
+    eps = np.asarray(eps, dtype=float)
+    ratio = np.clip(eps / eps_c2, 0.0, 1.0)
+    sigma = fcd * ratio * (2.0 - ratio)
+    tangent = np.where((eps > 0.0) & (eps < eps_c2), 2.0 * fcd / eps_c2 * (1.0 - ratio), 0.0)
+    return sigma, tangent
+
+
+def steel_stress_tangent(eps: np.ndarray, fyd: float, Es: float) -> tuple[np.ndarray, np.ndarray]:
+    """Elastic-perfectly plastic steel, symmetric in tension and compression."""
+    eps = np.asarray(eps, dtype=float)
+    sigma = np.clip(Es * eps, -fyd, fyd)
+    tangent = np.where(np.abs(Es * eps) < fyd, Es, 0.0)
+    return sigma, tangent
+
+
+@dataclass
+class MomentCurvatureCurves:
+    """Moment-curvature curves for several axial levels of one section.
+
+    Point arrays have shape (n_levels, n_points + 1): column 0 is the uncurved
+    state under N, the last valid column is the ultimate point; entries past it
+    are NaN. Curvatures [1/cm], moments [kg·cm], neutral axis depth [cm].
+    """
+
+    N: np.ndarray
+    curvature: np.ndarray
+    moment: np.ndarray
+    neutral_axis: np.ndarray
+    eps_top: np.ndarray
+    eps_steel: np.ndarray
+    converged: np.ndarray
+    iterations: np.ndarray
+    yield_curvature: np.ndarray
+    yield_moment: np.ndarray
+    ultimate_curvature: np.ndarray
+    ultimate_moment: np.ndarray
+    steel_failure: np.ndarray  # True where the ultimate point is bar rupture
+
+    @property
+    def ductility(self) -> np.ndarray:
+        """Curvature ductility chi_u / chi_y per axial level."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.ultimate_curvature / self.yield_curvature
+
+    def curve(self, level: int) -> tuple[np.ndarray, np.ndarray]:
+        """(curvature, moment) of one axial level without the NaN padding."""
+        keep = np.isfinite(self.curvature[level])
+        return self.curvature[level, keep], self.moment[level, keep]
+
+
+def moment_curvature_curves(
+    section: SectionGeometry,
+    reinforcement_tensile: ReinforcementLayer,
+    reinforcement_compressed: ReinforcementLayer,
+    material: MaterialProperties,
+    N_levels,
+    *,
+    n_points: int = 60,
+    n_layers: int = 100,
+    eps_c2: float = 0.002,
+    eps_cu: float = 0.0035,
+    eps_su: float = 0.01,
+    max_iter: int = 50,
+    tol: float = 1e-9,
+) -> MomentCurvatureCurves:
+    """Compute the M-chi curves of a rectangular section for every N in `N_levels`.
+
+    The concrete is divided in `n_layers` strips parallel to the neutral axis;
+    `n_points` controlling-strain steps are taken between the uncurved state and
+    concrete crushing. Levels outside the axial capacity give NaN curves.
+    """
+    b, h = section.width, section.height
+    fcd = material.fcd if material.fcd is not None else material.fck
+    fyd = material.fyd if material.fyd is not None else material.fyk
+    Es = material.Es if material.Es is not None else 2100000.0
+
+    # Fibers: concrete strips followed by the two reinforcement layers
+    dz = h / n_layers
+    y = np.concatenate(
+        (
+            (np.arange(n_layers) + 0.5) * dz,
+            [reinforcement_tensile.distance, reinforcement_compressed.distance],
+        )
+    )
+    area = np.concatenate(
+        (np.full(n_layers, b * dz), [reinforcement_tensile.area, reinforcement_compressed.area])
+    )
+    is_steel = np.zeros(y.size, dtype=bool)
+    is_steel[n_layers:] = True
+    lever = h / 2.0 - y
+    d_steel = reinforcement_tensile.distance
+
+    N = np.atleast_1d(np.asarray(N_levels, dtype=float))
+    n_lev = N.size
+    scale = fcd * b * h + fyd * float(area[is_steel].sum())
+    abs_tol = tol * scale
+
+    def response(eps: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        sig_c, tan_c = concrete_stress_tangent(eps[..., ~is_steel], fcd, eps_c2)
+        sig_s, tan_s = steel_stress_tangent(eps[..., is_steel], fyd, Es)
+        return (
+            np.concatenate((sig_c, sig_s), axis=-1),
+            np.concatenate((tan_c, tan_s), axis=-1),
+        )
+
+    def pivot_equilibrium(eps_p: np.ndarray, y_p: float, n_ax: np.ndarray):
+        # eps(y) = eps_p + chi * (y_p - y): residual of sum(sigma dA) + N and d/dchi
+        arm = y_p - y
+
+        def func(chi: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+            eps = eps_p[:, None] + chi[:, None] * arm
+            sigma, tangent = response(eps)
+            return sigma @ area + n_ax, (tangent * area) @ arm
+
+        return func
+
+    # 1) Uniform strain carrying N (first point of every curve)
+    def uniform(e: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        sigma, tangent = response(np.repeat(e[:, None], y.size, axis=1))
+        return sigma @ area + N, tangent @ area
+
+    e_N, ok_N, _ = safeguarded_newton(
+        uniform,
+        np.full(n_lev, -eps_su),
+        np.full(n_lev, eps_cu),
+        np.zeros(n_lev),
+        tol=abs_tol,
+        max_iter=max_iter,
+    )
+
+    shape = (n_lev, n_points + 1)
+    chi = np.full(shape, np.nan)
+    eps_top = np.full(shape, np.nan)
+    converged = np.zeros(shape, dtype=bool)
+    iterations = np.zeros(shape, dtype=int)
+    chi[:, 0] = np.where(ok_N, 0.0, np.nan)
+    eps_top[:, 0] = np.where(ok_N, e_N, np.nan)
+    converged[:, 0] = ok_N
+
+    # 2) Sweep of the compressed-edge strain, warm start from the previous point
+    chi_hi = 1e3 * (eps_cu + eps_su) / h
+    alive = ok_N.copy()
+    steel_failure = np.zeros(n_lev, dtype=bool)
+    for k in range(1, n_points + 1):
+        if not alive.any():
+            break
+        idx = np.flatnonzero(alive)
+        e_top = e_N[idx] + (eps_cu - e_N[idx]) * k / n_points
+        prev = chi[idx, k - 1]
+        sol, ok, its = safeguarded_newton(
+            pivot_equilibrium(e_top, 0.0, N[idx]),
+            np.zeros(idx.size),
+            np.full(idx.size, chi_hi),
+            prev,
+            tol=abs_tol,
+            max_iter=max_iter,
+        )
+        iterations[idx, k] = its
+        ruptured = ok & (sol * d_steel - e_top > eps_su)
+        good = ok & ~ruptured
+        chi[idx[good], k] = sol[good]
+        eps_top[idx[good], k] = e_top[good]
+        converged[idx[good], k] = True
+
+        if ruptured.any():
+            # Ultimate point controlled by the bars: eps = -eps_su at d_steel
+            r = idx[ruptured]
+            sol_r, ok_r, its_r = safeguarded_newton(
+                pivot_equilibrium(np.full(r.size, -eps_su), d_steel, N[r]),
+                chi[r, k - 1],
+                sol[ruptured],
+                chi[r, k - 1],
+                tol=abs_tol,
+                max_iter=max_iter,
+            )
+            chi[r, k] = np.where(ok_r, sol_r, np.nan)
+            eps_top[r, k] = np.where(ok_r, sol_r * d_steel - eps_su, np.nan)
+            converged[r, k] = ok_r
+            iterations[r, k] += its_r
+            steel_failure[r] = ok_r
+        alive[idx[~good]] = False
+
+    # 3) Moments and strains of all converged points at once
+    eps = eps_top[:, :, None] - chi[:, :, None] * y
+    sigma, _ = response(np.nan_to_num(eps))
+    moment = np.where(converged, (sigma * area) @ lever, np.nan)
+    chi = np.where(converged, chi, np.nan)
+    eps_top = np.where(converged, eps_top, np.nan)
+    eps_steel = eps_top - chi * d_steel
+    with np.errstate(divide="ignore", invalid="ignore"):
+        neutral_axis = np.where(chi > 0.0, eps_top / chi, np.nan)
+
+    # Index of the last converged point of each curve
+    last = converged.shape[1] - 1 - np.argmax(converged[:, ::-1], axis=1)
+    rows = np.arange(n_lev)
+    has_curve = converged[:, 1:].any(axis=1)
+    ultimate_curvature = np.where(has_curve, chi[rows, last], np.nan)
+    ultimate_moment = np.where(has_curve, moment[rows, last], np.nan)
+
+    # Yielding of the tensile bars (first crossing of eps_yd), else concrete at eps_c2
+    eps_yd = fyd / Es
+    yield_curvature = np.full(n_lev, np.nan)
+    yield_moment = np.full(n_lev, np.nan)
+    for indicator, limit in ((-eps_steel, eps_yd), (eps_top, eps_c2)):
+        missing = np.isnan(yield_curvature) & has_curve
+        if not missing.any():
+            break
+        value = np.where(np.isfinite(indicator), indicator, -np.inf)
+        crossed = value >= limit
+        first = np.argmax(crossed, axis=1)
+        found = missing & crossed.any(axis=1) & (first > 0)
+        i, j = rows[found], first[found]
+        v0, v1 = value[i, j - 1], value[i, j]
+        t = np.clip((limit - v0) / np.where(v1 != v0, v1 - v0, 1.0), 0.0, 1.0)
+        yield_curvature[i] = chi[i, j - 1] + t * (chi[i, j] - chi[i, j - 1])
+        yield_moment[i] = moment[i, j - 1] + t * (moment[i, j] - moment[i, j - 1])
+
+    return MomentCurvatureCurves(
+        N=N,
+        curvature=chi,
+        moment=moment,
+        neutral_axis=neutral_axis,
+        eps_top=eps_top,
+        eps_steel=eps_steel,
+        converged=converged,
+        iterations=iterations,
+        yield_curvature=yield_curvature,
+        yield_moment=yield_moment,
+        ultimate_curvature=ultimate_curvature,
+        ultimate_moment=ultimate_moment,
+        steel_failure=steel_failure,
+    )
@@ -0,0 +1,320 @@
+"""Monte Carlo reliability of rectangular RC sections with uncertain materials.
+
+For the assessment of existing (RD 2229-era) members the concrete strength
+sigma_c28, the steel yield strength, the cover and the bar area are sampled
+from their distributions and the TA or SLU bending check is run on all samples
+at once with the kernels of sweep.py. The safety factor of a sample is the
+admissible (TA) or resisting (SLU) moment over the demand; failure is FS < 1.
+
+Allowable / design stresses are those of the engine for the nominal material
+(`VerificationEngine.get_allowable_stresses`) or those given explicitly (e.g.
+sigma_c and sigma_s of the historical material library), scaled by the ratio
+between the sampled and the nominal strength: all the code rules are linear in
+fck and fyk.
+
+Samples are drawn in chunks, each with its own generator spawned from the seed
+(np.random.SeedSequence), so the results are reproducible and identical whether
+the chunks run in this process or in a process pool.
+
+Units as in verification_core: lengths [cm], areas [cm²], forces [kg], moments
+[kg·cm], stresses [kg/cm²].
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from statistics import NormalDist
+
+import numpy as np
+
+from .sweep import slu_resisting_moment, ta_admissible_moment
+from .verification_core import MaterialProperties
+from .verification_engine import VerificationEngine
+
+DEFAULT_CHUNK = 1 << 17
+# Coefficients of variation used when a variable is not given explicitly
+DEFAULT_COV_CONCRETE = 0.15
+DEFAULT_COV_STEEL = 0.08
+DEFAULT_COVER_STD = 1.0
+DEFAULT_COV_BAR_AREA = 0.03
+# Fractile of the characteristic values of the library (5%)
+CHARACTERISTIC_FRACTILE = 1.645
+
+_NORMAL = NormalDist()
+
+
+@dataclass(frozen=True)
+class RandomVariable:
+    """Normal or lognormal variable given by mean and coefficient of variation.
+
+    Normal samples are truncated at zero (physical quantities).
+    """
+
+    mean: float
+    cov: float = 0.0
+    distribution: str = "lognormal"
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        if self.cov <= 0.0:
+            return np.full(size, float(self.mean))
+        if self.distribution == "lognormal":
+            s = math.sqrt(math.log1p(self.cov**2))
+            return rng.lognormal(math.log(self.mean) - 0.5 * s * s, s, size)
+        if self.distribution == "normal":
+            return np.maximum(rng.normal(self.mean, self.cov * abs(self.mean), size), 0.0)
+        raise ValueError(f"unknown distribution {self.distribution!r}")
+
+    @classmethod
+    def from_characteristic(
+        cls, fk: float, cov: float, distribution: str = "lognormal"
+    ) -> RandomVariable:
+        """Variable with the same cov whose 5% fractile is `fk`."""
+        if distribution == "lognormal":
+            s = math.sqrt(math.log1p(cov**2))
+            return cls(fk * math.exp(CHARACTERISTIC_FRACTILE * s + 0.5 * s * s), cov, distribution)
+        return cls(fk / (1.0 - CHARACTERISTIC_FRACTILE * cov), cov, distribution)
+
+
+@dataclass(frozen=True)
+class ReliabilityProblem:
+    """Rectangular section b x h in simple bending (SLU: also under N).
+
+    `material` holds the nominal strengths the allowable/design stresses refer
+    to; fck and fyk are characteristic values, so the random variables default
+    to lognormal strengths whose 5% fractile is the nominal value, a normal
+    cover of std 1 cm and a normal bar area factor (applied to As and As_prime)
+    with mean 1.
+    """
+
+    method: str
+    b: float
+    h: float
+    As: float
+    M: float
+    material: MaterialProperties
+    As_prime: float = 0.0
+    N: float = 0.0
+    cover: float = 4.0
+    sigma_c_adm: float | None = None  # nominal TA allowable / SLU fcd
+    sigma_s_adm: float | None = None  # nominal TA allowable / SLU fyd
+    sigma_c28: RandomVariable | None = None
+    fyk: RandomVariable | None = None
+    cover_variable: RandomVariable | None = None
+    bar_area: RandomVariable | None = None
+
+    def __post_init__(self):
+        method = self.method.upper()
+        if method not in ("TA", "SLU"):
+            raise ValueError(f"unknown reliability method {self.method!r}")
+        if method == "TA" and self.N:
+            raise ValueError("the TA check covers simple bending only (N = 0)")
+        object.__setattr__(self, "method", method)
+        if self.sigma_c_adm is None or self.sigma_s_adm is None:
+            sigma_c, sigma_s = VerificationEngine(method).get_allowable_stresses(self.material)
+            if self.sigma_c_adm is None:
+                object.__setattr__(self, "sigma_c_adm", sigma_c)
+            if self.sigma_s_adm is None:
+                object.__setattr__(self, "sigma_s_adm", sigma_s)
+        defaults = {
+            "sigma_c28": RandomVariable.from_characteristic(
+                self.material.fck, DEFAULT_COV_CONCRETE
+            ),
+            "fyk": RandomVariable.from_characteristic(self.material.fyk, DEFAULT_COV_STEEL),
+            "cover_variable": RandomVariable(self.cover, DEFAULT_COVER_STD / self.cover, "normal"),
+            "bar_area": RandomVariable(1.0, DEFAULT_COV_BAR_AREA, "normal"),
+        }
+        for name, variable in defaults.items():
+            if getattr(self, name) is None:
+                object.__setattr__(self, name, variable)
+
+    @classmethod
+    def from_library(
+        cls,
+        method: str,
+        concrete_code: str,
+        steel_code: str,
+        *,
+        library=None,
+        cov_concrete: float = DEFAULT_COV_CONCRETE,
+        cov_steel: float = DEFAULT_COV_STEEL,
+        **kwargs,
+    ) -> ReliabilityProblem:
+        """Problem on materials of the historical library (HistoricalMaterialLibrary).
+
+        sigma_c28 (fck) and sigma_sn (fyk) of the library are taken as characteristic
+        values; for TA the library allowable stresses sigma_c (fcd) and sigma_s (fyd)
+        are used.
+        """
+        if library is None:
+            from historical_materials import HistoricalMaterialLibrary
+
+            library = HistoricalMaterialLibrary()
+        concrete = library.find_by_code(concrete_code)
+        steel = library.find_by_code(steel_code)
+        if concrete is None or steel is None:
+            missing = concrete_code if concrete is None else steel_code
+            raise KeyError(f"historical material {missing!r} not found")
+        material = MaterialProperties(
+            fck=concrete.fck,
+            Ec=concrete.Ec,
+            fyk=steel.fyk,
+            Es=steel.Es or 2100000.0,
+            n=concrete.n,
+        )
+        if method.upper() == "TA":
+            kwargs.setdefault("sigma_c_adm", concrete.fcd)
+            kwargs.setdefault("sigma_s_adm", steel.fyd)
+        kwargs.setdefault(
+            "sigma_c28", RandomVariable.from_characteristic(concrete.fck, cov_concrete)
+        )
+        kwargs.setdefault("fyk", RandomVariable.from_characteristic(steel.fyk, cov_steel))
+        return cls(method=method, material=material, **kwargs)
+
+    def safety_factors(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        """Sample `size` members and return their safety factors."""
+        strength_c = self.sigma_c28.sample(rng, size) / self.material.fck
+        strength_s = self.fyk.sample(rng, size) / self.material.fyk
+        cover = self.cover_variable.sample(rng, size)
+        area = self.bar_area.sample(rng, size)
+        sigma_c = self.sigma_c_adm * strength_c
+        sigma_s = self.sigma_s_adm * strength_s
+        As, As_prime = self.As * area, self.As_prime * area
+        if self.method == "TA":
+            n = self.material.n or 15.0
+            _, capacity, _ = ta_admissible_moment(
+                self.b, self.h, As, As_prime, cover, n, sigma_c, sigma_s
+            )
+        else:
+            _, capacity, _ = slu_resisting_moment(
+                self.b, self.h, As, As_prime, cover, sigma_c, sigma_s, self.material.Es, self.N
+            )
+            # No equilibrium under N: the section fails
+            capacity = np.nan_to_num(capacity, nan=0.0)
+        with np.errstate(divide="ignore"):
+            return capacity / abs(self.M) if self.M else np.full(size, np.inf)
+
+
+def _chunk_safety_factors(
+    problem: ReliabilityProblem, seed: np.random.SeedSequence, size: int
+) -> np.ndarray:
+    return problem.safety_factors(np.random.default_rng(seed), size)
+
+
+@dataclass
+class ReliabilityResult:
+    """Failure probability, reliability index and convergence diagnostics."""
+
+    n_samples: int
+    n_failures: int
+    history_n: np.ndarray  # cumulative samples after each chunk
+    history_pf: np.ndarray  # running estimate of pf after each chunk
+    safety_factor_mean: float
+    safety_factor_std: float
+    safety_factor_percentiles: dict[float, float]
+    lognormal_beta: float  # mean / std of ln FS (second-moment estimate)
+    samples: np.ndarray | None = field(default=None, repr=False)
+
+    @property
+    def pf(self) -> float:
+        return self.n_failures / self.n_samples
+
+    @property
+    def beta(self) -> float:
+        """Reliability index -Phi^-1(pf) (inf when no sample failed)."""
+        return _beta(self.pf)
+
+    @property
+    def pf_std(self) -> float:
+        return math.sqrt(self.pf * (1.0 - self.pf) / self.n_samples)
+
+    @property
+    def pf_cov(self) -> float:
+        """Coefficient of variation of the pf estimate (inf without failures)."""
+        return self.pf_std / self.pf if self.n_failures else math.inf
+
+    def pf_interval(self, confidence: float = 0.95) -> tuple[float, float]:
+        """Wilson score interval of pf."""
+        z = _NORMAL.inv_cdf(0.5 + 0.5 * confidence)
+        n, p = self.n_samples, self.pf
+        centre = (p + z * z / (2 * n)) / (1 + z * z / n)
+        half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / (1 + z * z / n)
+        return max(centre - half, 0.0), min(centre + half, 1.0)
+
+    def beta_interval(self, confidence: float = 0.95) -> tuple[float, float]:
+        lo, hi = self.pf_interval(confidence)
+        return _beta(hi), _beta(lo)
+
+    def converged(self, target_cov: float = 0.1) -> bool:
+        return self.pf_cov <= target_cov
+
+    def samples_for_cov(self, target_cov: float = 0.1) -> float:
+        """Samples needed for the pf estimate to reach `target_cov`."""
+        if not self.n_failures:
+            return math.inf
+        return (1.0 - self.pf) / (self.pf * target_cov**2)
+
+
+def _beta(pf: float) -> float:
+    if pf <= 0.0:
+        return math.inf
+    if pf >= 1.0:
+        return -math.inf
+    return -_NORMAL.inv_cdf(pf)
+
+
+def run_monte_carlo(
+    problem: ReliabilityProblem,
+    n_samples: int = 100_000,
+    *,
+    seed: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK,
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+    keep_samples: bool = False,
+    percentiles: Sequence[float] = (0.1, 1.0, 5.0, 50.0),
+) -> ReliabilityResult:
+    """Monte Carlo estimate of the failure probability of `problem`.
+
+    Chunks run in this process unless `max_workers` > 1 (a process pool is
+    created for the call) or an `executor` is given.
+    """
+    sizes = [min(chunk_size, n_samples - start) for start in range(0, n_samples, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    own_pool = executor is None and max_workers is not None and max_workers > 1
+    pool = ProcessPoolExecutor(max_workers=max_workers) if own_pool else executor
+    try:
+        if pool is None:
+            chunks = [_chunk_safety_factors(problem, s, n) for s, n in zip(seeds, sizes)]
+        else:
+            chunks = list(pool.map(_chunk_safety_factors, [problem] * len(sizes), seeds, sizes))
+    finally:
+        if own_pool:
+            pool.shutdown()
+
+    failures = np.array([np.count_nonzero(c < 1.0) for c in chunks])
+    history_n = np.cumsum(sizes)
+    fs = np.concatenate(chunks)
+    finite = fs[np.isfinite(fs)]
+    log_fs = np.log(np.maximum(finite, 1e-300))
+    log_std = float(log_fs.std()) if finite.size > 1 else 0.0
+    return ReliabilityResult(
+        n_samples=n_samples,
+        n_failures=int(failures.sum()),
+        history_n=history_n,
+        history_pf=np.cumsum(failures) / history_n,
+        safety_factor_mean=float(finite.mean()) if finite.size else math.inf,
+        safety_factor_std=float(finite.std()) if finite.size else 0.0,
+        safety_factor_percentiles={
+            float(q): float(v) for q, v in zip(percentiles, np.percentile(fs, percentiles))
+        },
+        lognormal_beta=float(log_fs.mean()) / log_std if log_std > 0 else math.inf,
+        samples=fs if keep_samples else None,
+    )
+
+
+def with_demand(problem: ReliabilityProblem, M: float, N: float | None = None):
+    """Same member under another load case (the sampled variables are kept)."""
+    return replace(problem, M=M, N=problem.N if N is None else N)
@@ -0,0 +1,248 @@
+"""Shear checks and stirrup design of rectangular RC sections, computed on whole
+columns of rows.
+
+Port of Taglio (PrincipCA_TA.bas, 6.) for rectangular sections. The VB routine
+handles one section at a time; here every argument is broadcast to a NumPy array
+with one entry per row (beam, load combination), so the shear of a whole
+building joins the bending run as a single call.
+
+- Allowable stresses (TA): tau_max from Jourawski on the cracked homogenized
+  section (tau_max = V / (b z), z = I_cr / S_cr), compared with tau_c0 (no
+  specific shear reinforcement needed) and tau_c1 (section to be redesigned).
+  Above tau_c0 the stirrups take the whole sliding force.
+- Limit states (SLU, NTC 2008/2018): VRd,c of members without shear
+  reinforcement, web crushing VRcd and stirrup resistance VRsd with the
+  variable strut inclination method.
+
+Both paths return the regulatory maximum stirrup spacing, the required stirrup
+area per unit length and the spacing it implies (capped at the regulatory one).
+Conventions as in verification_core: lengths [cm], forces [kg], stresses
+[kg/cm²], N > 0 tension; `b` is the web width orthogonal to the shear, `d` the
+effective depth along it. Angles are in degrees: theta is the strut, alpha the
+stirrup inclination on the member axis.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from .abachi import get_abaco
+
+KGCM2_TO_MPA = 0.0980665
+CODES = ("2008", "2018")
+
+
+@dataclass
+class ShearBatchResult:
+    """Arrays of Taglio results, one entry per row."""
+
+    tau_max: np.ndarray  # TA: Jourawski maximum; SLU: nominal V / (b * 0.9 d)
+    resistance: np.ndarray  # TA: nan; SLU: VRd (VRd,c where no stirrups are needed)
+    strut_resistance: np.ndarray  # TA: nan; SLU: VRcd (web crushing)
+    asw_required: np.ndarray  # required stirrup area per unit length [cm²/cm]
+    spacing_required: np.ndarray  # spacing for the given stirrup, capped at spacing_max
+    spacing_max: np.ndarray  # regulatory maximum spacing
+    sigma_sw: np.ndarray  # TA: stirrup stress with the given spacing; SLU: nan
+    needs_stirrups: np.ndarray
+    redesign: np.ndarray  # tau_max > tau_c1 (TA) or |V| > VRcd (SLU)
+    verified: np.ndarray
+
+
+def allowable_shear_stresses(rck):
+    """(tau_c0, tau_c1) [kg/cm²] of DM 14/02/1992 from Rck [kg/cm²].
+
+    Read from the dm92_tensioni_ammissibili abaco. Outside its Rck range the
+    linear DM92 formulas are extrapolated rather than clamped, so weaker
+    historical concretes (e.g. R120) get lower allowable stresses.
+    """
+    abaco = get_abaco("dm92_tensioni_ammissibili")
+    rck = np.asarray(rck, dtype=float)
+    tau_c0, tau_c1 = abaco.evaluate(rck, names=["tau_c0", "tau_c1"])
+    outside = (rck < abaco.x[0]) | (rck > abaco.x[-1])
+    tau_c0 = np.where(outside, 4.0 + (rck - 150.0) / 75.0, tau_c0)
+    tau_c1 = np.where(outside, 14.0 + (rck - 150.0) / 35.0, tau_c1)
+    return tau_c0[()], tau_c1[()]
+
+
+def stirrup_area(diameter, legs=2):
+    """Area of one stirrup with `legs` legs of the given diameter [cm]."""
+    return np.asarray(legs, dtype=float) * np.pi * np.asarray(diameter, dtype=float) ** 2 / 4.0
+
+
+def cracked_lever_arm(b, d, As_tensile, As_compressed=0.0, a_compressed=0.0, n_homog=15.0):
+    """Internal lever arm z = I_cr / S_cr of the cracked section in pure bending.
+
+    S_cr is the static moment of the tensile bars about the neutral axis, which
+    equals that of the compressed zone: Jourawski's tau is maximum there.
+    """
+    b, d, As, Asc, a2, n = np.broadcast_arrays(
+        *(
+            np.asarray(v, dtype=float)
+            for v in (b, d, As_tensile, As_compressed, a_compressed, n_homog)
+        )
+    )
+    # b x²/2 + n As' (x - a') - n As (d - x) = 0
+    p = n * (As + Asc)
+    q = n * (As * d + Asc * a2)
+    x = (-p + np.sqrt(p**2 + 2.0 * b * q)) / b
+    I_cr = b * x**3 / 3.0 + n * Asc * (x - a2) ** 2 + n * As * (d - x) ** 2
+    S_cr = n * As * (d - x)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = np.where(S_cr > 0.0, I_cr / S_cr, 0.9 * d)
+    return z
+
+
+def _floor_spacing(*limits):
+    """Int(Min(...)) of the VB, ignoring NaN limits (e.g. unknown bar diameters)."""
+    return np.floor(np.fmin.reduce(np.broadcast_arrays(*limits)))
+
+
+def shear_ta_batch(
+    V,
+    b,
+    d,
+    As_tensile,
+    As_compressed=0.0,
+    a_compressed=0.0,
+    n_homog=15.0,
+    *,
+    tau_c0,
+    tau_c1,
+    sigma_sw_allow,
+    stirrup_diameter,
+    stirrup_step=0.0,
+    legs=2,
+    theta=45.0,
+    alpha=90.0,
+    column=False,
+    phi_long_min=np.nan,
+) -> ShearBatchResult:
+    """TA branch of Taglio. `stirrup_step` <= 0 means design mode (no given spacing)."""
+    z = cracked_lever_arm(b, d, As_tensile, As_compressed, a_compressed, n_homog)
+    V, b, d, z, tc0, tc1, sfa, step, column = np.broadcast_arrays(
+        *(
+            np.asarray(v, dtype=float)
+            for v in (V, b, d, z, tau_c0, tau_c1, sigma_sw_allow, stirrup_step, column)
+        )
+    )
+    asw = stirrup_area(stirrup_diameter, legs)
+    th, al = np.radians(theta), np.radians(alpha)
+    # sin(theta) / sin(theta + alpha): reciprocal of torsion's cot_sum_sin
+    incl = np.sin(th) / np.sin(np.pi - th - al)
+
+    tau = np.abs(V) / (b * z)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s_beam = _floor_spacing(33.3, 0.8 * d, 1000.0 * asw / b)
+    s_column = _floor_spacing(25.0, 15.0 * np.asarray(phi_long_min, dtype=float))
+    spacing_max = np.where(column.astype(bool), s_column, s_beam)
+
+    needs = tau > tc0
+    redesign = tau > tc1
+    # Sliding force per unit length taken entirely by the stirrups
+    asw_required = np.where(needs, b * tau * incl / sfa, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        spacing_required = np.where(needs, np.fmin(asw / asw_required, spacing_max), spacing_max)
+        sigma_sw = np.where(needs & (step > 0.0), step * b * tau * incl / asw, 0.0)
+    provided = (step > 0.0) & (asw > 0.0)
+    verified = ~redesign & (~needs | (provided & (sigma_sw <= sfa)))
+    return ShearBatchResult(
+        tau_max=tau,
+        resistance=np.full_like(tau, np.nan),
+        strut_resistance=np.full_like(tau, np.nan),
+        asw_required=asw_required,
+        spacing_required=spacing_required,
+        spacing_max=spacing_max,
+        sigma_sw=sigma_sw,
+        needs_stirrups=needs,
+        redesign=redesign,
+        verified=verified,
+    )
+
+
+def shear_slu_batch(
+    V,
+    N,
+    b,
+    h,
+    d,
+    As_long,
+    *,
+    fck,
+    fcd,
+    fywd,
+    stirrup_diameter,
+    stirrup_step=0.0,
+    legs=2,
+    theta=45.0,
+    alpha=90.0,
+    gamma_c=1.5,
+    column=False,
+    phi_long_min=np.nan,
+    code="2008",
+) -> ShearBatchResult:
+    """SLU branch of Taglio (non dissipative structures). `fck`, `fcd`, `fywd` in
+    [kg/cm²]; `stirrup_step` <= 0 means design mode."""
+    if code not in CODES:
+        raise ValueError(f"Unknown code '{code}', expected one of {CODES}")
+    V, N, b, h, d, As, fck, fcd, fywd, step, column = np.broadcast_arrays(
+        *(
+            np.asarray(v, dtype=float)
+            for v in (V, N, b, h, d, As_long, fck, fcd, fywd, stirrup_step, column)
+        )
+    )
+    asw = stirrup_area(stirrup_diameter, legs)
+    th, al = np.radians(theta), np.radians(alpha)
+    cot_t = 1.0 / np.tan(th)
+    cot_a = np.where(np.isclose(al, np.pi / 2.0), 0.0, 1.0 / np.tan(al))
+    Ac = b * h
+    V = np.abs(V)
+
+    # Members without shear reinforcement (VRd,c); the VB formulas are in MPa/mm
+    sig_cp = np.where(N < 0.0, np.minimum(-N / Ac, 0.2 * fcd), 0.0)
+    rho_l = np.minimum(As / (b * d), 0.02)
+    k = np.minimum(1.0 + np.sqrt(200.0 / (10.0 * d)), 2.0)  # d in mm, k <= 2
+    fck_mpa = fck * KGCM2_TO_MPA
+    v_min = 0.035 * k**1.5 * np.sqrt(fck_mpa) / KGCM2_TO_MPA
+    v = 0.18 * k * np.cbrt(100.0 * rho_l * fck_mpa) / gamma_c / KGCM2_TO_MPA
+    V_rdc = (np.maximum(v, v_min) + 0.15 * sig_cp) * b * d
+
+    # Web crushing (VRcd) with the compression coefficient alpha_c
+    s = -N / Ac
+    alpha_c = np.select(
+        [s <= 0.0, s < 0.25 * fcd, s < 0.5 * fcd, s < fcd],
+        [1.0, 1.0 + s / fcd, 1.25, 2.5 * (1.0 - s / fcd)],
+        0.0,
+    )
+    V_rcd = 0.9 * b * d * alpha_c * 0.5 * fcd * (cot_t + cot_a) * np.sin(th) ** 2
+    # Stirrups (VRsd) per unit of Asw/s
+    unit = 0.9 * d * fywd * (cot_t + cot_a) * np.sin(al)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s_beam = [33.3, 0.8 * d, 100.0 * asw / (0.15 * b)]
+        if code == "2018":
+            s_beam.append(15.0 * np.asarray(phi_long_min, dtype=float))
+        s_beam = _floor_spacing(*s_beam)
+        s_column = _floor_spacing(25.0, 12.0 * np.asarray(phi_long_min, dtype=float))
+        spacing_max = np.where(column.astype(bool), s_column, s_beam)
+
+        needs = V > V_rdc
+        redesign = V > V_rcd
+        asw_required = np.where(needs, V / unit, 0.0)
+        spacing_required = np.where(needs, np.fmin(asw / asw_required, spacing_max), spacing_max)
+        V_rsd = np.where(step > 0.0, unit * asw / step, 0.0)
+    V_rd = np.where(needs, np.minimum(V_rsd, V_rcd), V_rdc)
+    verified = ~needs | (V <= V_rd)
+    return ShearBatchResult(
+        tau_max=V / (0.9 * b * d),
+        resistance=V_rd,
+        strut_resistance=V_rcd,
+        asw_required=asw_required,
+        spacing_required=spacing_required,
+        spacing_max=spacing_max,
+        sigma_sw=np.full_like(V, np.nan),
+        needs_stirrups=needs,
+        redesign=redesign,
+        verified=verified,
+    )
@@ -0,0 +1,51 @@
+"""Bracketed root finders shared by the section solvers."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import numpy as np
+
+
+def safeguarded_newton(
+    func: Callable[[np.ndarray], tuple[np.ndarray, np.ndarray]],
+    lo: np.ndarray,
+    hi: np.ndarray,
+    x0: np.ndarray,
+    *,
+    tol: np.ndarray | float,
+    max_iter: int = 50,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized Newton iteration kept inside a sign-change bracket [lo, hi].
+
+    `func(x)` returns (f, df/dx) for an array of unknowns. Steps leaving the
+    bracket, or with a null derivative, fall back to bisection. Returns
+    (x, converged, iterations); entries without a sign change in the initial
+    bracket are returned as not converged.
+    """
+    lo = np.array(lo, dtype=float)
+    hi = np.array(hi, dtype=float)
+    x = np.clip(np.array(x0, dtype=float), np.minimum(lo, hi), np.maximum(lo, hi))
+    f_lo = func(lo)[0]
+    f_hi = func(hi)[0]
+    valid = f_lo * f_hi <= 0.0
+    f, df = func(x)
+    converged = valid & (np.abs(f) <= tol)
+    iterations = np.zeros(x.shape, dtype=int)
+    for _ in range(max_iter):
+        active = valid & ~converged
+        if not active.any():
+            break
+        iterations += active
+        # Shrink the bracket around the current iterate
+        same_as_lo = np.sign(f) == np.sign(f_lo)
+        lo = np.where(active & same_as_lo, x, lo)
+        f_lo = np.where(active & same_as_lo, f, f_lo)
+        hi = np.where(active & ~same_as_lo, x, hi)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = np.where(df != 0.0, x - f / df, np.nan)
+        inside = (step - lo) * (step - hi) < 0.0
+        x = np.where(active, np.where(inside, step, 0.5 * (lo + hi)), x)
+        f, df = func(x)
+        converged = valid & (np.abs(f) <= tol)
+    return x, converged, iterations
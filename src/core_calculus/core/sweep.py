@@ -0,0 +1,204 @@
+"""Parametric sweeps for design charts (admissible / resisting moment of
+rectangular sections over grids of b, h, As, n, allowable stresses, ...).
+
+The full Cartesian product of the parameter grids is evaluated in chunks of
+`chunk_size` points: each chunk builds its parameter columns from the flat point
+indices (np.unravel_index) and runs a vectorized kernel, so the memory of the
+intermediates is bounded by the chunk while only the outputs are kept for the
+whole sweep. Input columns are rebuilt on demand from the grids.
+
+Kernels (conventions of verification_core: lengths [cm], forces [kg], moments
+[kg·cm], stresses [kg/cm²]; bars at `cover` from the edges, d = h - cover):
+
+- "TA": admissible moment of the cracked homogenized section in simple bending,
+  M_adm = min(sigma_c_adm / sigma_c(M=1), sigma_s_adm / sigma_s(M=1)), with the
+  neutral axis and unit stresses of the batch TA kernels.
+- "SLU": resisting moment under N with the 0.8 x stress block at fcd and
+  elastic-perfectly plastic bars (the model of the deviated-bending solver),
+  about mid-height; rows whose equilibrium has no solution are NaN.
+
+Defaults for the material parameters come from the engine of the method
+(`VerificationEngine.get_allowable_stresses`) when a MaterialProperties is given;
+any of them can also be swept.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from .solvers import safeguarded_newton
+from .verification_core import (
+    MaterialProperties,
+    _deviated_axial_residual,
+    calculate_neutral_axis_simple_bending_batch,
+    calculate_stresses_simple_bending_batch,
+)
+from .verification_engine import VerificationEngine
+
+DEFAULT_CHUNK = 1 << 18
+
+_COMMON = {"b": None, "h": None, "As": None, "As_prime": 0.0, "cover": 4.0}
+PARAMETERS = {
+    "TA": {**_COMMON, "n": None, "sigma_c_adm": None, "sigma_s_adm": None},
+    "SLU": {**_COMMON, "fcd": None, "fyd": None, "Es": None, "N": 0.0, "eps_cu": 0.0035},
+}
+OUTPUTS = {
+    "TA": ("x", "M_adm", "concrete_governs"),
+    "SLU": ("x", "M_rd", "converged"),
+}
+
+
+def ta_admissible_moment(b, h, As, As_prime, cover, n, sigma_c_adm, sigma_s_adm):
+    """Admissible moment [kg·cm] of TA simple bending; returns (x, M_adm, concrete_governs)."""
+    d = np.asarray(h, dtype=float) - cover
+    x = calculate_neutral_axis_simple_bending_batch(b, h, As, d, As_prime, cover, n=n)
+    sc, _, ss_t, ss_c = calculate_stresses_simple_bending_batch(
+        b, As, d, As_prime, cover, 1.0, x, n=n
+    )
+    with np.errstate(divide="ignore"):
+        m_c = np.where(sc > 0.0, sigma_c_adm / sc, np.inf)
+        ss = np.maximum(ss_t, ss_c)
+        m_s = np.where(ss > 0.0, sigma_s_adm / ss, np.inf)
+    return x, np.minimum(m_c, m_s), m_c <= m_s
+
+
+def slu_resisting_moment(b, h, As, As_prime, cover, fcd, fyd, Es, N=0.0, eps_cu=0.0035):
+    """Resisting moment [kg·cm] under N; returns (x, M_rd, converged)."""
+    b, h, As, As_prime, cover, fcd, fyd, Es, N, eps_cu = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (b, h, As, As_prime, cover, fcd, fyd, Es, N, eps_cu))
+    )
+    layers = ((As_prime, cover), (As, h - cover))
+
+    def residual(x):
+        return _deviated_axial_residual(x, b, fcd, fyd, Es, eps_cu, layers, N)
+
+    lo, hi = np.full(b.shape, 1e-6), 0.999 * h
+    x, converged, _ = safeguarded_newton(
+        residual, lo, hi, 0.5 * (lo + hi), tol=1e-6 * np.maximum(b * h * fcd, 1.0), max_iter=60
+    )
+    moment = 0.8 * b * fcd * x * (0.5 * h - 0.4 * x)
+    for area, depth in layers:
+        sigma = np.clip(Es * eps_cu * (x - depth) / x, -fyd, fyd)
+        moment = moment + area * sigma * (0.5 * h - depth)
+    return x, np.where(converged, moment, np.nan), converged
+
+
+_KERNELS = {"TA": ta_admissible_moment, "SLU": slu_resisting_moment}
+
+
+@dataclass
+class SweepResult:
+    """Outputs of a sweep over the Cartesian product of `axes` (C order)."""
+
+    method: str
+    axes: dict[str, np.ndarray]  # swept parameters, in product order
+    fixed: dict[str, float]  # parameters held constant
+    outputs: dict[str, np.ndarray]  # flat arrays, one entry per point
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return tuple(v.size for v in self.axes.values())
+
+    def __len__(self) -> int:
+        return int(np.prod(self.shape, dtype=np.int64))
+
+    def column(self, name: str, start: int = 0, stop: int | None = None) -> np.ndarray:
+        """Flat column of an input or output for the points [start, stop)."""
+        stop = len(self) if stop is None else stop
+        if name in self.outputs:
+            return self.outputs[name][start:stop]
+        if name in self.axes:
+            k = list(self.axes).index(name)
+            index = np.unravel_index(np.arange(start, stop), self.shape)[k]
+            return self.axes[name][index]
+        if name in self.fixed:
+            return np.full(stop - start, self.fixed[name])
+        raise KeyError(name)
+
+    def grid(self, name: str) -> np.ndarray:
+        """Output reshaped on the grid: one dimension per swept parameter."""
+        return self.outputs[name].reshape(self.shape)
+
+    def to_csv(self, path: str | Path, chunk_size: int = DEFAULT_CHUNK) -> Path:
+        """Write inputs and outputs, one row per point, in chunks (flags as 0/1)."""
+        path = Path(path)
+        names = [*self.axes, *self.fixed, *self.outputs]
+        with path.open("w", encoding="utf-8") as f:
+            f.write(",".join(names) + "\n")
+            for start in range(0, len(self), chunk_size):
+                stop = min(start + chunk_size, len(self))
+                rows = np.column_stack([self.column(name, start, stop) for name in names])
+                np.savetxt(f, rows.astype(float), fmt="%.10g", delimiter=",")
+        return path
+
+    def save_npz(self, path: str | Path) -> Path:
+        """Axes and gridded outputs as arrays (np.load(path)["M_adm"], ...)."""
+        path = Path(path)
+        np.savez(
+            path,
+            **{f"axis_{k}": v for k, v in self.axes.items()},
+            **{k: self.grid(k) for k in self.outputs},
+        )
+        return path
+
+
+def _material_defaults(method: str, material: MaterialProperties | None) -> dict[str, float]:
+    if material is None:
+        return {}
+    sigma_c, sigma_s = VerificationEngine(method).get_allowable_stresses(material)
+    if method == "TA":
+        return {"n": material.n or 15.0, "sigma_c_adm": sigma_c, "sigma_s_adm": sigma_s}
+    return {"fcd": sigma_c, "fyd": sigma_s, "Es": material.Es}
+
+
+def sweep_design_chart(
+    method: str,
+    grids: Mapping[str, object],
+    *,
+    material: MaterialProperties | None = None,
+    fixed: Mapping[str, float] | None = None,
+    chunk_size: int = DEFAULT_CHUNK,
+) -> SweepResult:
+    """Evaluate the `method` kernel ("TA" or "SLU") on the product of `grids`.
+
+    `grids` maps parameter names to 1-D value arrays (the product is taken in
+    their order); `fixed` sets constant parameters. Parameters not given fall
+    back to the material defaults of the engine, then to the kernel defaults.
+    """
+    method = method.upper()
+    if method not in _KERNELS:
+        raise ValueError(f"unknown sweep method {method!r}")
+    params = PARAMETERS[method]
+    axes = {k: np.atleast_1d(np.asarray(v, dtype=float)).ravel() for k, v in grids.items()}
+    constants = {k: v for k, v in params.items() if v is not None}
+    constants.update(_material_defaults(method, material))
+    constants.update(fixed or {})
+    unknown = (set(axes) | set(constants)) - set(params)
+    if unknown:
+        raise ValueError(f"unknown {method} sweep parameters: {sorted(unknown)}")
+    for k in axes:
+        constants.pop(k, None)
+    missing = set(params) - set(axes) - set(constants)
+    if missing:
+        raise ValueError(f"missing {method} sweep parameters: {sorted(missing)}")
+
+    result = SweepResult(method, axes, {k: float(v) for k, v in constants.items()}, {})
+    total = len(result)
+    outputs = {name: None for name in OUTPUTS[method]}
+    kernel = _KERNELS[method]
+    for start in range(0, total, chunk_size):
+        stop = min(start + chunk_size, total)
+        args = {
+            name: result.column(name, start, stop) if name in axes else result.fixed[name]
+            for name in params
+        }
+        for name, values in zip(outputs, kernel(**args)):
+            if outputs[name] is None:
+                outputs[name] = np.empty(total, dtype=np.asarray(values).dtype)
+            outputs[name][start:stop] = values
+    result.outputs = outputs
+    return result
@@ -0,0 +1,286 @@
+"""Torsion checks and reinforcement of rectangular RC sections, computed on whole
+columns of rows.
+
+Port of Torsione (PrincipCA_TA.bas, 7.) for rectangular sections. The section
+constants (thin-walled tube of Bredt through the longitudinal bars, effective
+wall thickness, Psi coefficient of the TA maximum stress and the Saint-Venant
+constant) depend on the section only: they are computed once per section and
+cached, while the demands of all rows are processed as NumPy arrays.
+
+- Allowable stresses (TA): tau_max = Psi |T| / (a b²) compared with tau_c0
+  and tau_c1 (x 1.1 with concurrent shear); in between, the longitudinal bars
+  and the stirrups take the torque over the tube.
+- Limit states (SLU): Mtu = min(Mtu1, Mtu2, Mtu3) of the longitudinal bars,
+  the stirrups and the concrete struts.
+- Shear and torsion together: the stirrups take the sum of the two demands and
+  (SLU) the struts are checked with T / Mtu3 + V / VRcd <= 1.
+
+Conventions as in shear.py: lengths [cm], torque T [kg·cm], stresses
+[kg/cm²], angles in degrees. The stirrup area is that of one leg, the one
+crossing each wall of the tube.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+SHEAR_TAU_C1_FACTOR = 1.1
+
+
+@dataclass(frozen=True)
+class TorsionSectionConstants:
+    """Torsion constants of a rectangular section b x h.
+
+    `delta` is the distance of the longitudinal bar axes from the edges.
+    """
+
+    b: float
+    h: float
+    delta: float
+    J: float  # Saint-Venant torsion constant [cm^4]
+    tau_factor: float  # Psi / (a * b_min²): TA tau_max = tau_factor * |T|
+    A: float  # area enclosed by the tube through the bars
+    p: float  # perimeter of that area
+    t: float  # effective wall thickness, Asez / Psez but at least 2 delta
+
+
+@lru_cache(maxsize=1024)
+def rectangular_torsion_constants(b: float, h: float, delta: float) -> TorsionSectionConstants:
+    """Constants of a b x h rectangle (cached by dimensions)."""
+    bb, aa = min(b, h), max(b, h)
+    psi = 3.0 + 2.6 / (0.45 + aa / bb)
+    ratio = bb / aa
+    J = bb * aa**3 * (1.0 / 3.0 - 0.21 * ratio * (1.0 - bb**4 / (12.0 * aa**4)))
+    b1, h1 = max(b - 2.0 * delta, 0.0), max(h - 2.0 * delta, 0.0)
+    return TorsionSectionConstants(
+        b=b,
+        h=h,
+        delta=delta,
+        J=max(J, 1e-6),
+        tau_factor=psi / (aa * bb**2),
+        A=b1 * h1,
+        p=2.0 * (b1 + h1),
+        t=max(b * h / (2.0 * (b + h)), 2.0 * delta),
+    )
+
+
+_CONSTANTS_BY_SECTION: dict[str, TorsionSectionConstants] = {}
+
+
+def torsion_constants_for(
+    section_id: str, b: float, h: float, delta: float
+) -> TorsionSectionConstants:
+    """Constants of section `section_id`, recomputed only when its dimensions change."""
+    cached = _CONSTANTS_BY_SECTION.get(section_id)
+    if cached is None or (cached.b, cached.h, cached.delta) != (b, h, delta):
+        cached = rectangular_torsion_constants(float(b), float(h), float(delta))
+        if section_id:
+            _CONSTANTS_BY_SECTION[section_id] = cached
+    return cached
+
+
+def clear_torsion_cache() -> None:
+    _CONSTANTS_BY_SECTION.clear()
+    rectangular_torsion_constants.cache_clear()
+
+
+@dataclass
+class TorsionBatchResult:
+    """Arrays of Torsione results, one entry per row."""
+
+    tau_max: np.ndarray  # TA: Psi |T| / (a b²); SLU: nan
+    resistance: np.ndarray  # TA: nan; SLU: Mtu with the given reinforcement
+    strut_resistance: np.ndarray  # TA: nan; SLU: Mtu3 (concrete struts)
+    al_required: np.ndarray  # longitudinal torsion reinforcement [cm²]
+    spacing_required: np.ndarray  # stirrup spacing for the given leg area [cm]
+    sigma_long: np.ndarray  # TA: stress in the given longitudinal bars; SLU: nan
+    sigma_stirrup: np.ndarray  # TA: stress in the given stirrups; SLU: nan
+    needs_reinforcement: np.ndarray
+    redesign: np.ndarray  # tau_max > tau_c1 (TA) or |T| > Mtu3 (SLU)
+    verified: np.ndarray
+
+
+def _cot_sum_sin(theta, alpha):
+    """(theta [rad], sin(alpha) (cot(theta) + cot(alpha))) of the stirrup truss.
+
+    sin(pi - theta - alpha) / sin(theta) multiplies the torque a stirrup leg
+    carries; it is the reciprocal of the `incl` factor of shear.py, which
+    multiplies the stirrup demand instead. Both are 1 at theta = 45, alpha = 90.
+    """
+    th, al = np.radians(theta), np.radians(alpha)
+    return th, np.sin(np.pi - th - al) / np.sin(th)
+
+
+def torsion_ta_batch(
+    T,
+    *,
+    tau_factor,
+    A,
+    p,
+    tau_c0,
+    tau_c1,
+    sigma_fa,
+    stirrup_leg_area,
+    stirrup_step=0.0,
+    Al=0.0,
+    with_shear=False,
+    theta=45.0,
+    alpha=90.0,
+) -> TorsionBatchResult:
+    """TA branch of Torsione. Zero `Al` or `stirrup_step` means design mode."""
+    T, tf, A, p, tc0, tc1, sfa, asw, step, Al, with_shear = np.broadcast_arrays(
+        *(
+            np.asarray(v, dtype=float)
+            for v in (
+                T,
+                tau_factor,
+                A,
+                p,
+                tau_c0,
+                tau_c1,
+                sigma_fa,
+                stirrup_leg_area,
+                stirrup_step,
+                Al,
+                with_shear,
+            )
+        )
+    )
+    th, cot_sum_sin = _cot_sum_sin(theta, alpha)
+    T = np.abs(T)
+    tau = tf * T
+    tc1 = np.where(with_shear.astype(bool), SHEAR_TAU_C1_FACTOR * tc1, tc1)
+    needs = tau > tc0
+    redesign = tau > tc1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        al_required = np.where(needs, T * p / (2.0 * A * sfa * np.tan(th)), 0.0)
+        spacing_required = np.where(needs, 2.0 * A * asw * sfa * cot_sum_sin / T, np.inf)
+        sigma_long = np.where(needs & (Al > 0.0), T * p / (2.0 * A * Al * np.tan(th)), 0.0)
+        sigma_stirrup = np.where(
+            needs & (step > 0.0), T * step / (2.0 * A * asw * cot_sum_sin), 0.0
+        )
+    provided = (Al > 0.0) & (step > 0.0) & (asw > 0.0)
+    verified = ~redesign & (~needs | (provided & (sigma_long <= sfa) & (sigma_stirrup <= sfa)))
+    nan = np.full_like(T, np.nan)
+    return TorsionBatchResult(
+        tau_max=tau,
+        resistance=nan,
+        strut_resistance=nan.copy(),
+        al_required=al_required,
+        spacing_required=spacing_required,
+        sigma_long=sigma_long,
+        sigma_stirrup=sigma_stirrup,
+        needs_reinforcement=needs,
+        redesign=redesign,
+        verified=verified,
+    )
+
+
+def torsion_slu_batch(
+    T,
+    *,
+    A,
+    p,
+    t,
+    fcd,
+    fyd,
+    stirrup_leg_area,
+    stirrup_step=0.0,
+    Al=0.0,
+    theta=45.0,
+    alpha=90.0,
+) -> TorsionBatchResult:
+    """SLU branch of Torsione. Zero `Al` or `stirrup_step` means design mode."""
+    T, A, p, t, fcd, fyd, asw, step, Al = np.broadcast_arrays(
+        *(
+            np.asarray(v, dtype=float)
+            for v in (T, A, p, t, fcd, fyd, stirrup_leg_area, stirrup_step, Al)
+        )
+    )
+    th, cot_sum_sin = _cot_sum_sin(theta, alpha)
+    T = np.abs(T)
+    mtu3 = 2.0 * A * t * (0.5 * fcd) * np.sin(th) * np.cos(th)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mtu1 = 2.0 * Al * fyd * A / p * np.tan(th)
+        mtu2 = np.where(step > 0.0, 2.0 * asw * fyd * A * cot_sum_sin / step, 0.0)
+        al_required = T * p / (2.0 * fyd * A * np.tan(th))
+        spacing_required = 2.0 * asw * fyd * A * cot_sum_sin / T
+    mtu = np.minimum(np.minimum(mtu1, mtu2), mtu3)
+    nan = np.full_like(T, np.nan)
+    return TorsionBatchResult(
+        tau_max=nan,
+        resistance=mtu,
+        strut_resistance=mtu3,
+        al_required=al_required,
+        spacing_required=spacing_required,
+        sigma_long=nan.copy(),
+        sigma_stirrup=nan.copy(),
+        needs_reinforcement=T > 0.0,
+        redesign=T > mtu3,
+        verified=T <= mtu,
+    )
+
+
+@dataclass
+class ShearTorsionBatchResult:
+    """Stirrups and struts shared by shear and torsion, one entry per row."""
+
+    asw_required: np.ndarray  # Asw/s of the whole stirrup, shear + torsion [cm²/cm]
+    asw_provided: np.ndarray  # Asw/s of the given stirrups (0 in design mode)
+    spacing_required: np.ndarray  # spacing of the given stirrup for the summed demand
+    interaction: np.ndarray  # SLU: T / Mtu3 + V / VRcd; TA: nan
+    verified: np.ndarray
+
+
+def shear_torsion_batch(
+    T,
+    shear_asw_required,
+    *,
+    A,
+    f_stirrup,
+    stirrup_leg_area,
+    stirrup_step=0.0,
+    shear_strut_utilization=None,
+    torsion_strut_resistance=None,
+    theta=45.0,
+    alpha=90.0,
+) -> ShearTorsionBatchResult:
+    """Combined check of two-leg closed stirrups under shear and torsion.
+
+    `shear_asw_required` is the Asw/s the shear check asks of the whole stirrup;
+    each leg also takes the torsion demand |T| / (2 A f cot_sum_sin) of its
+    wall (see `_cot_sum_sin`), so Asw/s >= (Asw/s)_V + 2 (Asw,leg/s)_T.
+    `f_stirrup` is sigma_fa (TA) or fyd (SLU). Given V / VRcd and Mtu3 the strut
+    interaction T / Mtu3 + V / VRcd <= 1 is checked too (SLU).
+    """
+    T, shear, A, f, asw, step = np.broadcast_arrays(
+        *(
+            np.asarray(v, dtype=float)
+            for v in (T, shear_asw_required, A, f_stirrup, stirrup_leg_area, stirrup_step)
+        )
+    )
+    _, cot_sum_sin = _cot_sum_sin(theta, alpha)
+    T = np.abs(T)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        torsion = np.where(T > 0.0, T / (2.0 * A * f * cot_sum_sin), 0.0)
+        required = shear + 2.0 * torsion
+        provided = np.where(step > 0.0, 2.0 * asw / step, 0.0)
+        spacing_required = np.where(required > 0.0, 2.0 * asw / required, np.inf)
+    verified = required <= provided * (1.0 + 1e-12)
+    if shear_strut_utilization is None or torsion_strut_resistance is None:
+        interaction = np.full_like(T, np.nan)
+    else:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            interaction = T / np.asarray(torsion_strut_resistance, dtype=float)
+        interaction = interaction + np.asarray(shear_strut_utilization, dtype=float)
+        verified = verified & (interaction <= 1.0)
+    return ShearTorsionBatchResult(
+        asw_required=required,
+        asw_provided=provided,
+        spacing_required=spacing_required,
+        interaction=interaction,
+        verified=verified,
+    )
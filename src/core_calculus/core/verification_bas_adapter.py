@@ -30,14 +30,9 @@ from core.verification_core import (
     SectionGeometry,
 )
 
-logger = logging.getLogger(__name__)
-
+from .torsion import rectangular_torsion_constants
 
-def _rectangular_Psi(aa: float, bb: float) -> float:
-    # Psi = 3 + 2.6 / (0.45 + aa/bb)  (from PrincipCA_TA.bas)
-    if bb == 0:
-        return 3.0
-    return 3.0 + 2.6 / (0.45 + aa / bb)
+logger = logging.getLogger(__name__)
 
 
 def _area_and_perimeter(sec: SectionGeometry, delta: float) -> tuple[float, float, float, float]:
@@ -196,16 +191,16 @@ def bas_torsion_verification(
         results.update({"messages": ["Mx = 0 -> torsion not active"], "ok": True})
         return results
 
-    A, p, B, H = _area_and_perimeter(section, Delta)
-
-    if B <= H:
-        aa = H
-        bb = B
+    if min(section.width, section.height) > 0:
+        # Full port with cached section constants in core.torsion
+        constants = rectangular_torsion_constants(
+            float(section.width), float(section.height), Delta
+        )
+        A, p = constants.A, constants.p
+        Taux_max = constants.tau_factor * abs(Mx)
     else:
-        aa = B
-        bb = H
-    Psi = _rectangular_Psi(aa, bb)
-    Taux_max = Psi * abs(Mx) / (aa * bb**2) if aa * bb**2 != 0 else 0.0
+        A, p, _, _ = _area_and_perimeter(section, Delta)
+        Taux_max = 0.0
 
     results["Taux_max"] = Taux_max
     results["A"] = A
@@ -14,11 +14,16 @@ The calculations are organized by verification type and follow the formulas from
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import StrEnum
 
+import numpy as np
+
 from core_models.materials import Material
 
+from .solvers import safeguarded_newton
+from .torsion import rectangular_torsion_constants
+
 
 class VerificationType(StrEnum):
     """Types of structural verification."""
@@ -158,6 +163,8 @@ class NeutralAxis:
     x: float = 0.0  # Distance from top edge [cm]
     y: float = 0.0  # Coordinate y (for deviated bending) [cm]
     inclination: float = 0.0  # Inclination angle [degrees]
+    iterations: int = 0  # Solver iterations (iterative neutral axis only)
+    converged: bool = True  # False when the equilibrium has no root in the section
 
     def depth_ratio(self, section_height: float) -> float:
         """Ratio of neutral axis depth to section height."""
@@ -211,6 +218,172 @@ class VerificationResult:
             self.messages = []
 
 
+@dataclass
+class BatchVerificationResult:
+    """Column-wise verification result for a batch of rows.
+
+    Every attribute is a 1-D array with one entry per input row; messages are
+    only collected for rows that went through the scalar fallback path.
+    """
+
+    verification_type: np.ndarray  # VerificationType values (dtype=object)
+    neutral_axis_x: np.ndarray  # [cm]
+    neutral_axis_inclination: np.ndarray  # [degrees]
+    sigma_c_max: np.ndarray
+    sigma_c_min: np.ndarray
+    sigma_s_tensile: np.ndarray
+    sigma_s_compressed: np.ndarray
+    utilization_concrete: np.ndarray
+    utilization_steel: np.ndarray
+    is_verified: np.ndarray  # dtype=bool
+    messages: dict[int, list[str]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return int(self.neutral_axis_x.shape[0])
+
+
+def classify_verification_types(
+    N: np.ndarray,
+    Mx: np.ndarray,
+    My: np.ndarray,
+    Mz: np.ndarray,
+    Tx: np.ndarray,
+    Ty: np.ndarray,
+) -> np.ndarray:
+    """Vectorized counterpart of :meth:`LoadCase.get_verification_type`.
+
+    Returns an object array of :class:`VerificationType` values.
+    """
+    has_N = np.abs(N) > 1e-6
+    has_Mx = np.abs(Mx) > 1e-6
+    has_My = np.abs(My) > 1e-6
+    has_Mz = np.abs(Mz) > 1e-6
+    has_T = (np.abs(Tx) > 1e-6) | (np.abs(Ty) > 1e-6)
+    has_M = has_Mx | has_My
+
+    # Same precedence as the scalar implementation: the first matching rule wins
+    conditions = [
+        has_Mz & has_T,
+        has_Mz & ~(has_N | has_M),
+        has_T & ~(has_N | has_M | has_Mz),
+        has_Mx & has_My & has_N,
+        has_Mx & has_My,
+        has_M & has_N,
+        has_M,
+        has_N,
+    ]
+    choices = [
+        VerificationType.SHEAR_TORSION,
+        VerificationType.TORSION,
+        VerificationType.SHEAR,
+        VerificationType.AXIAL_BENDING_DEVIATED,
+        VerificationType.BENDING_DEVIATED,
+        VerificationType.AXIAL_BENDING_SIMPLE,
+        VerificationType.BENDING_SIMPLE,
+        VerificationType.AXIAL_SIMPLE,
+    ]
+    out = np.full(np.shape(N), VerificationType.BENDING_SIMPLE, dtype=object)
+    # Apply in reverse so that higher-precedence rules overwrite lower ones
+    for cond, choice in zip(reversed(conditions), reversed(choices)):
+        out[cond] = choice
+    return out
+
+
+def calculate_neutral_axis_simple_bending_batch(
+    width: np.ndarray,
+    height: np.ndarray,
+    As: np.ndarray,
+    d: np.ndarray,
+    As_prime: np.ndarray,
+    d_prime: np.ndarray,
+    n: float | np.ndarray = 15.0,
+    method: str = "TA",
+) -> np.ndarray:
+    """Vectorized :func:`calculate_neutral_axis_simple_bending`.
+
+    All arguments are broadcast together; returns the neutral axis depth x [cm]
+    for every row, with the same fallbacks as the scalar implementation.
+    """
+    b, h, As, d, As_prime, d_prime, n = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (width, height, As, d, As_prime, d_prime, n))
+    )
+
+    if method != "TA":
+        # SLU / SLE: same simplified estimate as the scalar path
+        return d / 3.0
+
+    a = b / 2.0
+    b_coef = n * As + (n - 1) * As_prime
+    c = -(n * As * d + (n - 1) * As_prime * d_prime)
+    discriminant = b_coef**2 - 4 * a * c
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        x = (-b_coef + np.sqrt(np.where(discriminant >= 0, discriminant, 0.0))) / (2 * a)
+    x = np.where((discriminant < 0) | ~np.isfinite(x) | (x < 0), d / 3.0, x)
+    return np.where(x > h, 2 * h / 3.0, x)
+
+
+def calculate_stresses_simple_bending_batch(
+    width: np.ndarray,
+    As: np.ndarray,
+    d: np.ndarray,
+    As_prime: np.ndarray,
+    d_prime: np.ndarray,
+    moment: np.ndarray,
+    x: np.ndarray,
+    n: float | np.ndarray = 15.0,
+    method: str = "TA",
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized :func:`calculate_stresses_simple_bending` (without FRC).
+
+    Returns:
+        Tuple of arrays (sigma_c_max, sigma_c_min, sigma_s_tensile, sigma_s_compressed)
+
+    """
+    b, As, d, As_prime, d_prime, moment, x, n = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (width, As, d, As_prime, d_prime, moment, x, n))
+    )
+    zeros = np.zeros_like(x)
+
+    if method != "TA":
+        return zeros, zeros.copy(), zeros.copy(), zeros.copy()
+
+    I_homog = b * x**3 / 3.0 + n * As * (d - x) ** 2 + (n - 1) * As_prime * (x - d_prime) ** 2
+    valid = I_homog > 0
+    safe_I = np.where(valid, I_homog, 1.0)
+
+    sigma_c_max = np.where(valid, moment * x / safe_I, 0.0)
+    sigma_s_tensile = np.where(valid, n * moment * (d - x) / safe_I, 0.0)
+    sigma_s_compressed = np.where(valid & (x > d_prime), n * moment * (x - d_prime) / safe_I, 0.0)
+    return sigma_c_max, zeros, sigma_s_tensile, sigma_s_compressed
+
+
+def verify_allowable_stresses_batch(
+    sigma_c_max: np.ndarray,
+    sigma_s_tensile: np.ndarray,
+    sigma_s_compressed: np.ndarray,
+    sigma_c_adm: float,
+    sigma_s_adm: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized :func:`verify_allowable_stresses` (without messages).
+
+    Returns:
+        Tuple of arrays (is_verified, utilization_concrete, utilization_steel)
+
+    """
+    sigma_c_max = np.asarray(sigma_c_max, dtype=float)
+    if sigma_c_adm > 0:
+        util_concrete = np.abs(sigma_c_max) / sigma_c_adm
+    else:
+        util_concrete = np.zeros_like(sigma_c_max)
+    if sigma_s_adm > 0:
+        util_steel = np.maximum(np.abs(sigma_s_tensile), np.abs(sigma_s_compressed)) / sigma_s_adm
+    else:
+        util_steel = np.zeros_like(sigma_c_max)
+    is_verified = (util_concrete <= 1.0) & (util_steel <= 1.0)
+    return is_verified, util_concrete, util_steel
+
+
 def calculate_neutral_axis_simple_bending(
     section: SectionGeometry,
     reinforcement_tensile: ReinforcementLayer,
@@ -278,6 +451,33 @@ def calculate_neutral_axis_simple_bending(
     return NeutralAxis(x=x, y=0.0, inclination=0.0)
 
 
+def _deviated_axial_residual(
+    x: np.ndarray,
+    b: float,
+    fcd: float,
+    fyd: float,
+    Es: float,
+    eps_cu: float,
+    layers: tuple[tuple[float, float], ...],
+    N: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Axial equilibrium of the ultimate strain plane with neutral axis depth x.
+
+    Concrete: rectangular block 0.8 x at fcd; bars (area, depth) with strain
+    eps_cu (x - d) / x (compression positive) capped at fyd. Returns the
+    residual Cc + Fs + N (N > 0 tension) and its derivative with respect to x.
+    """
+    x = np.asarray(x, dtype=float)
+    residual = 0.8 * b * fcd * x + N
+    derivative = np.full(x.shape, 0.8 * b * fcd)
+    for area, depth in layers:
+        sigma = Es * eps_cu * (x - depth) / x
+        elastic = np.abs(sigma) < fyd
+        residual = residual + area * np.clip(sigma, -fyd, fyd)
+        derivative = derivative + np.where(elastic, area * Es * eps_cu * depth / x**2, 0.0)
+    return residual, derivative
+
+
 def calculate_neutral_axis_deviated_bending(
     section: SectionGeometry,
     reinforcement_tensile: ReinforcementLayer,
@@ -291,17 +491,26 @@ def calculate_neutral_axis_deviated_bending(
     eps_cu: float = 0.0035,
     max_iter: int = 60,
     tol: float = 1e-3,
+    x0: float | None = None,
 ) -> NeutralAxis:
     """Iterative neutral axis calculation for deviated bending (SLU-style).
 
     Approach:
     - Rotate axes so that the bending resultant is aligned with X (angle = atan2(My,Mx)).
-    - Solve for neutral axis depth x (measured from compressed edge) by bisection
-      on the equilibrium of axial force: C + Fs' + Fs - (-N) = 0, where N>0 is tension.
+    - Solve for neutral axis depth x (measured from compressed edge) on the
+      equilibrium of axial force: C + Fs' + Fs - (-N) = 0, where N>0 is tension,
+      with a Newton iteration on the analytic derivative kept inside the bracket
+      (0, h) by bisection steps.
     - Concrete compression resultant uses a rectangular stress block with depth 'x'
       and design stress 'fcd' (MaterialProperties.fcd).
     - Steel stresses computed from linear strain distribution capped by fyd (material.fyd).
 
+    `x0` warm-starts the iteration, typically with the depth of the previous load
+    case on the same section. The result reports the iterations and whether the
+    equilibrium converged; when the residual has no sign change in the section
+    (N beyond the axial capacity) the bracket end closest to equilibrium is
+    returned with converged=False.
+
     Note: this is an SLU-oriented implementation (uses eps_cu and fcd/fyd). For TA/SLE
     it will behave similarly but may be conservative; method selection can adjust
     coefficients if needed.
@@ -320,64 +529,36 @@ def calculate_neutral_axis_deviated_bending(
     fyd = material.fyd if material.fyd is not None else material.fyk
     Es = material.Es if material.Es is not None else 2100000.0
 
-    # Reinforcement positions (distance from top compressed edge)
-    d_top = reinforcement_compressed.distance
-    d_bot = reinforcement_tensile.distance
+    # Reinforcement (area, distance from top compressed edge)
+    layers = (
+        (reinforcement_compressed.area, reinforcement_compressed.distance),
+        (reinforcement_tensile.area, reinforcement_tensile.distance),
+    )
 
     # Limits for neutral axis search
     x_min = 1e-6
     x_max = h * 0.999
 
-    def internal_axial_result(x_val: float) -> float:
-        """Compute internal axial resultant (compression positive) for given x."""
-        # Concrete compression resultant using simplified rectangular block (0.8*x)
-        Ac = b * 0.8 * x_val
-        Cc = Ac * fcd
-        # centroid lever arm of stress block from top approximately 0.4*x
-        # Steel strains (linear): epsilon = eps_cu * (x - y)/x
-        # Positive epsilon => compression, negative => tension
-        # Top reinforcement
-        eps_top = eps_cu * (x_val - d_top) / x_val if x_val > 0 else 0.0
-        sigma_s_top = max(min(Es * eps_top, fyd), -fyd)
-        Fs_top = reinforcement_compressed.area * sigma_s_top
-        # Bottom reinforcement
-        eps_bot = eps_cu * (x_val - d_bot) / x_val if x_val > 0 else 0.0
-        sigma_s_bot = max(min(Es * eps_bot, fyd), -fyd)
-        Fs_bot = reinforcement_tensile.area * sigma_s_bot
-        # Total internal axial (compression positive). External N: positive = tension
-        # Equilibrium: Cc + Fs_top + Fs_bot + N = 0  => residual = Cc + Fs_top + Fs_bot + N
-        return Cc + Fs_top + Fs_bot + N
-
-    # Check sign at ends to ensure bisection applicability
-    r1 = internal_axial_result(x_min)
-    r2 = internal_axial_result(x_max)
-    if abs(r1) < tol:
-        x_sol = x_min
-    elif abs(r2) < tol:
-        x_sol = x_max
-    elif r1 * r2 > 0:
-        # No sign change: fallback to simple estimate (d/3)
-        x_sol = d_bot / 3.0
-    else:
-        # Bisection
-        a = x_min
-        bnd = x_max
-        fa = r1
-        _ = r2
-        x_sol = (a + bnd) / 2.0
-        for _ in range(max_iter):
-            fm = internal_axial_result(x_sol)
-            if abs(fm) < tol:
-                break
-            if fa * fm <= 0:
-                bnd = x_sol
-                _ = fm
-            else:
-                a = x_sol
-                fa = fm
-            x_sol = 0.5 * (a + bnd)
-
-    return NeutralAxis(x=x_sol, y=0.0, inclination=inclination)
+    def residual(x_val: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        return _deviated_axial_residual(x_val, b, fcd, fyd, Es, eps_cu, layers, N)
+
+    r_min = float(residual(np.asarray(x_min))[0])
+    r_max = float(residual(np.asarray(x_max))[0])
+    if r_min * r_max > 0:
+        x_sol, r_sol = (x_min, r_min) if abs(r_min) <= abs(r_max) else (x_max, r_max)
+        return NeutralAxis(x=x_sol, inclination=inclination, converged=abs(r_sol) < tol)
+
+    start = 0.5 * (x_min + x_max) if x0 is None or not x0 > 0 else x0
+    x_sol, converged, iterations = safeguarded_newton(
+        residual, x_min, x_max, start, tol=tol, max_iter=max_iter
+    )
+    return NeutralAxis(
+        x=float(x_sol),
+        y=0.0,
+        inclination=inclination,
+        iterations=int(iterations),
+        converged=bool(converged),
+    )
 
 
 def calculate_stresses_simple_bending(
@@ -528,15 +709,10 @@ def calculate_stresses_deviated_bending(
 def _rectangular_torsion_constant(b: float, h: float) -> float:
     """Approximate torsional constant J for a solid rectangle (Saint‑Venant).
 
-    Formula from engineering approximations (Roark / standard tables).
+    Formula from engineering approximations (Roark / standard tables); the value
+    is cached per section by `torsion.rectangular_torsion_constants`.
     """
-    # Ensure b <= h for stability
-    bb = min(b, h)
-    hh = max(b, h)
-    ratio = bb / hh
-    # Empirical approximation
-    J = bb * hh**3 * (1.0 / 3.0 - 0.21 * ratio * (1.0 - (bb**4) / (12.0 * hh**4)))
-    return max(J, 1e-6)
+    return rectangular_torsion_constants(float(b), float(h), 0.0).J
 
 
 def estimate_required_torsion_reinforcement(
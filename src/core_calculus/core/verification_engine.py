@@ -14,15 +14,20 @@ reports until a deeper refactor is performed.
 from __future__ import annotations
 
 import logging
+import threading
 from collections.abc import Callable
+from functools import lru_cache
 
 # Shorten mypy/flake8 agreeable imports (avoid long single-line imports)
 from typing import Any
 
+import numpy as np
+
 # Material type used by FRC model
 from core_models.materials import Material
 
 from .verification_core import (
+    BatchVerificationResult,
     LoadCase,
     MaterialProperties,
     NeutralAxis,
@@ -33,10 +38,14 @@ from .verification_core import (
     VerificationType,
     calculate_neutral_axis_deviated_bending,
     calculate_neutral_axis_simple_bending,
+    calculate_neutral_axis_simple_bending_batch,
     calculate_shear_torsion_stresses,
     calculate_stresses_deviated_bending,
     calculate_stresses_simple_bending,
+    calculate_stresses_simple_bending_batch,
+    classify_verification_types,
     verify_allowable_stresses,
+    verify_allowable_stresses_batch,
 )
 
 # Typed optional callables populated by config loaders (may be None in tests)
@@ -60,6 +69,51 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Engines are stateless once configured: share one instance per calculation code
+_ENGINES: dict[str, VerificationEngine] = {}
+_ENGINES_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=512)
+def _cached_material_properties(
+    concrete_class: str, steel_type: str, material_source: str
+) -> tuple[float, float, float, float]:
+    """Return (fck, Ec, fyk, Es) for the given materials, cached across engines."""
+    if get_concrete_properties and get_steel_properties:
+        try:
+            concrete = get_concrete_properties(material_source, concrete_class) or {}
+            steel = get_steel_properties(material_source, steel_type) or {}
+
+            # Extract properties based on source
+            if material_source == "RD2229":
+                fck = concrete.get("sigma_c28", 160.0)
+                Ec = concrete.get("Ec", 250000.0)
+                fyk = steel.get("sigma_sn", 3800.0)
+                Es = steel.get("Es", 2100000.0)
+            else:  # NTC2008/2018
+                fck = concrete.get("fck", 25.0)
+                Ec = concrete.get("Ecm", 31000.0)
+                fyk = steel.get("fyk", 450.0)
+                Es = steel.get("Es", 200000.0)
+
+            return (fck, Ec, fyk, Es)
+
+        except Exception as e:
+            logger.warning(f"Could not load material properties: {e}")
+    # Default fallback
+    return (160.0, 250000.0, 3800.0, 2100000.0)
+
+
+def material_properties_cache_info() -> dict[str, int]:
+    """Hit/miss counters of the shared material properties cache."""
+    info = _cached_material_properties.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize}
+
+
+def clear_material_properties_cache() -> None:
+    """Drop cached material properties (e.g. after editing the materials library)."""
+    _cached_material_properties.cache_clear()
+
 
 class VerificationEngine:
     """Main verification engine."""
@@ -87,38 +141,10 @@ class VerificationEngine:
     ) -> MaterialProperties:
         """Get material properties from configuration.
 
-        This method delegates to a cached helper to avoid repeated lookups
-        against the historical materials repository which may be IO-heavy.
+        This method delegates to a module-level cached helper to avoid repeated
+        lookups against the historical materials repository which may be IO-heavy.
         """
-        from functools import lru_cache
-
-        @lru_cache(maxsize=512)
-        def _cached_props(concrete_class: str, steel_type: str, material_source: str) -> tuple:
-            if get_concrete_properties and get_steel_properties:
-                try:
-                    concrete = get_concrete_properties(material_source, concrete_class) or {}
-                    steel = get_steel_properties(material_source, steel_type) or {}
-
-                    # Extract properties based on source
-                    if material_source == "RD2229":
-                        fck = concrete.get("sigma_c28", 160.0)
-                        Ec = concrete.get("Ec", 250000.0)
-                        fyk = steel.get("sigma_sn", 3800.0)
-                        Es = steel.get("Es", 2100000.0)
-                    else:  # NTC2008/2018
-                        fck = concrete.get("fck", 25.0)
-                        Ec = concrete.get("Ecm", 31000.0)
-                        fyk = steel.get("fyk", 450.0)
-                        Es = steel.get("Es", 200000.0)
-
-                    return (fck, Ec, fyk, Es)
-
-                except Exception as e:
-                    logger.warning(f"Could not load material properties: {e}")
-            # Default fallback
-            return (160.0, 250000.0, 3800.0, 2100000.0)
-
-        fck, Ec, fyk, Es = _cached_props(concrete_class, steel_type, material_source)
+        fck, Ec, fyk, Es = _cached_material_properties(concrete_class, steel_type, material_source)
         return MaterialProperties(fck=fck, Ec=Ec, fyk=fyk, Es=Es)
 
     def get_allowable_stresses(self, material: MaterialProperties) -> tuple[float, float]:
@@ -169,6 +195,7 @@ class VerificationEngine:
         loads: LoadCase,
         frc_material: Material | None = None,
         frc_area: float = 0.0,
+        neutral_axis_guess: float | None = None,
     ) -> VerificationResult:
         """Perform complete structural verification.
 
@@ -178,6 +205,8 @@ class VerificationEngine:
             reinforcement_compressed: Compressed reinforcement
             material: Material properties
             loads: Load case
+            neutral_axis_guess: Warm start [cm] of the iterative neutral axis
+                (deviated bending), e.g. the depth of the previous load case
 
         Returns:
             Verification result
@@ -234,6 +263,7 @@ class VerificationEngine:
                 My=loads.My,
                 N=loads.N,
                 method=self.calculation_code,
+                x0=neutral_axis_guess,
             )
             stress_state = calculate_stresses_deviated_bending(
                 section=section,
@@ -247,6 +277,10 @@ class VerificationEngine:
                 method=self.calculation_code,
             )
             approx_notes.append("Deviated bending handled with iterative neutral axis (SLU)")
+            if not neutral_axis.converged:
+                approx_notes.append(
+                    "Asse neutro non determinato: sforzo normale oltre la capacità della sezione"
+                )
             logger.info("Deviated bending handled with iterative neutral axis (SLU)")
 
         elif verif_type in [
@@ -312,6 +346,147 @@ class VerificationEngine:
             messages=messages,
         )
 
+    def perform_verification_batch(
+        self,
+        width: np.ndarray,
+        height: np.ndarray,
+        As: np.ndarray,
+        d: np.ndarray,
+        As_prime: np.ndarray,
+        d_prime: np.ndarray,
+        material: MaterialProperties,
+        N: np.ndarray | float = 0.0,
+        Mx: np.ndarray | float = 0.0,
+        My: np.ndarray | float = 0.0,
+        Mz: np.ndarray | float = 0.0,
+        Tx: np.ndarray | float = 0.0,
+        Ty: np.ndarray | float = 0.0,
+        At: np.ndarray | float = 0.0,
+    ) -> BatchVerificationResult:
+        """Perform the verification of many rows sharing the same material.
+
+        Column-oriented counterpart of :meth:`perform_verification`: every
+        geometry, reinforcement and load argument is an array (or a scalar
+        broadcast to all rows). Simple bending and axial+simple bending rows
+        are computed with vectorized kernels; the remaining verification types
+        (deviated bending, shear, torsion) fall back to the scalar path row by
+        row so that results are identical to :meth:`perform_verification`.
+
+        Args:
+            width, height: Section dimensions [cm]
+            As, d: Tensile reinforcement area [cm²] and depth from compressed edge [cm]
+            As_prime, d_prime: Compressed reinforcement area [cm²] and depth [cm]
+            material: Material properties shared by all rows
+            N, Mx, My, Mz, Tx, Ty, At: Load case components (see :class:`LoadCase`)
+
+        Returns:
+            Batch verification result with one entry per row
+
+        """
+        arrays = np.broadcast_arrays(
+            *(
+                np.atleast_1d(np.asarray(v, dtype=float))
+                for v in (width, height, As, d, As_prime, d_prime, N, Mx, My, Mz, Tx, Ty, At)
+            )
+        )
+        width, height, As, d, As_prime, d_prime, N, Mx, My, Mz, Tx, Ty, At = arrays
+        size = width.shape[0]
+        n = material.n or 15.0
+        sigma_c_adm, sigma_s_adm = self.get_allowable_stresses(material)
+
+        verif_types = classify_verification_types(N, Mx, My, Mz, Tx, Ty)
+        simple = (verif_types == VerificationType.BENDING_SIMPLE) | (
+            verif_types == VerificationType.AXIAL_BENDING_SIMPLE
+        )
+        axial = verif_types == VerificationType.AXIAL_SIMPLE
+
+        x = np.zeros(size)
+        sigma_c_max = np.zeros(size)
+        sigma_c_min = np.zeros(size)
+        sigma_s_tensile = np.zeros(size)
+        sigma_s_compressed = np.zeros(size)
+        inclination = np.zeros(size)
+
+        if simple.any():
+            moment = np.where(np.abs(Mx) > np.abs(My), Mx, My)[simple]
+            x[simple] = calculate_neutral_axis_simple_bending_batch(
+                width[simple],
+                height[simple],
+                As[simple],
+                d[simple],
+                As_prime[simple],
+                d_prime[simple],
+                n=n,
+                method=self.calculation_code,
+            )
+            sc_max, sc_min, ss_t, ss_c = calculate_stresses_simple_bending_batch(
+                width[simple],
+                As[simple],
+                d[simple],
+                As_prime[simple],
+                d_prime[simple],
+                moment,
+                x[simple],
+                n=n,
+                method=self.calculation_code,
+            )
+            sigma_c_max[simple] = sc_max
+            sigma_c_min[simple] = sc_min
+            sigma_s_tensile[simple] = ss_t
+            sigma_s_compressed[simple] = ss_c
+
+        is_verified, util_concrete, util_steel = verify_allowable_stresses_batch(
+            sigma_c_max, sigma_s_tensile, sigma_s_compressed, sigma_c_adm, sigma_s_adm
+        )
+
+        # Rows not covered by the vectorized kernels use the scalar engine
+        messages: dict[int, list[str]] = {}
+        # Consecutive deviated-bending rows on the same section warm-start the
+        # neutral axis iteration from the previous solution
+        previous: tuple[tuple[float, ...], float] | None = None
+        for i in np.flatnonzero(~(simple | axial)):
+            geometry = (width[i], height[i], As[i], d[i], As_prime[i], d_prime[i])
+            result = self.perform_verification(
+                section=SectionGeometry(width=width[i], height=height[i]),
+                reinforcement_tensile=ReinforcementLayer(area=As[i], distance=d[i]),
+                reinforcement_compressed=ReinforcementLayer(area=As_prime[i], distance=d_prime[i]),
+                material=material,
+                loads=LoadCase(N=N[i], Mx=Mx[i], My=My[i], Mz=Mz[i], Tx=Tx[i], Ty=Ty[i], At=At[i]),
+                neutral_axis_guess=previous[1] if previous and previous[0] == geometry else None,
+            )
+            if result.neutral_axis.iterations:
+                previous = (geometry, result.neutral_axis.x)
+            x[i] = result.neutral_axis.x
+            inclination[i] = result.neutral_axis.inclination
+            sigma_c_max[i] = result.stress_state.sigma_c_max
+            sigma_c_min[i] = result.stress_state.sigma_c_min
+            sigma_s_tensile[i] = result.stress_state.sigma_s_tensile
+            sigma_s_compressed[i] = result.stress_state.sigma_s_compressed
+            util_concrete[i] = result.utilization_concrete
+            util_steel[i] = result.utilization_steel
+            is_verified[i] = result.is_verified
+            messages[int(i)] = list(result.messages or [])
+
+        if axial.any():
+            logger.warning(
+                f"Verification type {VerificationType.AXIAL_SIMPLE} not yet implemented "
+                f"({int(axial.sum())} rows)"
+            )
+
+        return BatchVerificationResult(
+            verification_type=verif_types,
+            neutral_axis_x=x,
+            neutral_axis_inclination=inclination,
+            sigma_c_max=sigma_c_max,
+            sigma_c_min=sigma_c_min,
+            sigma_s_tensile=sigma_s_tensile,
+            sigma_s_compressed=sigma_s_compressed,
+            utilization_concrete=util_concrete,
+            utilization_steel=util_steel,
+            is_verified=is_verified,
+            messages=messages,
+        )
+
 
 def create_verification_engine(calculation_code: str = "TA") -> VerificationEngine:
     """Create a verification engine instance.
@@ -324,3 +499,26 @@ def create_verification_engine(calculation_code: str = "TA") -> VerificationEngi
 
     """
     return VerificationEngine(calculation_code=calculation_code)
+
+
+def get_verification_engine(calculation_code: str = "TA") -> VerificationEngine:
+    """Return the shared verification engine for ``calculation_code``.
+
+    Unlike :func:`create_verification_engine`, the configuration is loaded only
+    the first time a code is requested; later calls reuse the same instance.
+    """
+    code = calculation_code.upper()
+    engine = _ENGINES.get(code)
+    if engine is None:
+        with _ENGINES_LOCK:
+            engine = _ENGINES.get(code)
+            if engine is None:
+                engine = VerificationEngine(calculation_code=code)
+                _ENGINES[code] = engine
+    return engine
+
+
+def clear_verification_engines() -> None:
+    """Forget the shared engines (e.g. after editing the .jsoncode configuration)."""
+    with _ENGINES_LOCK:
+        _ENGINES.clear()
@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from collections.abc import Iterable
 
+from core_models.materials import MaterialValues, numeric_property
 from src.domain.domain.models import VerificationInput
 
 logger = logging.getLogger(__name__)
@@ -22,16 +23,22 @@ def _get_material_by_name(material_repository: object | None, name: str):
 
 
 def _extract_material_property(material, keys: Iterable[str]) -> float | None:
-    for key in keys:
-        if hasattr(material, key):
-            val = getattr(material, key)
-            if isinstance(val, (int, float)):
-                return float(val)
-    props = getattr(material, "properties", {}) or {}
-    for key in keys:
-        if key in props and isinstance(props[key], (int, float)):
-            return float(props[key])
-    return None
+    return numeric_property(material, keys)
+
+
+def _get_material_values(material_repository: object | None, name: str) -> MaterialValues | None:
+    """Pre-extracted numeric view of a material; uses the repository cache when available."""
+    if not material_repository or not name:
+        return None
+    get_values = getattr(material_repository, "get_values", None)
+    if callable(get_values):
+        try:
+            return get_values(name)
+        except Exception:
+            logger.exception("Errore ricerca materiale '%s'", name)
+            return None
+    mat = _get_material_by_name(material_repository, name)
+    return MaterialValues.from_material(mat) if mat is not None else None
 
 
 def get_concrete_properties(
@@ -42,9 +49,9 @@ def get_concrete_properties(
     fallback_fck = 25.0
     fck_mpa = None
     if material_repository is not None and _input.material_concrete:
-        mat = _get_material_by_name(material_repository, _input.material_concrete)
-        if mat is not None:
-            fck_mpa = _extract_material_property(mat, ["fck_MPa", "fck_mpa", "fck"])
+        values = _get_material_values(material_repository, _input.material_concrete)
+        if values is not None:
+            fck_mpa = values.fck
     if fck_mpa is None:
         logger.warning(
             "Materiale cls '%s' non trovato; uso fck=%s MPa", _input.material_concrete, fallback_fck
@@ -63,9 +70,9 @@ def get_steel_properties(
     fallback_fyk = 450.0
     fyk_mpa = None
     if material_repository is not None and _input.material_steel:
-        mat = _get_material_by_name(material_repository, _input.material_steel)
-        if mat is not None:
-            fyk_mpa = _extract_material_property(mat, ["fyk_MPa", "fyk_mpa", "fyk"])
+        values = _get_material_values(material_repository, _input.material_steel)
+        if values is not None:
+            fyk_mpa = values.fyk
     if fyk_mpa is None:
         logger.warning(
             "Materiale acciaio '%s' non trovato; uso fyk=%s MPa",
@@ -77,3 +84,23 @@ def get_steel_properties(
     gamma_s_ta = 1.5
     sigma_fa = fyk_kgcm2 / gamma_s_ta
     return fyk_mpa, fyk_kgcm2, sigma_fa
+
+
+def get_stirrup_steel_properties(
+    _input: VerificationInput,
+    material_repository: object | None,
+) -> tuple[float, float, float]:
+    """Returns (fyk_MPa, fyk_kgcm2, sigma_fa_kgcm2) of the stirrups.
+
+    Uses `stirrup_material` when it resolves, otherwise the longitudinal steel.
+    """
+    if material_repository is not None and _input.stirrup_material:
+        values = _get_material_values(material_repository, _input.stirrup_material)
+        if values is not None and values.fyk is not None:
+            fyk_kgcm2 = values.fyk * 10.197
+            return values.fyk, fyk_kgcm2, fyk_kgcm2 / 1.5
+        logger.warning(
+            "Materiale staffe '%s' non trovato; uso l'acciaio longitudinale",
+            _input.stirrup_material,
+        )
+    return get_steel_properties(_input, material_repository)
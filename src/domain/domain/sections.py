@@ -17,6 +17,17 @@ def _get_section_by_id_or_name(section_id: str, section_repository: object | Non
                 return found
     except Exception:
         logger.exception("Errore ricerca sezione per id=%s", section_id)
+    find_by_name = getattr(section_repository, "find_by_name", None)
+    if callable(find_by_name):
+        # Indexed lookup: exact name first, then case-insensitive match
+        try:
+            found = find_by_name(section_id)
+            if found is None:
+                found = find_by_name(section_id, case_sensitive=False)
+            return found
+        except Exception:
+            logger.exception("Errore ricerca sezione per nome=%s", section_id)
+            return None
     try:
         get_all = getattr(section_repository, "get_all_sections", None)
         if callable(get_all):
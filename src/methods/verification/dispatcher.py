@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 
 from app.domain.models import VerificationInput, VerificationOutput
 from app.verification.engine_adapter import compute_with_engine
-from app.verification.methods_sle import compute_sle_verification
+from app.verification.methods_shear import apply_shear_verification
+from app.verification.methods_sle import (
+    compute_sle_verification,
+    compute_sle_verification_batch,
+)
 from app.verification.methods_slu import compute_slu_verification
 from app.verification.methods_ta import compute_ta_verification
+from app.verification.methods_torsion import apply_torsion_verification
 
 logger = logging.getLogger(__name__)
 
@@ -15,10 +21,22 @@ def compute_verification_result(
     _input: VerificationInput,
     section_repository: object | None = None,
     material_repository: object | None = None,
+) -> VerificationOutput:
+    result = _compute_bending_result(_input, section_repository, material_repository)
+    apply_shear_verification([_input], [result], section_repository, material_repository)
+    apply_torsion_verification([_input], [result], section_repository, material_repository)
+    return result
+
+
+def _compute_bending_result(
+    _input: VerificationInput,
+    section_repository: object | None = None,
+    material_repository: object | None = None,
 ) -> VerificationOutput:
     method = (_input.verification_method or "").upper().strip()
 
-    if method in ("TA", "SLU", "SLE"):
+    # SLE goes straight to methods_sle: the core engine does not compute crack widths
+    if method in ("TA", "SLU"):
         engine_result = compute_with_engine(_input, section_repository, material_repository)
         if engine_result is not None:
             return engine_result
@@ -47,3 +65,31 @@ def compute_verification_result(
             "Selezionare un metodo dalla colonna 'Metodo verifica': TA, SLU, SLE, SANT",
         ],
     )
+
+
+def compute_verification_results(
+    inputs: Sequence[VerificationInput],
+    section_repository: object | None = None,
+    material_repository: object | None = None,
+) -> list[VerificationOutput]:
+    """Compute many rows at once: SLE rows share one vectorized crack-width
+    computation, the shear and torsion checks of all TA/SLU rows share one
+    vectorized call each."""
+    results: list[VerificationOutput | None] = [None] * len(inputs)
+    sle = [
+        i
+        for i, row in enumerate(inputs)
+        if (row.verification_method or "").upper().strip() == "SLE"
+    ]
+    if sle:
+        batch = compute_sle_verification_batch(
+            [inputs[i] for i in sle], section_repository, material_repository
+        )
+        for i, out in zip(sle, batch):
+            results[i] = out
+    for i, row in enumerate(inputs):
+        if results[i] is None:
+            results[i] = _compute_bending_result(row, section_repository, material_repository)
+    apply_shear_verification(inputs, results, section_repository, material_repository)
+    apply_torsion_verification(inputs, results, section_repository, material_repository)
+    return results  # type: ignore[return-value]
@@ -21,9 +21,7 @@ def compute_with_engine(
             ReinforcementLayer,
             SectionGeometry,
         )
-        from src.core_calculus.core.verification_engine import (
-            create_verification_engine,
-        )
+        from src.core_calculus.core.verification_engine import get_verification_engine
     except Exception:  # pragma: no cover - optional engine
         return None
 
@@ -49,7 +47,7 @@ def compute_with_engine(
         )
 
         code = (_input.verification_method or "TA").upper()
-        engine = create_verification_engine(code)
+        engine = get_verification_engine(code)
         material = engine.get_material_properties(
             _input.material_concrete or "",
             _input.material_steel or "",
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Collection, Sequence
+
+import numpy as np
+
+from app.domain.materials import get_concrete_properties, get_stirrup_steel_properties
+from app.domain.models import VerificationInput, VerificationOutput
+from app.domain.sections import get_section_geometry
+from src.core_calculus.core.shear import (
+    ShearBatchResult,
+    allowable_shear_stresses,
+    shear_slu_batch,
+    shear_ta_batch,
+)
+
+logger = logging.getLogger(__name__)
+
+# Parametri della verifica a taglio (Taglio, sezioni rettangolari)
+GAMMA_C = 1.5
+GAMMA_S = 1.15
+RCK_FROM_FCK = 1.0 / 0.83
+DEFAULT_COVER_CM = 4.0
+
+
+def _method(_input: VerificationInput) -> str:
+    return (_input.verification_method or "").upper().strip()
+
+
+def _collect_shear_rows(
+    inputs: Sequence[VerificationInput],
+    outputs: Sequence[VerificationOutput],
+    section_repository: object | None,
+    material_repository: object | None,
+    rows: Collection[int] | None = None,
+    quiet: bool = False,
+) -> tuple[dict[str, list[tuple[int, str]]], list[int], dict[str, np.ndarray]]:
+    """Colonne della verifica a taglio: una voce per (riga, direzione).
+
+    Ritorna i gruppi per metodo (voce, direzione), la riga di ogni voce e le
+    colonne. `rows` limita le righe considerate; con `quiet` non vengono aggiunti
+    messaggi agli esiti.
+    """
+    groups: dict[str, list[tuple[int, str]]] = {"TA": [], "SLU": []}
+    cols: dict[str, list[float]] = {
+        key: []
+        for key in (
+            "V",
+            "N",
+            "b",
+            "h",
+            "d",
+            "As",
+            "As_c",
+            "a_c",
+            "n",
+            "fck",
+            "fyk",
+            "sfa",
+            "phi",
+            "s",
+        )
+    }
+    entries: list[int] = []  # riga di ogni (riga, direzione) calcolata
+    for i, (_input, out) in enumerate(zip(inputs, outputs)):
+        if rows is not None and i not in rows:
+            continue
+        method = _method(_input)
+        if method not in groups or out is None or out.esito == "ERRORE":
+            continue
+        directions = [("y", _input.Ty)] if _input.Ty else []
+        if _input.Tx:
+            if method == "TA":
+                if not quiet:
+                    out.messaggi.append(
+                        "Taglio Tx: calcolo non implementato per taglio deviato alle T.A."
+                    )
+            else:
+                directions.append(("x", _input.Tx))
+        if not directions:
+            continue
+        try:
+            B, H = get_section_geometry(_input, section_repository, unit="cm")
+            _, fck_kgcm2, _ = get_concrete_properties(_input, material_repository)
+            _, fyk_kgcm2, sigma_fa = get_stirrup_steel_properties(_input, material_repository)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            if not quiet:
+                logger.exception("Errore nella verifica a taglio: %s", e)
+                out.messaggi.append(f"Errore durante la verifica a taglio: {e}")
+            continue
+        primary_m = _input.Mx if abs(_input.Mx) >= abs(_input.My) else _input.My
+        d_inf = _input.d_inf if _input.d_inf > 0 else DEFAULT_COVER_CM
+        d_sup = _input.d_sup if _input.d_sup > 0 else DEFAULT_COVER_CM
+        # Armatura tesa dal segno del momento (M >= 0 tende le fibre inferiori)
+        if primary_m >= 0:
+            As_t, As_c, a_t, a_c = _input.As_inf, _input.As_sup, d_inf, d_sup
+        else:
+            As_t, As_c, a_t, a_c = _input.As_sup, _input.As_inf, d_sup, d_inf
+        for direction, V in directions:
+            b, h = (B, H) if direction == "y" else (H, B)
+            entries.append(i)
+            groups[method].append((len(entries) - 1, direction))
+            for key, value in (
+                ("V", V),
+                ("N", _input.N),
+                ("b", b),
+                ("h", h),
+                ("d", h - a_t),
+                ("As", As_t),
+                ("As_c", As_c),
+                ("a_c", a_c),
+                ("n", _input.n_homog if _input.n_homog > 0 else 15.0),
+                ("fck", fck_kgcm2),
+                ("fyk", fyk_kgcm2),
+                ("sfa", sigma_fa),
+                ("phi", _input.stirrup_diameter / 10.0),
+                ("s", _input.stirrup_step),
+            ):
+                cols[key].append(value)
+    return groups, entries, {key: np.asarray(values, dtype=float) for key, values in cols.items()}
+
+
+def _run_shear(method: str, col: dict[str, np.ndarray]) -> ShearBatchResult:
+    """Verifica vettoriale delle voci di un metodo (aggiunge τ_c0, τ_c1 a `col` per TA)."""
+    if method == "TA":
+        col["tau_c0"], col["tau_c1"] = allowable_shear_stresses(col["fck"] * RCK_FROM_FCK)
+        return shear_ta_batch(
+            col["V"],
+            col["b"],
+            col["d"],
+            col["As"],
+            col["As_c"],
+            col["a_c"],
+            col["n"],
+            tau_c0=col["tau_c0"],
+            tau_c1=col["tau_c1"],
+            sigma_sw_allow=col["sfa"],
+            stirrup_diameter=col["phi"],
+            stirrup_step=col["s"],
+        )
+    return shear_slu_batch(
+        col["V"],
+        col["N"],
+        col["b"],
+        col["h"],
+        col["d"],
+        col["As"],
+        fck=col["fck"],
+        fcd=0.85 * col["fck"] / GAMMA_C,
+        fywd=col["fyk"] / GAMMA_S,
+        stirrup_diameter=col["phi"],
+        stirrup_step=col["s"],
+        gamma_c=GAMMA_C,
+    )
+
+
+def apply_shear_verification(
+    inputs: Sequence[VerificationInput],
+    outputs: Sequence[VerificationOutput],
+    section_repository: object | None = None,
+    material_repository: object | None = None,
+) -> Sequence[VerificationOutput]:
+    """Aggiunge la verifica a taglio agli esiti TA/SLU delle righe con Ty o Tx.
+
+    Sezioni e materiali sono risolti riga per riga, τ_max, armatura e passo delle
+    staffe sono calcolati con una sola chiamata vettoriale per metodo. Le righe
+    non verificate a taglio passano a "NON VERIFICATO".
+    """
+    groups, entries, arr = _collect_shear_rows(
+        inputs, outputs, section_repository, material_repository
+    )
+    if not entries:
+        return outputs
+    lines: dict[int, list[str]] = {}
+    failed: set[int] = set()
+    for method, members in groups.items():
+        if not members:
+            continue
+        k = np.asarray([m for m, _ in members])
+        col = {key: values[k] for key, values in arr.items()}
+        res = _run_shear(method, col)
+        for j, (entry, direction) in enumerate(members):
+            i = entries[entry]
+            lines.setdefault(i, []).extend(_shear_lines(method, direction, res, j, col))
+            if not res.verified[j]:
+                failed.add(i)
+
+    for i, text in lines.items():
+        out = outputs[i]
+        out.messaggi.extend(["", "VERIFICA A TAGLIO", *text])
+        if i in failed and out.esito == "VERIFICATO":
+            out.esito = "NON VERIFICATO"
+    return outputs
+
+
+def shear_stirrup_demand(
+    inputs: Sequence[VerificationInput],
+    outputs: Sequence[VerificationOutput],
+    section_repository: object | None = None,
+    material_repository: object | None = None,
+    rows: Collection[int] | None = None,
+) -> dict[int, tuple[float, float]]:
+    """Per riga: (Asw/s richiesto a taglio [cm²/cm], V / VRcd), massimi sulle
+    direzioni, senza modificare gli esiti (V / VRcd = nan alle T.A.).
+
+    Usato dalla verifica a torsione per sommare le due richieste su staffe e bielle.
+    """
+    groups, entries, arr = _collect_shear_rows(
+        inputs, outputs, section_repository, material_repository, rows, quiet=True
+    )
+    demand: dict[int, tuple[float, float]] = {}
+    for method, members in groups.items():
+        if not members:
+            continue
+        k = np.asarray([m for m, _ in members])
+        col = {key: values[k] for key, values in arr.items()}
+        res = _run_shear(method, col)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            strut = np.abs(col["V"]) / res.strut_resistance
+        for j, (entry, _) in enumerate(members):
+            i = entries[entry]
+            asw, ratio = demand.get(i, (0.0, np.nan))
+            demand[i] = (max(asw, float(res.asw_required[j])), float(np.fmax(ratio, strut[j])))
+    return demand
+
+
+def _shear_lines(method: str, direction: str, res, j: int, col: dict) -> list[str]:
+    label = "Ty" if direction == "y" else "Tx"
+    step = float(col["s"][j])
+    text = [f"  {label} = {abs(col['V'][j]):.0f} kg"]
+    if method == "TA":
+        text.append(
+            f"  τ_max = {res.tau_max[j]:.2f} kg/cm² "
+            f"(τ_c0 = {col['tau_c0'][j]:.2f}, τ_c1 = {col['tau_c1'][j]:.2f} kg/cm²)"
+        )
+    else:
+        text.append(f"  V_Rd = {res.resistance[j]:.0f} kg")
+    if res.redesign[j]:
+        text.append("  Occorre riprogettare la sezione: tensioni tangenziali molto elevate")
+    elif res.needs_stirrups[j]:
+        text.append(
+            f"  Armatura a taglio richiesta: Asw/s = {100.0 * res.asw_required[j]:.2f} cm²/m"
+        )
+        if method == "TA" and step > 0:
+            text.append(
+                f"  Tensione nelle staffe σ_f = {res.sigma_sw[j]:.0f} kg/cm² "
+                f"(σ_fa = {col['sfa'][j]:.0f} kg/cm²)"
+            )
+        if step <= 0 or col["phi"][j] <= 0:
+            text.append("  Staffe non assegnate (passo o diametro nullo)")
+    else:
+        text.append("  Non occorre specifica armatura a taglio")
+    text.append(
+        f"  Passo staffe richiesto = {res.spacing_required[j]:.1f} cm "
+        f"(massimo regolamentare {res.spacing_max[j]:.1f} cm)"
+    )
+    if step > res.spacing_max[j]:
+        text.append(f"  Attenzione: passo assegnato {step:.1f} cm superiore al massimo")
+    text.append(f"  Esito taglio: {'VERIFICATO' if res.verified[j] else 'NON VERIFICATO'}")
+    return text
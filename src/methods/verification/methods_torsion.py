@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import logging
+import math
+from collections.abc import Sequence
+
+import numpy as np
+
+from app.domain.materials import get_concrete_properties, get_stirrup_steel_properties
+from app.domain.models import VerificationInput, VerificationOutput
+from app.domain.sections import get_section_geometry
+from src.core_calculus.core.shear import allowable_shear_stresses
+from src.core_calculus.core.torsion import (
+    shear_torsion_batch,
+    torsion_constants_for,
+    torsion_slu_batch,
+    torsion_ta_batch,
+)
+from src.methods.verification.methods_shear import (
+    DEFAULT_COVER_CM,
+    GAMMA_C,
+    GAMMA_S,
+    RCK_FROM_FCK,
+    shear_stirrup_demand,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def apply_torsion_verification(
+    inputs: Sequence[VerificationInput],
+    outputs: Sequence[VerificationOutput],
+    section_repository: object | None = None,
+    material_repository: object | None = None,
+) -> Sequence[VerificationOutput]:
+    """Aggiunge la verifica a torsione (Mz) agli esiti TA/SLU.
+
+    Le costanti torsionali (tubolare di Bredt, spessore efficace, Psi) sono
+    memorizzate per sezione; le sollecitazioni di tutte le righe sono elaborate
+    con una sola chiamata vettoriale per metodo. At è l'armatura longitudinale a
+    torsione, le staffe sono quelle della riga (un braccio per parete).
+
+    Nelle righe con anche Ty o Tx le staffe devono coprire la somma delle due
+    richieste, Asw/s >= (Asw/s)_V + 2 (Asw/s)_T per braccio, e allo SLU le bielle
+    sono verificate con T/TRcd + V/VRcd <= 1.
+    """
+    groups: dict[str, list[tuple[int, int]]] = {"TA": [], "SLU": []}  # (colonna, riga)
+    cols: dict[str, list[float]] = {
+        key: []
+        for key in (
+            "T",
+            "tau_factor",
+            "A",
+            "p",
+            "t",
+            "fck",
+            "fyk",
+            "sfa",
+            "asw",
+            "s",
+            "Al",
+            "shear",
+        )
+    }
+    for i, (_input, out) in enumerate(zip(inputs, outputs)):
+        method = (_input.verification_method or "").upper().strip()
+        if method not in groups or not _input.Mz or out is None or out.esito == "ERRORE":
+            continue
+        try:
+            B, H = get_section_geometry(_input, section_repository, unit="cm")
+            _, fck_kgcm2, _ = get_concrete_properties(_input, material_repository)
+            _, fyk_kgcm2, sigma_fa = get_stirrup_steel_properties(_input, material_repository)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.exception("Errore nella verifica a torsione: %s", e)
+            out.messaggi.append(f"Errore durante la verifica a torsione: {e}")
+            continue
+        delta = max(
+            _input.d_sup if _input.d_sup > 0 else DEFAULT_COVER_CM,
+            _input.d_inf if _input.d_inf > 0 else DEFAULT_COVER_CM,
+        )
+        constants = torsion_constants_for(_input.section_id, B, H, delta)
+        groups[method].append((len(cols["T"]), i))
+        for key, value in (
+            ("T", _input.Mz * 100.0),
+            ("tau_factor", constants.tau_factor),
+            ("A", constants.A),
+            ("p", constants.p),
+            ("t", constants.t),
+            ("fck", fck_kgcm2),
+            ("fyk", fyk_kgcm2),
+            ("sfa", sigma_fa),
+            ("asw", math.pi * (_input.stirrup_diameter / 10.0) ** 2 / 4.0),
+            ("s", _input.stirrup_step),
+            ("Al", _input.At),
+            ("shear", bool(_input.Ty or _input.Tx)),
+        ):
+            cols[key].append(value)
+
+    if not cols["T"]:
+        return outputs
+    arr = {key: np.asarray(values, dtype=float) for key, values in cols.items()}
+    combined_rows = {i for members in groups.values() for m, i in members if arr["shear"][m]}
+    demand = (
+        shear_stirrup_demand(
+            inputs, outputs, section_repository, material_repository, rows=combined_rows
+        )
+        if combined_rows
+        else {}
+    )
+    for method, members in groups.items():
+        if not members:
+            continue
+        k = np.asarray([m for m, _ in members])
+        col = {key: values[k] for key, values in arr.items()}
+        if method == "TA":
+            col["tau_c0"], col["tau_c1"] = allowable_shear_stresses(col["fck"] * RCK_FROM_FCK)
+            res = torsion_ta_batch(
+                col["T"],
+                tau_factor=col["tau_factor"],
+                A=col["A"],
+                p=col["p"],
+                tau_c0=col["tau_c0"],
+                tau_c1=col["tau_c1"],
+                sigma_fa=col["sfa"],
+                stirrup_leg_area=col["asw"],
+                stirrup_step=col["s"],
+                Al=col["Al"],
+                with_shear=col["shear"],
+            )
+        else:
+            res = torsion_slu_batch(
+                col["T"],
+                A=col["A"],
+                p=col["p"],
+                t=col["t"],
+                fcd=0.85 * col["fck"] / GAMMA_C,
+                fyd=col["fyk"] / GAMMA_S,
+                stirrup_leg_area=col["asw"],
+                stirrup_step=col["s"],
+                Al=col["Al"],
+            )
+        shear_asw = np.array([demand.get(i, (0.0, np.nan))[0] for _, i in members])
+        strut = np.array([demand.get(i, (0.0, np.nan))[1] for _, i in members])
+        both = shear_torsion_batch(
+            col["T"],
+            shear_asw,
+            A=col["A"],
+            f_stirrup=col["sfa"] if method == "TA" else col["fyk"] / GAMMA_S,
+            stirrup_leg_area=col["asw"],
+            stirrup_step=col["s"],
+            shear_strut_utilization=strut if method == "SLU" else None,
+            torsion_strut_resistance=res.strut_resistance if method == "SLU" else None,
+        )
+        for j, (_, i) in enumerate(members):
+            out = outputs[i]
+            text = _torsion_lines(method, res, j, col)
+            verified = bool(res.verified[j])
+            if i in demand:
+                text.extend(_combined_lines(method, both, j))
+                verified = verified and bool(both.verified[j])
+            out.messaggi.extend(["", "VERIFICA A TORSIONE", *text])
+            if not verified and out.esito == "VERIFICATO":
+                out.esito = "NON VERIFICATO"
+    return outputs
+
+
+def _combined_lines(method: str, both, j: int) -> list[str]:
+    text = [
+        "  Taglio + torsione sulle stesse staffe:",
+        f"  Asw/s richiesto = {100.0 * both.asw_required[j]:.2f} cm²/m "
+        f"(assegnato {100.0 * both.asw_provided[j]:.2f} cm²/m), "
+        f"passo richiesto = {both.spacing_required[j]:.1f} cm",
+    ]
+    if method == "SLU":
+        text.append(f"  Interazione bielle T/TRcd + V/VRcd = {both.interaction[j]:.2f} (≤ 1)")
+    text.append(
+        f"  Esito taglio + torsione: {'VERIFICATO' if both.verified[j] else 'NON VERIFICATO'}"
+    )
+    return text
+
+
+def _torsion_lines(method: str, res, j: int, col: dict) -> list[str]:
+    text = [f"  Mt = {abs(col['T'][j]) / 100.0:.0f} kg·m"]
+    if method == "TA":
+        text.append(
+            f"  τ_max = {res.tau_max[j]:.2f} kg/cm² "
+            f"(τ_c0 = {col['tau_c0'][j]:.2f}, τ_c1 = {col['tau_c1'][j]:.2f} kg/cm²)"
+        )
+    else:
+        text.append(
+            f"  Mtu = {res.resistance[j] / 100.0:.0f} kg·m "
+            f"(bielle di cls Mtu3 = {res.strut_resistance[j] / 100.0:.0f} kg·m)"
+        )
+    if res.redesign[j]:
+        text.append("  Occorre riprogettare la sezione: sollecitazione torcente troppo elevata")
+    elif res.needs_reinforcement[j]:
+        text.append(f"  Armatura longitudinale a torsione Al = {res.al_required[j]:.2f} cm²")
+        if col["asw"][j] > 0:
+            text.append(f"  Passo staffe richiesto a torsione = {res.spacing_required[j]:.1f} cm")
+        if method == "TA" and col["Al"][j] > 0 and col["s"][j] > 0:
+            text.append(
+                f"  σ_f longitudinale = {res.sigma_long[j]:.0f} kg/cm², "
+                f"σ_f staffe = {res.sigma_stirrup[j]:.0f} kg/cm² (σ_fa = {col['sfa'][j]:.0f})"
+            )
+        if col["Al"][j] <= 0 or col["s"][j] <= 0 or col["asw"][j] <= 0:
+            text.append("  Armatura a torsione non assegnata (At, passo o diametro staffe nulli)")
+    else:
+        text.append("  Non occorre specifica armatura a torsione")
+    text.append(f"  Esito torsione: {'VERIFICATO' if res.verified[j] else 'NON VERIFICATO'}")
+    return text
@@ -1353,9 +1353,11 @@ class MainWindow(tk.Toplevel):
             return
         sections: list[Section] = self.serializer.import_from_csv(file_path)
         added = 0
-        for section in sections:
-            if self.repository.add_section(section):
-                added += 1
+        # Un solo salvataggio su file per l'intero import
+        with self.repository.batch():
+            for section in sections:
+                if self.repository.add_section(section):
+                    added += 1
         messagebox.showinfo("Importa CSV", f"Importate {added} sezioni")
 
     def export_csv(self) -> None:
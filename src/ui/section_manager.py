@@ -621,9 +621,11 @@ class SectionManager(tk.Toplevel):
             return
         sections = self.serializer.import_from_csv(file_path)
         added = 0
-        for section in sections:
-            if self.repository.add_section(section):
-                added += 1
+        # Un solo salvataggio su file per l'intero import
+        with self.repository.batch():
+            for section in sections:
+                if self.repository.add_section(section):
+                    added += 1
         notify_info("Importa CSV", f"Importate {added} sezioni", source="section_manager")
         self.refresh_sections()
         logger.debug("Import CSV completato: %s sezioni aggiunte", added)
@@ -0,0 +1,150 @@
+"""Process-pool computation of verification table rows.
+
+The section and material repositories are reduced to lightweight, picklable
+snapshots which are shipped once to every worker process (via the pool
+initializer); rows are then sent in chunks and results streamed back through
+:class:`src.utils.background.ProcessBatchExecutor`.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+from core_models.materials import MaterialValues
+from src.domain.domain.models import VerificationInput, VerificationOutput
+from src.utils.background import ProcessBatchExecutor
+
+logger = logging.getLogger(__name__)
+
+RowPair = tuple[str, VerificationInput]
+
+
+class SectionSnapshot:
+    """Read-only copy of a section repository exposing the lookup API used by
+    `get_section_geometry` (``find_by_id`` / ``find_by_name`` / ``get_all_sections``)."""
+
+    def __init__(self, sections: Iterable[Any]) -> None:
+        self._sections: list[Any] = list(sections)
+        self._by_id: dict[str, Any] = {}
+        self._by_name: dict[str, Any] = {}
+        self._by_normalized_name: dict[str, Any] = {}
+        for sec in self._sections:
+            sec_id = getattr(sec, "id", None)
+            if sec_id is not None:
+                self._by_id.setdefault(sec_id, sec)
+            name = getattr(sec, "name", None)
+            if name:
+                self._by_name.setdefault(name, sec)
+                self._by_normalized_name.setdefault(name.strip().casefold(), sec)
+
+    @classmethod
+    def from_repository(cls, repository: object | None) -> SectionSnapshot | None:
+        get_all = getattr(repository, "get_all_sections", None)
+        if not callable(get_all):
+            return None
+        return cls(get_all())
+
+    def find_by_id(self, section_id: str) -> Any | None:
+        return self._by_id.get(section_id)
+
+    def find_by_name(self, name: str, *, case_sensitive: bool = True) -> Any | None:
+        if case_sensitive:
+            return self._by_name.get(name)
+        return self._by_normalized_name.get(name.strip().casefold())
+
+    def get_all_sections(self) -> list[Any]:
+        return list(self._sections)
+
+
+class MaterialSnapshot:
+    """Read-only copy of a material repository exposing ``find_by_name`` and
+    the pre-extracted numeric views returned by ``get_values``."""
+
+    def __init__(self, materials: Iterable[Any]) -> None:
+        self._by_name: dict[str, Any] = {}
+        for mat in materials:
+            name = mat.get("name") if isinstance(mat, dict) else getattr(mat, "name", None)
+            if name:
+                # First match wins, as with the linear scans of the repositories
+                self._by_name.setdefault(name, mat)
+        self._values = {
+            name: MaterialValues.from_material(mat) for name, mat in self._by_name.items()
+        }
+
+    @classmethod
+    def from_repository(cls, repository: object | None) -> MaterialSnapshot | None:
+        get_all = getattr(repository, "get_all", None)
+        if not callable(get_all):
+            return None
+        return cls(get_all())
+
+    def find_by_name(self, name: str) -> Any | None:
+        return self._by_name.get(name)
+
+    def get_values(self, name: str) -> MaterialValues | None:
+        return self._values.get(name)
+
+
+# Per-process state populated by `init_worker`
+_WORKER_SECTIONS: SectionSnapshot | None = None
+_WORKER_MATERIALS: MaterialSnapshot | None = None
+
+
+def init_worker(sections: SectionSnapshot | None, materials: MaterialSnapshot | None) -> None:
+    """Pool initializer: store the repository snapshots in the worker process."""
+    global _WORKER_SECTIONS, _WORKER_MATERIALS  # pylint: disable=global-statement
+    _WORKER_SECTIONS = sections
+    _WORKER_MATERIALS = materials
+
+
+def compute_rows_chunk(chunk: list[RowPair]) -> list[tuple[str, VerificationOutput | None]]:
+    """Worker entry point: compute a chunk of (item_id, VerificationInput) pairs."""
+    from verification_table import compute_verification_result, compute_verification_results
+
+    try:
+        # One vectorized pass for the whole chunk (SLE rows share the crack-width batch)
+        outputs = compute_verification_results(
+            [row for _, row in chunk], _WORKER_SECTIONS, _WORKER_MATERIALS
+        )
+        return [(item_id, out) for (item_id, _), out in zip(chunk, outputs)]
+    except Exception:  # pylint: disable=broad-exception-caught
+        logger.exception("Errore calcolo blocco righe; ricalcolo riga per riga")
+
+    results: list[tuple[str, VerificationOutput | None]] = []
+    for item_id, row in chunk:
+        try:
+            out: VerificationOutput | None = compute_verification_result(
+                row, _WORKER_SECTIONS, _WORKER_MATERIALS
+            )
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Errore calcolo riga %s", item_id)
+            out = None
+        results.append((item_id, out))
+    return results
+
+
+def start_process_compute(
+    pairs: Iterable[RowPair],
+    section_repository: object | None,
+    material_repository: object | None,
+    *,
+    chunk_size: int = 200,
+    max_workers: int | None = None,
+) -> ProcessBatchExecutor:
+    """Start computing ``pairs`` in a process pool and return the running executor.
+
+    Results are ``(item_id, VerificationOutput | None)`` tuples to be collected
+    with :meth:`ProcessBatchExecutor.drain`.
+    """
+    executor = ProcessBatchExecutor(
+        max_workers=max_workers,
+        initializer=init_worker,
+        initargs=(
+            SectionSnapshot.from_repository(section_repository),
+            MaterialSnapshot.from_repository(material_repository),
+        ),
+    )
+    executor.map_chunks(compute_rows_chunk, pairs, chunk_size=chunk_size)
+    return executor
@@ -64,6 +64,9 @@ class VerificationTableApp(tk.Frame):
         *,
         search_limit: int = 200,
         display_limit: int = 50,
+        compute_mode: str = "thread",
+        compute_chunk_size: int = 200,
+        compute_flush_ms: int = 100,
     ) -> None:
         super().__init__(master)
         self.master = master
@@ -96,6 +99,17 @@ class VerificationTableApp(tk.Frame):
         self.search_limit = int(search_limit)
         self.display_limit = int(display_limit)
 
+        # "Compute all" settings:
+        # - compute_mode: "thread" (BackgroundExecutor) or "process" (process pool)
+        # - compute_chunk_size: rows sent to a worker process per task
+        # - compute_flush_ms: interval between Treeview updates in process mode
+        self.compute_mode = compute_mode
+        self.compute_chunk_size = int(compute_chunk_size)
+        self.compute_flush_ms = int(compute_flush_ms)
+        self._process_runner: Any = None
+        self._process_total: int = 0
+        self._process_done: int = 0
+
         self.section_names: list[str] = self._resolve_section_names(
             section_repository, section_names
         )
@@ -309,6 +323,13 @@ class VerificationTableApp(tk.Frame):
         tk.Button(top, text="Calcola tutte le righe", command=self._on_compute_all).pack(
             side="left", padx=(6, 0)
         )
+        self._process_mode_var = tk.BooleanVar(value=self.compute_mode == "process")
+        tk.Checkbutton(
+            top,
+            text="Multiprocesso",
+            variable=self._process_mode_var,
+            command=self._on_toggle_process_mode,
+        ).pack(side="left", padx=(6, 0))
         # Status label to show non-blocking progress messages
         self._status_var = tk.StringVar(value="")
         tk.Label(top, textvariable=self._status_var, anchor="w").pack(side="right")
@@ -1047,11 +1068,27 @@ class VerificationTableApp(tk.Frame):
         # Schedule all computations
         self._set_status(f"Calcolo in corso ({len(rows)} righe) …")
 
+        if self.compute_mode == "process" and self._start_process_compute(items, rows):
+            return
+
         # Fallback compute function (compatibility)
 
+        # SLE rows are computed together in a single vectorized task
+        sle_pairs = [
+            (it, row)
+            for it, row in zip(items, rows)
+            if (row.verification_method or "").upper().strip() == "SLE"
+        ]
+        sle_items = {it for it, _ in sle_pairs}
+        other_pairs = [(it, row) for it, row in zip(items, rows) if it not in sle_items]
+
         # Submit tasks
         if self._bg is not None:
-            for it, row in zip(items, rows):
+            if sle_pairs:
+                self._bg.submit(
+                    self._compute_for_pairs, sle_pairs, callback=self._on_batch_done, tk_root=self
+                )
+            for it, row in other_pairs:
                 self._bg.submit(
                     self._compute_for_pair, (it, row), callback=self._on_compute_done, tk_root=self
                 )
@@ -1059,12 +1096,66 @@ class VerificationTableApp(tk.Frame):
             self._clear_status(2000)
         else:
             # Synchronous fallback
-            for it, row in zip(items, rows):
+            for item_id, out in self._compute_for_pairs(sle_pairs):
+                self._apply_result_to_item(item_id, out)
+            for it, row in other_pairs:
                 item_id, out = self._compute_for_pair((it, row))
                 self._apply_result_to_item(item_id, out)
             self._set_status("Calcolo completato")
             self._clear_status(2000)
 
+    def _on_toggle_process_mode(self) -> None:
+        self.compute_mode = "process" if self._process_mode_var.get() else "thread"
+
+    def _start_process_compute(self, items: list[str], rows: list[VerificationInput]) -> bool:
+        """Start the process-pool computation. Returns False if it could not start."""
+        if self._process_runner is not None:
+            self._set_status("Calcolo già in corso …")
+            return True
+        try:
+            from src.ui.ui.compute_pool import start_process_compute
+
+            self._process_runner = start_process_compute(
+                zip(items, rows),
+                self.section_repository,
+                self.material_repository,
+                chunk_size=self.compute_chunk_size,
+            )
+        except Exception:
+            logger.exception("Avvio calcolo multiprocesso fallito; uso thread")
+            self._process_runner = None
+            return False
+        self._process_total = len(rows)
+        self._process_done = 0
+        self.after(self.compute_flush_ms, self._poll_process_results)
+        return True
+
+    def _poll_process_results(self) -> None:
+        """Apply the results collected since the last tick in a single batch."""
+        runner = self._process_runner
+        if runner is None:
+            return
+        # Read the flag before draining so that no result is left behind
+        finished = runner.done
+        for item_id, out in runner.drain():
+            self._apply_result_to_item(item_id, out)
+            self._process_done += 1
+        if not finished:
+            self._set_status(f"Calcolo in corso ({self._process_done}/{self._process_total}) …")
+            self.after(self.compute_flush_ms, self._poll_process_results)
+            return
+        self._process_runner = None
+        try:
+            runner.shutdown(wait=False)
+        except Exception:
+            logger.exception("Errore chiusura process pool")
+        if runner.errors:
+            self._set_status("Calcolo terminato con errori")
+            self._clear_status(3000)
+        else:
+            self._set_status("Calcolo completato")
+            self._clear_status(2000)
+
     def _compute_for_pair(self, idx_item_row):
         from verification_table import compute_verification_result
 
@@ -1077,6 +1168,27 @@ class VerificationTableApp(tk.Frame):
             res = None
         return item_id, res
 
+    def _compute_for_pairs(self, pairs):
+        from verification_table import compute_verification_results
+
+        if not pairs:
+            return []
+        try:
+            outputs = compute_verification_results(
+                [row for _, row in pairs], self.section_repository, self.material_repository
+            )
+        except Exception:
+            outputs = [None] * len(pairs)
+        return [(item_id, out) for (item_id, _), out in zip(pairs, outputs)]
+
+    def _on_batch_done(self, results) -> None:
+        if isinstance(results, Exception):
+            self._set_status("Calcolo terminato con errori")
+            self._clear_status(3000)
+            return
+        for res_tuple in results:
+            self._on_compute_done(res_tuple)
+
     def _on_compute_done(self, res_tuple) -> None:
         if isinstance(res_tuple, Exception):
             # error occurred
@@ -4,13 +4,19 @@ results back to the GUI/main thread.
 This module provides a small helper `BackgroundExecutor` which submits callables
 to a background threadpool and will schedule a completion callback on a
 Tkinter `tk_root` using `tk_root.after(0, ...)` when available.
+
+For CPU-bound work `ProcessBatchExecutor` runs a worker over chunks of items in
+a process pool; results are collected in a thread-safe queue that the GUI
+drains periodically (e.g. from a `tk_root.after(N, ...)` polling loop).
 """
 
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
-from concurrent.futures import Future, ThreadPoolExecutor
+import queue
+import threading
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Any
 
 
@@ -74,3 +80,93 @@ class BackgroundExecutor:
 
         """
         self._executor.shutdown(wait=wait)
+
+
+class ProcessBatchExecutor:
+    """ProcessPoolExecutor wrapper that processes items in chunks.
+
+    Each chunk is sent to a worker process as a single task; the worker must
+    return a sequence of results which are pushed to an internal queue as soon
+    as the chunk completes. The GUI thread calls :meth:`drain` at a fixed
+    interval, so the number of Tk callbacks does not grow with the number of
+    items.
+
+    Usage:
+        bg = ProcessBatchExecutor(initializer=init, initargs=(snapshot,))
+        bg.map_chunks(worker, items, chunk_size=200)
+        # later, from the GUI thread
+        for result in bg.drain():
+            ...
+        if bg.done: bg.shutdown()
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        initializer: Callable[..., None] | None = None,
+        initargs: tuple[Any, ...] = (),
+    ) -> None:
+        # ``initializer`` runs once per worker process: use it to ship data
+        # shared by all chunks (e.g. repository snapshots) a single time.
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers, initializer=initializer, initargs=initargs
+        )
+        self._results: queue.SimpleQueue[Any] = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._pending = 0
+        self.errors: list[BaseException] = []
+
+    def map_chunks(
+        self,
+        fn: Callable[[list[Any]], Sequence[Any]],
+        items: Iterable[Any],
+        chunk_size: int = 200,
+    ) -> int:
+        """Submit ``fn`` once per chunk of ``items``. Returns the number of chunks."""
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        items = list(items)
+        chunks = [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+        for chunk in chunks:
+            with self._lock:
+                self._pending += 1
+            future = self._executor.submit(fn, chunk)
+            future.add_done_callback(self._on_chunk_done)
+        return len(chunks)
+
+    def _on_chunk_done(self, fut: Future[Any]) -> None:
+        try:
+            for result in fut.result():
+                self._results.put(result)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logging.exception("Background chunk raised an exception")
+            self.errors.append(e)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    @property
+    def done(self) -> bool:
+        """True once every submitted chunk has completed (results may still be queued)."""
+        with self._lock:
+            return self._pending == 0
+
+    def drain(self, max_items: int | None = None) -> list[Any]:
+        """Return the results collected so far (at most ``max_items``)."""
+        drained: list[Any] = []
+        while max_items is None or len(drained) < max_items:
+            try:
+                drained.append(self._results.get_nowait())
+            except queue.Empty:
+                break
+        return drained
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        """Shut down the underlying process pool.
+
+        Args:
+            wait: if True block until all work is done.
+            cancel_futures: if True cancel chunks that have not started yet.
+
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
@@ -0,0 +1,93 @@
+import json
+import math
+
+import numpy as np
+import pytest
+
+from calculations.pilastri.stabilita import omega_ca
+from src.core_calculus.core import abachi
+from src.core_calculus.core.abachi import AbachiRegistry, get_abaco
+from src.core_calculus.core.shear import allowable_shear_stresses
+
+
+def test_shipped_abachi_match_the_formulas_they_digitize():
+    # f_OmegaCA nodes, linear in between, 10 beyond the table
+    lam = [0.0, 50.0, 60.0, 85.0, 110.0, 140.0, 140.1]
+    omega = [1.0, 1.0, 1.04, 1.32, 1.95, 3.0, 10.0]
+    assert get_abaco("rd2229_omega")("omega", lam[:-1]) == pytest.approx(omega[:-1])
+    assert omega_ca(lam) == pytest.approx(omega)
+
+    rck = np.array([180.0, 250.0, 420.0])
+    dm92 = np.stack([60.0 + (rck - 150.0) / 4, 4.0 + (rck - 150.0) / 75, 14.0 + (rck - 150.0) / 35])
+    assert get_abaco("dm92_tensioni_ammissibili").evaluate(rck) == pytest.approx(dm92)
+    assert np.stack(allowable_shear_stresses(rck)) == pytest.approx(dm92[1:])
+    # Outside the tabulated 150-500 the DM92 formulas are extrapolated
+    taus = np.stack(allowable_shear_stresses([120.0, 600.0]))
+    assert taus == pytest.approx(np.array([[3.6, 10.0], [14.0 - 30.0 / 35, 14.0 + 450.0 / 35]]))
+
+    # Design with r, t at a grid node: sigma_c and sigma_f reach the allowable values
+    rt = get_abaco("ta_flessione_rettangolare")
+    M, b, sc, sf = 1.5e6, 30.0, 60.0, 1400.0
+    r, t, xi = rt.evaluate(sc, sf)
+    d, As = r * math.sqrt(M / b), t * math.sqrt(M * b)
+    x = xi * d
+    assert 0.5 * sc * b * x * (d - x / 3) == pytest.approx(M, rel=1e-4)
+    assert As * sf * (d - x / 3) == pytest.approx(M, rel=1e-4)
+    assert rt("r", sc, sf) == pytest.approx(r)
+
+
+def _write_family(path, n_first=1.0):
+    path.write_text(
+        json.dumps(
+            {
+                "id": "famiglia",
+                "x": {"name": "x"},
+                "param": {"name": "n"},
+                "curves": [
+                    {"name": "n2", "param": 2.0, "x": [0.0, 10.0], "y": [0.0, 20.0]},
+                    {"name": "n1", "param": n_first, "x": [0.0, 5.0, 10.0], "y": [0.0, 5.0, 10.0]},
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
+def test_registry_compiles_once_and_refreshes_edited_sources(tmp_path, monkeypatch):
+    source = tmp_path / "famiglia.json"
+    _write_family(source)
+    fam = AbachiRegistry(tmp_path).get("famiglia")
+    assert (tmp_path / "famiglia.npz").exists()
+    assert fam.names == ("n1", "n2")  # ordered by family parameter
+    assert fam.x.tolist() == [0.0, 5.0, 10.0]
+    assert fam.evaluate([2.5, 20.0]) == pytest.approx(np.array([[2.5, 10.0], [5.0, 20.0]]))
+    assert fam.family(1.5, 4.0) == pytest.approx(6.0)
+
+    def fail(_data):
+        raise AssertionError("source recompiled")
+
+    with monkeypatch.context() as m:
+        m.setattr(abachi, "_compile_source", fail)
+        cached = AbachiRegistry(tmp_path).get("famiglia")
+    assert cached.family(1.5, 4.0) == pytest.approx(6.0)
+
+    _write_family(source, n_first=0.0)
+    registry = AbachiRegistry(tmp_path)
+    assert registry.ids() == ["famiglia"]
+    assert registry["famiglia"].params.tolist() == [0.0, 2.0]
+    with pytest.raises(KeyError):
+        registry.get("missing")
+
+
+def test_corrupt_cache_is_recompiled_and_rewritten(tmp_path):
+    source = tmp_path / "famiglia.json"
+    _write_family(source)
+    abachi.load_abaco(source)
+    cache = tmp_path / "famiglia.npz"
+    cache.write_bytes(cache.read_bytes()[:40])  # truncated zip
+
+    fam = abachi.load_abaco(source)
+    assert fam.family(1.5, 4.0) == pytest.approx(6.0)
+    with np.load(cache) as npz:
+        assert "values" in npz.files
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["famiglia.json", "famiglia.npz"]
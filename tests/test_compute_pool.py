@@ -0,0 +1,83 @@
+import time
+from types import SimpleNamespace
+
+from src.domain.domain.models import VerificationInput, VerificationOutput
+from src.ui.ui import compute_pool
+from src.ui.ui.verification_table_app import VerificationTableApp
+from src.utils.background import ProcessBatchExecutor
+
+
+def test_process_batch_executor_collects_chunk_results():
+    bg = ProcessBatchExecutor(max_workers=2)
+    n_chunks = bg.map_chunks(sorted, [5, 3, 9, 1, 7], chunk_size=2)
+    assert n_chunks == 3
+
+    deadline = time.time() + 30
+    results = []
+    while time.time() < deadline:
+        finished = bg.done
+        results.extend(bg.drain())
+        if finished:
+            break
+        time.sleep(0.01)
+    bg.shutdown()
+    assert sorted(results) == [1, 3, 5, 7, 9]
+    assert not bg.errors
+
+
+def test_compute_rows_chunk_uses_worker_snapshots():
+    section = SimpleNamespace(id="s1", name="Trave 30x50", width=30.0, height=50.0)
+    compute_pool.init_worker(compute_pool.SectionSnapshot([section]), None)
+    try:
+        rows = [
+            ("row1", VerificationInput(section_id="Trave 30x50", Mx=1000.0, As_inf=6.0)),
+            ("row2", VerificationInput(section_id="s1", Mx=2000.0, As_inf=6.0)),
+        ]
+        results = compute_pool.compute_rows_chunk(rows)
+    finally:
+        compute_pool.init_worker(None, None)
+    assert [item for item, _ in results] == ["row1", "row2"]
+    assert all(isinstance(out, VerificationOutput) for _, out in results)
+
+
+def test_poll_process_results_applies_batches():
+    class FakeRunner:
+        def __init__(self, batches):
+            self._batches = list(batches)
+            self.errors = []
+            self.shutdown_called = False
+
+        @property
+        def done(self):
+            return len(self._batches) <= 1
+
+        def drain(self):
+            return self._batches.pop(0) if self._batches else []
+
+        def shutdown(self, wait=True):
+            self.shutdown_called = True
+
+    applied = []
+    scheduled = []
+    runner = FakeRunner([[("a", 1), ("b", 2)], [("c", 3)]])
+    app = SimpleNamespace(
+        _process_runner=runner,
+        _process_done=0,
+        _process_total=3,
+        compute_flush_ms=50,
+        _apply_result_to_item=lambda item, out: applied.append((item, out)),
+        _set_status=lambda _text: None,
+        _clear_status=lambda _delay=0: None,
+        after=lambda ms, cb: scheduled.append(ms),
+    )
+    app._poll_process_results = lambda: VerificationTableApp._poll_process_results(app)
+
+    VerificationTableApp._poll_process_results(app)
+    assert applied == [("a", 1), ("b", 2)]
+    assert scheduled == [50]
+
+    VerificationTableApp._poll_process_results(app)
+    assert applied[-1] == ("c", 3)
+    assert app._process_done == 3
+    assert app._process_runner is None
+    assert runner.shutdown_called
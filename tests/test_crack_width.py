@@ -0,0 +1,91 @@
+import math
+from types import SimpleNamespace
+
+import pytest
+
+from src.core_calculus.core.crack_width import crack_width_batch, cracked_section_stresses
+from src.domain.domain.models import VerificationInput
+from src.methods.verification.methods_sle import compute_sle_verification
+
+B, H, A = 30.0, 50.0, 4.0
+AS = 3 * math.pi * 2.0**2 / 4  # 3 phi 20
+
+
+def test_cracked_bending_matches_closed_form_both_signs():
+    n, d, M = 15.0, H - A, 1.5e6
+    x = (-n * AS + math.sqrt((n * AS) ** 2 + 2 * B * n * AS * d)) / B
+    I_cr = B * x**3 / 3 + n * AS * (d - x) ** 2
+
+    st = cracked_section_stresses(B, H, [AS, 0.0], A, [0.0, AS], A, 0.0, [M, -M], n)
+    assert st.converged.all()
+    assert st.flipped.tolist() == [False, True]
+    assert st.x == pytest.approx([x, x])
+    assert st.sigma_c == pytest.approx([M * x / I_cr] * 2)
+    assert st.sigma_s == pytest.approx([n * M * (d - x) / I_cr] * 2)
+
+
+def test_crack_width_2008_hand_calculation():
+    n, d, M = 15.0, H - A, 1.5e6
+    fctm, Ec, Es, kt, k1 = 26.0, 320000.0, 2.0e6, 0.4, 0.8
+    res = crack_width_batch(
+        B, H, AS, A, 0.0, A, 0.0, M, phi=2.0, fctm=fctm, Ec=Ec, Es=Es, n_homog=n
+    )
+
+    x = (-n * AS + math.sqrt((n * AS) ** 2 + 2 * B * n * AS * d)) / B
+    sig_s = n * M * (d - x) / (B * x**3 / 3 + n * AS * (d - x) ** 2)
+    c = A - 1.0
+    h_eff = min(2.5 * A, H / 2, (H - x) / 3)
+    rho = AS / (h_eff * B)  # 3 bars spread over the width: b_eff = b
+    eps = max((sig_s - kt * fctm / rho * (1 + Es / Ec * rho)) / Es, 0.6 * sig_s / Es)
+    sr = 3.4 * c + 0.425 * k1 * 0.5 * 2.0 / rho
+    assert res.rho_eff[()] == pytest.approx(rho)
+    assert res.sr_max[()] == pytest.approx(sr)
+    assert res.wk[()] == pytest.approx(eps * sr)
+
+
+def test_crack_width_zero_when_uncracked_and_1996_method_runs():
+    kwargs = dict(phi=2.0, fctm=26.0, Ec=320000.0)
+    res = crack_width_batch(B, H, AS, A, AS, A, [-2.0e5, 0.0], [1.0e5, 1.5e6], **kwargs)
+    assert res.wk[0] == 0.0 and res.sigma_s[0] == 0.0
+    res96 = crack_width_batch(B, H, AS, A, AS, A, 0.0, 1.5e6, method="1996", **kwargs)
+    assert 0.0 < res96.wk[()] < 1.7 * res.sigma_s[1] / 2.1e6 * res96.sr_max[()]
+    with pytest.raises(ValueError):
+        crack_width_batch(B, H, AS, A, 0.0, A, 0.0, 1.0, method="2018", **kwargs)
+
+
+def _sle(repo, **kwargs):
+    row = VerificationInput(section_id="s1", verification_method="SLE", As_inf=AS, **kwargs)
+    return compute_sle_verification(row, repo, None)
+
+
+def test_sle_verification_matches_cracked_closed_form():
+    repo = SimpleNamespace(
+        find_by_id=lambda _id: SimpleNamespace(id="s1", name="T", width=B, height=H)
+    )
+    n, d, M, As_c = 15.0, H - A, 15000.0 * 100, 3.0
+    # b x²/2 + n As' (x - a') - n As (d - x) = 0
+    p, q = n * (AS + As_c), n * (AS * d + As_c * A)
+    x = (-p + math.sqrt(p**2 + 2 * B * q)) / B
+    I_cr = B * x**3 / 3 + n * As_c * (x - A) ** 2 + n * AS * (d - x) ** 2
+    out = _sle(repo, Mx=15000.0, As_sup=As_c)
+    assert out.esito != "ERRORE" and "wk =" in out.deformazioni
+    assert out.asse_neutro == pytest.approx(x)
+    assert out.sigma_s_max == pytest.approx(n * M * (d - x) / I_cr)
+    assert out.sigma_c_max == pytest.approx(M * x / I_cr)
+
+
+def test_sle_axial_force_is_positive_in_tension():
+    repo = SimpleNamespace(
+        find_by_id=lambda _id: SimpleNamespace(id="s1", name="T", width=B, height=H)
+    )
+    N = 20000.0
+    # Tension: bars only, equal layers share N
+    pulled = _sle(repo, N=N, As_sup=AS)
+    assert pulled.sigma_s_max == pytest.approx(N / (2 * AS)) and pulled.sigma_c_max == 0.0
+    # Compression: whole section reacting, bars compressed
+    pushed = _sle(repo, N=-N, As_sup=AS)
+    assert pushed.sigma_c_max == pytest.approx(N / (B * H + 15.0 * 2 * AS))
+    assert pushed.sigma_s_max == 0.0
+    # Under bending, tension raises and compression lowers the steel stress
+    bent = [_sle(repo, N=n_ax, Mx=15000.0, As_sup=3.0).sigma_s_max for n_ax in (N, 0.0, -N)]
+    assert bent[0] > bent[1] > bent[2] > 0.0
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from src.core_calculus.core.verification_core import (
+    MaterialProperties,
+    ReinforcementLayer,
+    SectionGeometry,
+    calculate_neutral_axis_deviated_bending,
+)
+from src.core_calculus.core.verification_engine import VerificationEngine
+
+SECTION = SectionGeometry(width=30.0, height=50.0)
+TENSILE = ReinforcementLayer(area=9.4, distance=46.0)
+COMPRESSED = ReinforcementLayer(area=3.0, distance=4.0)
+MATERIAL = MaterialProperties(fck=250.0, fcd=141.7, fyk=4500.0, fyd=3913.0, Es=2.06e6)
+
+
+def _axis(N, **kwargs):
+    return calculate_neutral_axis_deviated_bending(
+        SECTION, TENSILE, COMPRESSED, MATERIAL, Mx=2000.0, My=800.0, N=N, **kwargs
+    )
+
+
+def _residual(x, N):
+    eps = 0.0035 * (x - np.array([4.0, 46.0])) / x
+    sigma = np.clip(2.06e6 * eps, -3913.0, 3913.0)
+    return 0.8 * 30.0 * 141.7 * x + 3.0 * sigma[0] + 9.4 * sigma[1] + N
+
+
+def test_newton_solves_equilibrium_and_reports_iterations():
+    for N in (0.0, -40000.0, 20000.0):
+        axis = _axis(N)
+        assert axis.converged
+        assert abs(_residual(axis.x, N)) < 1e-3
+        assert 0 < axis.iterations <= 10
+    assert axis.inclination == pytest.approx(np.degrees(np.arctan2(800.0, 2000.0)))
+
+
+def test_warm_start_and_out_of_range_axial_force():
+    previous = _axis(20000.0)
+    warm = _axis(21000.0, x0=previous.x)
+    assert warm.converged and warm.iterations <= 3
+    assert warm.iterations < _axis(21000.0).iterations
+    assert warm.x == pytest.approx(_axis(21000.0).x, abs=1e-6)
+    crushed = _axis(-1.0e6)
+    assert not crushed.converged
+    assert crushed.x == pytest.approx(0.999 * SECTION.height)
+
+
+def test_batch_rows_on_same_section_chain_the_warm_start():
+    engine = VerificationEngine("SLU")
+    N = np.linspace(-60000.0, 0.0, 8)
+    batch = engine.perform_verification_batch(
+        30.0, 50.0, 9.4, 46.0, 3.0, 4.0, MATERIAL, N=N, Mx=2000.0, My=800.0
+    )
+    expected = [_axis(n).x for n in N]
+    assert batch.neutral_axis_x == pytest.approx(expected, abs=1e-4)
@@ -0,0 +1,91 @@
+import math
+
+import numpy as np
+import pytest
+
+from historical_ta import (
+    ConcreteLawTA,
+    LoadState,
+    PolygonEdges,
+    SectionGeometry,
+    SteelLawTA,
+    clip_polygon_half_plane,
+    compute_normal_stresses_ta,
+    compute_section_properties,
+)
+from historical_ta.geometry import _polygon_area_centroid_inertia
+
+CONCRETE = ConcreteLawTA(
+    fcd=100.0, Ec=200000.0, eps_c2=0.002, eps_c3=0.002, eps_c4=0.002, eps_cu=0.0035
+)
+STEEL = SteelLawTA(Es=2.0e6, fyd=1.0e9, eps_yd=1.0, eps_su=1.0)
+
+
+def test_clip_integrals_match_clipped_polygon():
+    # U-shaped (non-convex) ring: the cut line crosses it in four points
+    ring = [(0, 0), (40, 0), (40, 50), (30, 50), (30, 10), (10, 10), (10, 50), (0, 50)]
+    origin = (12.0, 7.0)
+    edges = PolygonEdges.from_polygons([ring], origin=origin)
+    a, b, c = 0.3, 1.0, -30.0  # keep 0.3 y' + z' <= 30
+    A, Sy, Sz, Iy, Iz, Iyz = edges.clip_integrals(a, b, c)
+
+    # Reference: brute force on a fine grid
+    h = 0.05
+    ys, zs = np.meshgrid(np.arange(h / 2, 40, h), np.arange(h / 2, 50, h))
+    inside = ~((ys > 10) & (ys < 30) & (zs > 10))
+    yr, zr = ys - origin[0], zs - origin[1]
+    inside &= a * yr + b * zr + c <= 0
+    yr, zr = yr[inside], zr[inside]
+    dA = h * h
+    assert A == pytest.approx(inside.sum() * dA, rel=2e-3)
+    assert Sy == pytest.approx((yr * dA).sum(), rel=2e-3)
+    assert Sz == pytest.approx((zr * dA).sum(), rel=2e-3)
+    assert Iy == pytest.approx((zr**2 * dA).sum(), rel=2e-3)
+    assert Iz == pytest.approx((yr**2 * dA).sum(), rel=2e-3)
+    assert Iyz == pytest.approx((yr * zr * dA).sum(), rel=2e-3)
+
+
+def test_clip_polygon_half_plane_rectangle():
+    clipped = clip_polygon_half_plane([(0, 0), (30, 0), (30, 50), (0, 50)], 0.0, 1.0, -20.0)
+    area, _, zc, *_ = _polygon_area_centroid_inertia(clipped)
+    assert abs(area) == pytest.approx(600.0)
+    assert zc == pytest.approx(10.0)
+
+
+def test_exact_cracked_bending_matches_closed_form():
+    b, h, d, phi = 30.0, 50.0, 46.0, 2.0
+    bars = [(7.0, 4.0, phi), (15.0, 4.0, phi), (23.0, 4.0, phi)]
+    geom = SectionGeometry(polygons=[[(0, 0), (b, 0), (b, h), (0, h)]], bars=bars, n_homog=10)
+    M = -10000.0  # kg·m, compressed top fibre
+    props = compute_section_properties(geom)
+    res = compute_normal_stresses_ta(
+        geom, props, LoadState(0.0, M, 0.0), CONCRETE, STEEL, method="exact"
+    )
+    assert res.converged
+
+    n, As = 10.0, 3 * math.pi * phi**2 / 4
+    x = (-n * As + math.sqrt((n * As) ** 2 + 2 * b * n * As * d)) / b
+    I_cr = b * x**3 / 3 + n * As * (d - x) ** 2
+    assert res.sigma_c_min == pytest.approx(-abs(M) * 100 * x / I_cr, rel=1e-9)
+    assert res.sigma_s_max == pytest.approx(n * abs(M) * 100 * (d - x) / I_cr, rel=1e-9)
+
+
+def test_exact_agrees_with_fiber_on_circle_in_biaxial_bending():
+    ring = [
+        (20 * math.cos(2 * math.pi * i / 64), 20 * math.sin(2 * math.pi * i / 64))
+        for i in range(64)
+    ]
+    bars = [
+        (16 * math.cos(2 * math.pi * i / 12), 16 * math.sin(2 * math.pi * i / 12), 1.6)
+        for i in range(12)
+    ]
+    geom = SectionGeometry([ring], bars, n_homog=10)
+    props = compute_section_properties(geom)
+    loads = LoadState(-20000.0, 3000.0, 2000.0)
+    exact = compute_normal_stresses_ta(geom, props, loads, CONCRETE, STEEL, method="exact")
+    fiber = compute_normal_stresses_ta(
+        geom, props, loads, CONCRETE, STEEL, method="fiber", mesh_size=0.5
+    )
+    assert exact.converged
+    assert exact.sigma_c_min == pytest.approx(fiber.sigma_c_min, rel=5e-3)
+    assert exact.sigma_s_max == pytest.approx(fiber.sigma_s_max, rel=5e-3)
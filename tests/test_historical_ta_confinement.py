@@ -0,0 +1,104 @@
+import math
+
+import pytest
+
+from historical_ta import (
+    ConcreteLawTA,
+    FRPConfinement,
+    SectionGeometry,
+    SteelJacketConfinement,
+    SteelLawTA,
+    StirrupConfinement,
+    clear_confinement_cache,
+    confined_concrete,
+    confined_concrete_law,
+    ultimate_domain_for,
+)
+
+FCK = 250.0
+CONCRETE = ConcreteLawTA(
+    fcd=0.85 * FCK / 1.5,
+    Ec=300000.0,
+    eps_c2=0.002,
+    eps_c3=0.00175,
+    eps_c4=0.0007,
+    eps_cu=0.0035,
+)
+FYD = 3913.0
+STEEL = SteelLawTA(Es=2.06e6, fyd=FYD, eps_yd=FYD / 2.06e6, eps_su=0.01)
+B = H = 40.0
+
+
+def test_stirrups_follow_ntc_confinement():
+    c = StirrupConfinement(
+        B,
+        H,
+        cover=3.0,
+        stirrup_diameter=1.0,
+        step=10.0,
+        fyk=4500.0,
+        bars_y=3,
+        bars_z=3,
+        bar_diameter=2.0,
+    )
+    res = confined_concrete(CONCRETE, c, fck=FCK)
+    bc = B - 6.0 + 1.0
+    gap = (B - 2 * 4.0) / 2
+    alpha = (1 - 8 * gap**2 / (6 * bc * bc)) * (1 - 10.0 / (2 * bc)) ** 2
+    sig_l = 2 * math.pi * 0.25 * 4500.0 / (bc * 10.0)
+    sig2 = alpha * sig_l
+    fck_c = FCK * (1.125 + 2.5 * sig2 / FCK) if sig2 > 0.05 * FCK else FCK * (1 + 5 * sig2 / FCK)
+    assert res.efficiency == pytest.approx(alpha)
+    assert res.effective_pressure == pytest.approx(sig2)
+    assert res.law.fcd == pytest.approx(0.85 * fck_c / 1.5)
+    assert res.law.eps_c2 == pytest.approx(0.002 * (fck_c / FCK) ** 2)
+    assert res.law.eps_cu == pytest.approx(0.0035 + 0.2 * sig2 / FCK)
+    with pytest.raises(ValueError):
+        confined_concrete(CONCRETE, c)
+
+
+def test_frp_and_jacket_models():
+    frp = FRPConfinement(
+        B,
+        H,
+        corner_radius=2.0,
+        thickness=0.0165,
+        width=1.0,
+        spacing=1.0,
+        E_frp=2.3e6,
+        eps_fd=0.015,
+        fpk=48000.0,
+    )
+    res = confined_concrete(CONCRETE, frp)
+    k_h = 1 - 2 * 36.0**2 / (3 * B * H)
+    rho = 2 * (B + H) * 0.0165 / (B * H)
+    f_eff = k_h * 0.5 * rho * 2.3e6 * 0.004
+    assert res.law.fcd == pytest.approx(
+        CONCRETE.fcd * (1 + 2.6 * (f_eff / CONCRETE.fcd) ** (2 / 3))
+    )
+    assert res.law.eps_c2 == CONCRETE.eps_c2
+
+    jacket = SteelJacketConfinement(
+        B, H, corner_radius=0.0, thickness=0.8, width=5.0, spacing=30.0, fyd=2350.0 / 1.05
+    )
+    res = confined_concrete(CONCRETE, jacket)
+    rho = 2 * 80 * 0.8 * 5 / (B * H * 30)
+    f_eff = (1 - 2 / 3) * (1 - 25.0 / 80) ** 2 * 0.5 * rho * (2350.0 / 1.05)
+    assert res.effective_pressure == pytest.approx(f_eff)
+    assert res.law.eps_cu == pytest.approx(0.0035 + 0.5 * f_eff / res.law.fcd)
+
+
+def test_confined_laws_are_cached_and_feed_the_domain():
+    clear_confinement_cache()
+    c = StirrupConfinement(B, H, cover=3.0, stirrup_diameter=1.0, step=7.5, fyk=4500.0)
+    law = confined_concrete_law(CONCRETE, c, fck=FCK)
+    assert confined_concrete(CONCRETE, c, fck=FCK).law is law
+    assert confined_concrete_law(CONCRETE, c, fck=FCK) is law
+
+    bars = [(4.0, 4.0, 2.0), (36.0, 4.0, 2.0), (36.0, 36.0, 2.0), (4.0, 36.0, 2.0)]
+    geom = SectionGeometry([[(0, 0), (B, 0), (B, H), (0, H)]], bars, n_homog=1)
+    plain = ultimate_domain_for(geom, CONCRETE, STEEL, n_angles=8)
+    confined = ultimate_domain_for(geom, law, STEEL, n_angles=8)
+    As = 4 * math.pi
+    assert confined.N_min == pytest.approx(-(law.fcd * B * H + As * FYD))
+    assert confined.N_min < plain.N_min
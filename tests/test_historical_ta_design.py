@@ -0,0 +1,72 @@
+import numpy as np
+
+from historical_ta import (
+    ConcreteLawTA,
+    DesignMaterials,
+    RebarDesignProblem,
+    RebarLayout,
+    SteelLawTA,
+    design_reinforcement,
+    enumerate_layouts,
+    prune_layouts,
+)
+from historical_ta.design import _verify_chunk
+from historical_ta.fiber import fiber_section_for
+
+CONCRETE = ConcreteLawTA(
+    fcd=141.7, Ec=300000.0, eps_c2=0.002, eps_c3=0.00175, eps_c4=0.0007, eps_cu=0.0035
+)
+STEEL = SteelLawTA(Es=2.0e6, fyd=3913.0, eps_yd=3913.0 / 2.0e6, eps_su=0.01)
+
+
+def _problem(**kwargs):
+    base = dict(
+        B=30.0,
+        H=50.0,
+        cover=3.0,
+        loads=((0.0, -20000.0, 0.0), (-60000.0, -15000.0, 3000.0)),
+        materials=DesignMaterials.slu(CONCRETE, STEEL),
+        diameters=(1.2, 1.6, 2.0),
+    )
+    base.update(kwargs)
+    return RebarDesignProblem(**base)
+
+
+def test_design_returns_lightest_passing_layouts():
+    problem = _problem()
+    res = design_reinforcement(problem, n_results=3, max_workers=1)
+    assert len(res.layouts) == 3
+    weights = [lay.weight for lay in res.layouts]
+    assert weights == sorted(weights)
+    assert all(lay.safety_factor >= 1.0 for lay in res.layouts)
+    assert 0 < res.n_verified < res.n_candidates
+    best = res.best
+    assert best.geometry(problem).bars and "inf" in best.describe()
+
+
+def test_pruning_keeps_layouts_that_pass():
+    problem = _problem()
+    layouts = enumerate_layouts(problem)
+    mask = prune_layouts(problem, layouts)
+    assert 0 < mask.sum() < len(layouts)
+    rng = np.random.default_rng(0)
+    sample = rng.choice(len(layouts), 40, replace=False)
+    rows = [(int(i), RebarLayout.from_row(layouts[i])) for i in sample]
+    for index, sf in _verify_chunk(problem, rows):
+        if sf >= 1.0:
+            assert mask[index]
+
+
+def test_no_layout_message_when_loads_exceed_capacity():
+    res = design_reinforcement(_problem(loads=((-2.0e6, 0.0, 0.0),)), max_workers=1)
+    assert res.best is None and res.layouts == []
+    assert res.n_verified == 0 and res.messages
+
+
+def test_concrete_mesh_shared_between_layouts():
+    problem = _problem()
+    a, b = enumerate_layouts(problem)[[0, -1]]
+    fa = fiber_section_for(RebarLayout.from_row(a).geometry(problem), 2.5)
+    fb = fiber_section_for(RebarLayout.from_row(b).geometry(problem), 2.5)
+    assert fa is not fb
+    assert fa.y is fb.y
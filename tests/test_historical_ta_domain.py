@@ -0,0 +1,97 @@
+import math
+
+import numpy as np
+import pytest
+
+from historical_ta import (
+    ConcreteLawTA,
+    LoadState,
+    SectionGeometry,
+    SteelLawTA,
+    allowable_domain_for,
+    check_domain_batch,
+    compute_normal_stresses_ta,
+    compute_section_properties,
+    ultimate_domain_for,
+)
+
+CONCRETE = ConcreteLawTA(
+    fcd=110.0, Ec=300000.0, eps_c2=0.002, eps_c3=0.00175, eps_c4=0.0007, eps_cu=0.0035
+)
+FYD = 3913.0
+STEEL = SteelLawTA(Es=2.06e6, fyd=FYD, eps_yd=FYD / 2.06e6, eps_su=0.01)
+B, H, PHI = 30.0, 50.0, 2.0
+AS = 3 * math.pi * PHI**2 / 4
+
+
+def _beam():
+    bars = [(7.0, 4.0, PHI), (15.0, 4.0, PHI), (23.0, 4.0, PHI)]
+    return SectionGeometry([[(0, 0), (B, 0), (B, H), (0, H)]], bars, n_homog=1)
+
+
+def test_domain_axial_limits_and_pure_bending():
+    domain = ultimate_domain_for(_beam(), CONCRETE, STEEL)
+    assert domain.N_max == pytest.approx(AS * FYD)
+    assert domain.N_min == pytest.approx(-(CONCRETE.fcd * B * H + AS * FYD))
+
+    # Parabola-rectangle stress block: resultant 0.8095 fcd b x at 0.416 x
+    x = AS * FYD / (0.8095 * CONCRETE.fcd * B)
+    M_rd = AS * FYD * (46.0 - 0.416 * x) / 100.0
+    my, mz = domain.section_at(0.0)
+    assert -my.min() == pytest.approx(M_rd, rel=2e-3)
+
+
+def test_domain_is_cached_and_checks_batches():
+    geom = _beam()
+    domain = ultimate_domain_for(geom, CONCRETE, STEEL)
+    assert ultimate_domain_for(_beam(), CONCRETE, STEEL) is domain
+
+    my, _ = domain.section_at(0.0)
+    N = np.array([0.0, 0.0, -50000.0, domain.N_min * 1.01, -150000.0])
+    My = np.array([0.95 * my.min(), 1.05 * my.min(), 0.0, 0.0, 0.0])
+    Mz = np.zeros_like(N)
+    assert domain.contains(N, My, Mz).tolist() == [True, False, True, False, True]
+
+
+def test_batch_ray_check_matches_contour_test():
+    domain = ultimate_domain_for(_beam(), CONCRETE, STEEL)
+    rng = np.random.default_rng(7)
+    demands = rng.uniform([-200000, -20000, -8000], [30000, 20000, 8000], (2000, 3))
+    result = check_domain_batch(domain, demands)
+    inside = domain.contains(demands[:, 0], demands[:, 1], demands[:, 2])
+    assert np.mean(result.inside == inside) > 0.995
+    assert np.all(np.isfinite(result.safety_factor))
+    # Boundary points lie on the load rays at the safety factor
+    np.testing.assert_allclose(result.boundary, demands * result.safety_factor[:, None])
+
+    null = check_domain_batch(domain, np.zeros((1, 3)))
+    assert null.inside[0] and np.isinf(null.safety_factor[0])
+    with pytest.raises(ValueError):
+        domain.check(np.zeros((2, 2)))
+
+
+def test_allowable_domain_safety_factor_matches_ta_stresses():
+    geom = SectionGeometry(
+        [[(0, 0), (B, 0), (B, H), (0, H)]],
+        [(7.0, 4.0, PHI), (23.0, 4.0, PHI), (7.0, 46.0, PHI), (23.0, 46.0, PHI)],
+        n_homog=10,
+    )
+    Ec, sigma_ca, sigma_sa = 200000.0, 60.0, 1400.0
+    domain = allowable_domain_for(geom, Ec, sigma_ca, sigma_sa)
+    props = compute_section_properties(geom)
+    concrete = ConcreteLawTA(
+        fcd=100.0, Ec=Ec, eps_c2=0.002, eps_c3=0.002, eps_c4=0.002, eps_cu=0.0035
+    )
+    steel = SteelLawTA(Es=10 * Ec, fyd=1.0e9, eps_yd=1.0, eps_su=1.0)
+
+    demands = np.array([[-40000.0, -5000.0, 1000.0], [0.0, 6000.0, 0.0], [5000.0, 0.0, 2000.0]])
+    factors = domain.check(demands).safety_factor
+    for demand, factor in zip(demands, factors):
+        res = compute_normal_stresses_ta(
+            geom, props, LoadState(*demand), concrete, steel, method="exact"
+        )
+        expected = min(
+            sigma_ca / -res.sigma_c_min if res.sigma_c_min < 0 else np.inf,
+            sigma_sa / max(abs(s) for s in res.sigma_s_array),
+        )
+        assert factor == pytest.approx(expected, rel=2e-2)
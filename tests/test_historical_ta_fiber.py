@@ -0,0 +1,76 @@
+import math
+
+import numpy as np
+import pytest
+
+from historical_ta import (
+    ConcreteLawTA,
+    LoadState,
+    SectionGeometry,
+    SteelLawTA,
+    compute_normal_stresses_ta,
+    compute_section_properties,
+    fiber_section_for,
+)
+
+CONCRETE = ConcreteLawTA(
+    fcd=100.0, Ec=200000.0, eps_c2=0.002, eps_c3=0.002, eps_c4=0.002, eps_cu=0.0035
+)
+STEEL = SteelLawTA(Es=2.0e6, fyd=1.0e9, eps_yd=1.0, eps_su=1.0)
+
+
+def _beam(b=30.0, h=50.0, phi=2.0, n=10):
+    bars = [(7.0, 4.0, phi), (15.0, 4.0, phi), (23.0, 4.0, phi)]
+    return SectionGeometry(polygons=[[(0, 0), (b, 0), (b, h), (0, h)]], bars=bars, n_homog=n)
+
+
+def test_fiber_mesh_preserves_area_and_holes():
+    outer = [(0, 0), (40, 0), (40, 60), (0, 60)]
+    hole = [(10, 10), (10, 50), (30, 50), (30, 10)]  # clockwise: subtracted
+    section = fiber_section_for(SectionGeometry([outer, hole], []), mesh_size=3.0)
+    assert section.area.sum() == pytest.approx(40 * 60 - 20 * 40)
+    assert np.average(section.y, weights=section.area) == pytest.approx(20.0)
+
+
+def test_fiber_cracked_bending_matches_closed_form():
+    b, h, d, phi = 30.0, 50.0, 46.0, 2.0
+    geom = _beam(b, h, phi)
+    M = -10000.0  # kg·m, compressed top fibre
+    props = compute_section_properties(geom)
+    res = compute_normal_stresses_ta(
+        geom, props, LoadState(0.0, M, 0.0), CONCRETE, STEEL, method="fiber"
+    )
+    assert res.converged
+
+    n, As = 10.0, 3 * math.pi * phi**2 / 4
+    x = (-n * As + math.sqrt((n * As) ** 2 + 2 * b * n * As * d)) / b
+    I_cr = b * x**3 / 3 + n * As * (d - x) ** 2
+    assert res.sigma_c_min == pytest.approx(-abs(M) * 100 * x / I_cr, rel=5e-3)
+    assert res.sigma_s_max == pytest.approx(n * abs(M) * 100 * (d - x) / I_cr, rel=5e-3)
+    assert res.sigma_c_max == 0.0
+
+
+def test_fiber_uncracked_compression_is_uniform():
+    geom = _beam()
+    props = compute_section_properties(geom)
+    res = compute_normal_stresses_ta(
+        geom, props, LoadState(-30000.0, 0.0, 0.0), CONCRETE, STEEL, method="fiber"
+    )
+    assert res.sigma_c_min == pytest.approx(-30000.0 / props.area_equivalent)
+    assert res.sigma_c_max == pytest.approx(res.sigma_c_min)
+
+
+def test_fiber_homogenizes_bars_with_n_like_exact_method():
+    # Es / Ec = 6.87 differs from n_homog = 15: all methods must use n
+    concrete = ConcreteLawTA(
+        fcd=100.0, Ec=305700.0, eps_c2=0.002, eps_c3=0.002, eps_c4=0.002, eps_cu=0.0035
+    )
+    steel = SteelLawTA(Es=2.1e6, fyd=1.0e9, eps_yd=1.0, eps_su=1.0)
+    geom = _beam(n=15)
+    props = compute_section_properties(geom)
+    loads = LoadState(0.0, -10000.0, 0.0)
+    fiber = compute_normal_stresses_ta(geom, props, loads, concrete, steel, method="fiber")
+    exact = compute_normal_stresses_ta(geom, props, loads, concrete, steel, method="exact")
+    assert fiber.converged
+    assert fiber.sigma_c_min == pytest.approx(exact.sigma_c_min, rel=5e-3)
+    assert fiber.sigma_s_max == pytest.approx(exact.sigma_s_max, rel=5e-3)
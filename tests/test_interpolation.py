@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from src.core_calculus.core import InterpTable1D, InterpTable2D
+from src.core_calculus.core.interpolation import linear_interpolate_table
+
+
+def test_1d_table_sorts_once_and_matches_legacy_function():
+    pairs = [(30.0, 1.08), (0.0, 1.0), (50.0, 1.32), (10.0, 1.0)]
+    table = InterpTable1D.from_pairs(pairs)
+    assert table.x.tolist() == [0.0, 10.0, 30.0, 50.0]
+    assert not table.x.flags.writeable
+    for x in (-5.0, 0.0, 12.5, 30.0, 42.0, 50.0, 80.0):
+        assert table(x) == pytest.approx(linear_interpolate_table(x, pairs))
+    xs = np.linspace(-10.0, 60.0, 15).reshape(3, 5)
+    assert table(xs) == pytest.approx(np.vectorize(table)(xs))
+    with pytest.raises(ValueError):
+        InterpTable1D([1.0], [2.0])
+
+
+def test_2d_table_is_bilinear_and_clamped():
+    x, y = [2.0, 0.0, 1.0], [10.0, 20.0]
+    z = [[2.0 + 10.0, 2.0 + 20.0], [0.0 + 10.0, 0.0 + 20.0], [1.0 + 10.0, 1.0 + 20.0]]
+    table = InterpTable2D(x, y, z)  # z = x + y, reproduced exactly
+    assert table(0.5, 12.5) == pytest.approx(13.0)
+    assert table(5.0, 0.0) == pytest.approx(12.0)  # clamped to (2, 10)
+    xs = np.array([[0.25], [1.5]])
+    ys = np.array([10.0, 15.0, 25.0])
+    expected = np.clip(xs, 0, 2) + np.clip(ys, 10, 20)
+    assert table(xs, ys) == pytest.approx(expected)
+    assert table(xs, ys).shape == (2, 3)
+
+    saddle = InterpTable2D([0.0, 1.0], [0.0, 1.0], [[0.0, 0.0], [0.0, 1.0]])
+    assert saddle(0.5, 0.5) == pytest.approx(0.25)
+    assert saddle(np.array([0.5]), 0.5) == pytest.approx([0.25])
+    with pytest.raises(ValueError):
+        InterpTable2D([0.0, 1.0], [0.0, 1.0], [[0.0, 1.0]])
@@ -0,0 +1,97 @@
+import json
+from pathlib import Path
+
+from sections_app.models.sections import RectangularSection, section_to_persisted_dict
+from sections_app.services.journal_repository import JournalSectionRepository
+from sections_app.services.repository import SectionRepository
+
+
+def _journal_lines(repo: JournalSectionRepository) -> list[dict]:
+    if not repo.journal_path.exists():
+        return []
+    with repo.journal_path.open(encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def test_edits_append_to_journal_and_replay(tmp_path: Path):
+    json_file = tmp_path / "sections.jsons"
+    repo = JournalSectionRepository(json_file=str(json_file))
+    snapshot = json_file.read_bytes()
+
+    sec = RectangularSection(name="Trave J1", width=30, height=50)
+    assert repo.add_section(sec)
+    repo.update_section(sec.id, RectangularSection(name="Trave J1", width=30, height=60))
+    other = RectangularSection(name="Trave J2", width=25, height=40)
+    repo.add_section(other)
+    repo.delete_section(other.id)
+
+    # Lo snapshot non viene riscritto: solo append al journal
+    assert json_file.read_bytes() == snapshot
+    assert [r["op"] for r in _journal_lines(repo)] == ["add", "update", "add", "delete"]
+
+    reloaded = JournalSectionRepository(json_file=str(json_file))
+    restored = reloaded.find_by_id(sec.id)
+    assert restored is not None and restored.height == 60
+    assert reloaded.find_by_id(other.id) is None
+    assert reloaded.journal_records == 4
+
+
+def _dump(repo: SectionRepository) -> dict:
+    return {s.id: section_to_persisted_dict(s) for s in repo.get_all_sections()}
+
+
+def test_compaction_writes_snapshot_and_truncates_journal(tmp_path: Path):
+    json_file = tmp_path / "sections.jsons"
+    repo = JournalSectionRepository(json_file=str(json_file), compact_every=3)
+    for i in range(3):
+        repo.add_section(RectangularSection(name=f"Pilastro {i}", width=30 + i, height=30))
+    assert repo.journal_records == 3 and len(_journal_lines(repo)) == 3
+
+    # Il quarto record supera la soglia: snapshot completo e journal troncato
+    repo.add_section(RectangularSection(name="Pilastro 3", width=33, height=30))
+    assert repo.journal_records == 0
+    assert not repo.journal_path.exists()
+    plain = SectionRepository(json_file=str(json_file))
+    assert _dump(plain) == _dump(repo)
+
+    repo.add_section(RectangularSection(name="Pilastro 4", width=34, height=30))
+    assert repo.journal_records == 1 and [r["op"] for r in _journal_lines(repo)] == ["add"]
+    reloaded = JournalSectionRepository(json_file=str(json_file), compact_every=3)
+    assert reloaded.journal_records == 1
+    assert _dump(reloaded) == _dump(repo)
+
+    repo.compact()
+    assert repo.journal_records == 0 and not repo.journal_path.exists()
+    # Lo snapshot resta leggibile dal repository standard
+    assert _dump(SectionRepository(json_file=str(json_file))) == _dump(repo)
+
+
+def test_torn_journal_tail_is_discarded(tmp_path: Path):
+    json_file = tmp_path / "sections.jsons"
+    repo = JournalSectionRepository(json_file=str(json_file))
+    sec = RectangularSection(name="Trave T", width=30, height=50)
+    repo.add_section(sec)
+    with repo.journal_path.open("a", encoding="utf-8") as f:
+        f.write('{"op": "add", "id": "x", "sec')
+
+    reloaded = JournalSectionRepository(json_file=str(json_file))
+    assert reloaded.find_by_id(sec.id) is not None
+    assert not reloaded.journal_path.exists()
+
+
+def test_failed_compaction_keeps_changes_pending(tmp_path: Path, monkeypatch):
+    json_file = tmp_path / "sections.jsons"
+    repo = JournalSectionRepository(json_file=str(json_file), autosave_delay=60.0)
+    sec = RectangularSection(name="Trave C", width=30, height=50)
+    repo.add_section(sec)
+    assert repo.has_pending_changes
+
+    with monkeypatch.context() as m:
+        m.setattr(SectionRepository, "_write_file", lambda self: False)
+        repo.compact()
+    assert repo.has_pending_changes
+
+    repo.flush()
+    assert not repo.has_pending_changes
+    assert [r["op"] for r in _journal_lines(repo)] == ["add"]
+    assert JournalSectionRepository(json_file=str(json_file)).find_by_id(sec.id) is not None
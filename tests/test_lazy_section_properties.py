@@ -0,0 +1,56 @@
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+from sections_app.models.sections import (
+    PROPERTIES_HASH_KEY,
+    RectangularSection,
+    Section,
+    TSection,
+    section_from_persisted_dict,
+    section_to_persisted_dict,
+)
+from sections_app.services.repository import SectionRepository
+
+
+def test_persisted_properties_round_trip():
+    sec = TSection(name="T", flange_width=60, flange_thickness=10, web_thickness=20, web_height=40)
+    sec.rotation_angle_deg = 15.0
+    sec.compute_properties()
+    data = json.loads(json.dumps(section_to_persisted_dict(sec)))
+
+    restored = section_from_persisted_dict(data)
+    for key, value in asdict(sec.properties).items():
+        assert getattr(restored.properties, key) == pytest.approx(value), key
+
+
+def test_lazy_load_skips_compute_unless_data_changed(tmp_path: Path, monkeypatch):
+    json_file = tmp_path / "sections.jsons"
+    repo = SectionRepository(json_file=str(json_file))
+    sec = RectangularSection(name="Trave L", width=30, height=50)
+    repo.add_section(sec)
+
+    calls: list[str] = []
+    original = Section.compute_properties
+
+    def counting(self):
+        calls.append(self.name)
+        return original(self)
+
+    monkeypatch.setattr(Section, "compute_properties", counting)
+    lazy = SectionRepository(json_file=str(json_file), lazy_properties=True)
+    assert calls == []
+    assert lazy.find_by_id(sec.id).properties.area == pytest.approx(1500.0)
+
+    # Dati modificati a mano: l'impronta non corrisponde e le proprietà vengono ricalcolate
+    data = json.loads(json_file.read_text(encoding="utf-8"))
+    for item in data:
+        if item["id"] == sec.id:
+            item["height"] = 60.0
+            assert item[PROPERTIES_HASH_KEY]
+    json_file.write_text(json.dumps(data), encoding="utf-8")
+    reloaded = SectionRepository(json_file=str(json_file), lazy_properties=True)
+    assert calls == ["Trave L"]
+    assert reloaded.find_by_id(sec.id).properties.area == pytest.approx(1800.0)
@@ -0,0 +1,84 @@
+import pytest
+
+from core_models.materials import Material, MaterialRepository, MaterialValues
+from materials_repository import MaterialsRepository
+from verification_table import VerificationInput, get_concrete_properties
+
+
+def test_material_repository_indexes_follow_updates():
+    repo = MaterialRepository(json_file=":memory:")
+    cls = Material(name="C25/30", type="concrete", code="C25", properties={"fck": 25.0})
+    repo.add(cls)
+
+    assert repo.find_by_name("C25/30") is cls
+    assert repo.find_by_code("C25") is cls
+    assert repo.get_values("C25/30") == MaterialValues(fck=25.0)
+
+    repo.update(
+        cls.id, Material(name="C30/37", type="concrete", code="C30", properties={"fck": 30.0})
+    )
+    assert repo.find_by_name("C25/30") is None
+    assert repo.find_by_code("C30").name == "C30/37"
+    assert repo.get_values("C30/37").fck == 30.0
+
+    repo.delete(cls.id)
+    assert repo.find_by_name("C30/37") is None
+    assert repo.get_values("C30/37") is None
+
+
+def test_material_repository_detects_in_place_rename():
+    repo = MaterialRepository(json_file=":memory:")
+    mat = Material(name="FeB38k", type="steel", properties={"fyk": 375.0})
+    repo.add(mat)
+    assert repo.find_by_name("FeB38k") is mat
+    mat.name = "FeB44k"
+    assert repo.find_by_name("FeB38k") is None
+    assert repo.find_by_name("FeB44k") is mat
+
+
+def test_materials_repository_get_by_name_and_code():
+    repo = MaterialsRepository()
+    repo.add({"name": "R160", "code": "R160", "type": "concrete"})
+    repo.add({"name": "Aq42", "code": "AQ42", "type": "steel"})
+    found = repo.get_by_code("AQ42")
+    assert found["name"] == "Aq42"
+    found["name"] = "changed"
+    assert repo.get_by_name("Aq42") is not None
+
+    repo.delete("Aq42")
+    assert repo.get_by_name("Aq42") is None
+    assert repo.get_by_code("AQ42") is None
+
+
+def test_get_concrete_properties_uses_numeric_view():
+    repo = MaterialRepository(json_file=":memory:")
+    repo.add(Material(name="C1", type="concrete", properties={"fck_MPa": 30.0, "fck": 20.0}))
+    fck_mpa, _, _ = get_concrete_properties(VerificationInput(material_concrete="C1"), repo)
+    assert fck_mpa == pytest.approx(30.0)
+
+
+def test_materials_repository_values_follow_edits_and_replacements():
+    repo = MaterialsRepository()
+    repo.add({"name": "C1", "fck": 25.0, "Ec": 31000.0})
+    repo.add({"name": "B450", "properties": {"fyk": 450.0, "Es": 200000.0}})
+    assert repo.get_values("C1") == MaterialValues(fck=25.0, Ec=31000.0)
+    assert repo.get_values("B450") == MaterialValues(fyk=450.0, Es=200000.0)
+    assert repo.get_values("C1") is repo.get_values("C1")
+
+    repo.update("C1", {"fck": 30.0})
+    assert repo.get_values("C1").fck == 30.0
+
+    # Lista sostituita senza passare dal repository (come fa la GUI coi default)
+    repo._materials = [{"name": "C1", "fck": 35.0}]
+    assert repo.get_values("C1") == MaterialValues(fck=35.0)
+    assert repo.get_values("B450") is None
+
+
+def test_material_repository_values_follow_in_place_rename():
+    repo = MaterialRepository(json_file=":memory:")
+    mat = Material(name="C25/30", type="concrete", properties={"fck": 25.0})
+    repo.add(mat)
+    assert repo.get_values("C25/30").fck == 25.0
+    mat.name = "C28/35"
+    assert repo.get_values("C25/30") is None
+    assert repo.get_values("C28/35").fck == 25.0
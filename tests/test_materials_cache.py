@@ -9,3 +9,30 @@ def test_get_material_properties_cached():
     assert p1.fyk == p2.fyk
     assert p1.Ec == p2.Ec
     assert p1.Es == p2.Es
+
+
+def test_material_properties_cache_shared_across_engines():
+    from src.core_calculus.core.verification_engine import (
+        clear_material_properties_cache,
+        material_properties_cache_info,
+    )
+
+    clear_material_properties_cache()
+    VerificationEngine("TA").get_material_properties("R160", "FeB38k", "RD2229")
+    VerificationEngine("SLU").get_material_properties("R160", "FeB38k", "RD2229")
+    info = material_properties_cache_info()
+    assert info["misses"] == 1
+    assert info["hits"] == 1
+
+
+def test_get_verification_engine_reuses_instance_per_code():
+    from src.core_calculus.core.verification_engine import (
+        clear_verification_engines,
+        get_verification_engine,
+    )
+
+    clear_verification_engines()
+    ta = get_verification_engine("ta")
+    assert get_verification_engine("TA") is ta
+    assert get_verification_engine("SLU") is not ta
+    assert ta.calculation_code == "TA"
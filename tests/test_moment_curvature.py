@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from src.core_calculus.core.moment_curvature import moment_curvature_curves
+from src.core_calculus.core.verification_core import (
+    MaterialProperties,
+    ReinforcementLayer,
+    SectionGeometry,
+)
+
+SECTION = SectionGeometry(width=30.0, height=50.0)
+MATERIAL = MaterialProperties(fck=250.0, fcd=141.7, fyk=4500.0, fyd=3913.0, Es=2.0e6)
+
+
+def test_ultimate_moment_in_pure_bending_matches_stress_block():
+    As, d = 9.42, 46.0
+    curves = moment_curvature_curves(
+        SECTION,
+        ReinforcementLayer(area=As, distance=d),
+        ReinforcementLayer(area=0.0, distance=4.0),
+        MATERIAL,
+        [0.0],
+        eps_su=1.0,
+    )
+    # Parabola-rectangle block: resultant 0.8095 fcd b x at 0.416 x from the top
+    x = As * MATERIAL.fyd / (0.8095 * MATERIAL.fcd * SECTION.width)
+    assert curves.ultimate_moment[0] == pytest.approx(As * MATERIAL.fyd * (d - 0.416 * x), rel=5e-3)
+    assert curves.ultimate_curvature[0] == pytest.approx(0.0035 / x, rel=5e-3)
+    assert not curves.steel_failure[0]
+    assert curves.ductility[0] > 1.0
+
+
+def test_many_axial_levels_in_one_call():
+    tensile = ReinforcementLayer(area=9.42, distance=46.0)
+    compressed = ReinforcementLayer(area=4.02, distance=4.0)
+    N = np.linspace(-150000.0, 20000.0, 40)
+    curves = moment_curvature_curves(SECTION, tensile, compressed, MATERIAL, N)
+
+    assert curves.curvature.shape == (40, 61)
+    assert np.all(curves.converged[:, 0])
+    assert np.all(np.isfinite(curves.ultimate_moment))
+    # Warm-started solves need only a few Newton steps per point
+    assert curves.iterations[curves.converged].mean() < 5
+    # Curvature ductility drops with the compression level
+    assert curves.ductility[0] < curves.ductility[-10]
+
+    single = moment_curvature_curves(SECTION, tensile, compressed, MATERIAL, N[5:6])
+    np.testing.assert_allclose(single.moment[0], curves.moment[5], equal_nan=True)
+    chi, M = curves.curve(5)
+    assert chi[0] == 0.0 and np.all(np.diff(chi) > 0)
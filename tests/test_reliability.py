@@ -0,0 +1,107 @@
+import math
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+
+import numpy as np
+import pytest
+
+from historical_materials import HistoricalMaterialLibrary
+from src.core_calculus.core.reliability import (
+    RandomVariable,
+    ReliabilityProblem,
+    run_monte_carlo,
+)
+from src.core_calculus.core.sweep import ta_admissible_moment
+from src.core_calculus.core.verification_core import MaterialProperties
+
+MATERIAL = MaterialProperties(fck=160.0, fyk=3800.0)
+FIXED = {"cover_variable": RandomVariable(4.0), "bar_area": RandomVariable(1.0)}
+
+
+def test_steel_governed_ta_check_matches_lognormal_failure_probability():
+    # Concrete never governs: FS = M_adm(fyk) / M is lognormal like fyk
+    nominal = ReliabilityProblem(
+        "TA",
+        30.0,
+        50.0,
+        8.0,
+        1.0,
+        MATERIAL,
+        sigma_c_adm=1.0e4,
+        fyk=RandomVariable(3800.0),
+        **FIXED,
+    )
+    _, m_adm, governs = ta_admissible_moment(30.0, 50.0, 8.0, 0.0, 4.0, MATERIAL.n, 1.0e4, 1900.0)
+    assert not governs
+    assert nominal.sigma_s_adm == 1900.0
+    cov, beta = 0.1, 2.0
+    s = math.sqrt(math.log1p(cov**2))
+    M = float(m_adm[()]) * math.exp(-beta * s - 0.5 * s * s)  # ln FS ~ N(beta s, s)
+    problem = ReliabilityProblem(
+        "TA",
+        30.0,
+        50.0,
+        8.0,
+        M,
+        MATERIAL,
+        sigma_c_adm=1.0e4,
+        fyk=RandomVariable(3800.0, cov),
+        **FIXED,
+    )
+    res = run_monte_carlo(problem, 200_000, seed=7, chunk_size=50_000)
+    pf = NormalDist().cdf(-beta)
+    assert abs(res.pf - pf) < 4 * res.pf_std
+    lo, hi = res.pf_interval()
+    assert lo < pf < hi and res.beta_interval()[0] < beta < res.beta_interval()[1]
+    assert res.lognormal_beta == pytest.approx(beta, rel=0.02)
+    assert res.history_n.tolist() == [50_000, 100_000, 150_000, 200_000]
+    assert res.history_pf[-1] == res.pf
+    assert res.converged(0.05) and res.samples_for_cov(0.05) < 200_000
+
+
+def test_results_are_reproducible_across_workers():
+    problem = ReliabilityProblem("SLU", 30.0, 50.0, 8.0, 2.0e6, MATERIAL, As_prime=4.0, N=-5.0e4)
+    # fck and fyk of the material are characteristic: 5% fractiles of the defaults
+    rng = np.random.default_rng(0)
+    assert np.percentile(problem.sigma_c28.sample(rng, 200_000), 5.0) == pytest.approx(
+        160.0, rel=0.02
+    )
+    assert np.percentile(problem.fyk.sample(rng, 200_000), 5.0) == pytest.approx(3800.0, rel=0.01)
+    serial = run_monte_carlo(problem, 20_000, seed=3, chunk_size=4_000, keep_samples=True)
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        pooled = run_monte_carlo(
+            problem, 20_000, seed=3, chunk_size=4_000, executor=pool, keep_samples=True
+        )
+    assert np.array_equal(serial.samples, pooled.samples)
+    assert serial.n_failures == pooled.n_failures > 0
+    other = run_monte_carlo(problem, 20_000, seed=4, chunk_size=4_000, keep_samples=True)
+    assert not np.array_equal(serial.samples, other.samples)
+
+
+def test_problem_from_historical_library(tmp_path):
+    library = HistoricalMaterialLibrary(tmp_path / "materials.json")
+    problem = ReliabilityProblem.from_library(
+        "TA",
+        "RD2229_CLS_160_N",
+        "RD2229_ACC_DOLCE",
+        library=library,
+        b=30.0,
+        h=50.0,
+        As=8.0,
+        M=2.0e5,
+    )
+    assert (problem.sigma_c_adm, problem.sigma_s_adm) == (35.0, 1400.0)
+    assert problem.material.n == 10.0
+    # Library strengths are 5% fractiles of the sampled distributions
+    fck = problem.sigma_c28.sample(np.random.default_rng(0), 200_000)
+    assert np.percentile(fck, 5.0) == pytest.approx(160.0, rel=0.02)
+    res = run_monte_carlo(problem, 10_000, seed=1)
+    assert res.pf == 0.0 and res.beta == math.inf and not res.converged()
+    assert res.safety_factor_percentiles[50.0] > 1.0
+
+    with pytest.raises(KeyError):
+        ReliabilityProblem.from_library(
+            "TA", "MISSING", "RD2229_ACC_DOLCE", library=library, b=30.0, h=50.0, As=8.0, M=1.0
+        )
+    with pytest.raises(ValueError, match="simple bending"):
+        ReliabilityProblem("TA", 30.0, 50.0, 8.0, 1.0, MATERIAL, N=1.0)
@@ -0,0 +1,71 @@
+import json
+import time
+from pathlib import Path
+
+from sections_app.models.sections import RectangularSection
+from sections_app.services.repository import SectionRepository
+
+
+def _count_writes(monkeypatch, repo: SectionRepository) -> list[int]:
+    calls: list[int] = []
+    original = repo._write_file
+
+    def _write() -> bool:
+        calls.append(1)
+        return original()
+
+    monkeypatch.setattr(repo, "_write_file", _write)
+    return calls
+
+
+def test_batch_writes_file_once(tmp_path: Path, monkeypatch):
+    json_file = tmp_path / "sections.jsons"
+    repo = SectionRepository(json_file=str(json_file))
+    writes = _count_writes(monkeypatch, repo)
+
+    with repo.batch():
+        for i in range(20):
+            repo.add_section(RectangularSection(name=f"Trave {i}", width=30, height=40 + i))
+        assert repo.has_pending_changes
+        assert not writes
+
+    assert len(writes) == 1
+    assert not repo.has_pending_changes
+    names = {item["name"] for item in json.loads(json_file.read_text(encoding="utf-8"))}
+    assert {f"Trave {i}" for i in range(20)} <= names
+
+
+def test_autosave_delay_debounces_writes(tmp_path: Path, monkeypatch):
+    json_file = tmp_path / "sections.jsons"
+    repo = SectionRepository(json_file=str(json_file), autosave_delay=0.05)
+    writes = _count_writes(monkeypatch, repo)
+
+    for i in range(5):
+        repo.add_section(RectangularSection(name=f"Pilastro {i}", width=30 + i, height=30))
+    assert not writes and repo.has_pending_changes
+
+    deadline = time.time() + 5
+    while repo.has_pending_changes and time.time() < deadline:
+        time.sleep(0.01)
+    assert len(writes) == 1
+
+    repo.add_section(RectangularSection(name="Pilastro X", width=50, height=50))
+    repo.flush()
+    assert len(writes) == 2
+    reloaded = SectionRepository(json_file=str(json_file))
+    assert reloaded.find_by_name("Pilastro X") is not None
+
+
+def test_failed_write_stays_pending_until_flushed(tmp_path: Path, monkeypatch):
+    json_file = tmp_path / "sections.jsons"
+    repo = SectionRepository(json_file=str(json_file))
+    original = repo._write_file
+    monkeypatch.setattr(repo, "_write_file", lambda: False)
+
+    repo.add_section(RectangularSection(name="Trave persa", width=30, height=50))
+    assert repo.has_pending_changes
+
+    monkeypatch.setattr(repo, "_write_file", original)
+    repo.flush()
+    assert not repo.has_pending_changes
+    assert SectionRepository(json_file=str(json_file)).find_by_name("Trave persa") is not None
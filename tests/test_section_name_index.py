@@ -0,0 +1,47 @@
+from pathlib import Path
+
+from sections_app.models.sections import RectangularSection
+from sections_app.services.repository import SectionRepository
+from verification_table import VerificationInput, get_section_geometry
+
+
+def _repo(tmp_path: Path) -> SectionRepository:
+    return SectionRepository(json_file=str(tmp_path / "sections.jsons"))
+
+
+def test_find_by_name_tracks_add_update_delete(tmp_path: Path):
+    repo = _repo(tmp_path)
+    sec = RectangularSection(name="Trave T1", width=30, height=50)
+    assert repo.add_section(sec)
+
+    assert repo.find_by_name("Trave T1") is sec
+    assert repo.find_by_name("  trave t1 ", case_sensitive=False) is sec
+    assert repo.find_by_name("trave t1") is None
+
+    renamed = RectangularSection(name="Trave T2", width=30, height=55)
+    repo.update_section(sec.id, renamed)
+    assert repo.find_by_name("Trave T1") is None
+    assert repo.find_by_name("Trave T2") is renamed
+
+    repo.delete_section(sec.id)
+    assert repo.find_by_name("Trave T2") is None
+
+
+def test_find_by_name_survives_reload_and_in_place_rename(tmp_path: Path):
+    repo = _repo(tmp_path)
+    sec = RectangularSection(name="Pilastro P1", width=40, height=40)
+    repo.add_section(sec)
+
+    reloaded = _repo(tmp_path)
+    assert reloaded.find_by_name("Pilastro P1").id == sec.id
+
+    sec.name = "Pilastro P9"
+    assert repo.find_by_name("Pilastro P1") is None
+    assert repo.find_by_name("Pilastro P9") is sec
+
+
+def test_get_section_geometry_uses_name_index(tmp_path: Path):
+    repo = _repo(tmp_path)
+    repo.add_section(RectangularSection(name="Trave 25x60", width=25, height=60))
+    assert get_section_geometry(VerificationInput(section_id="Trave 25x60"), repo) == (25.0, 60.0)
+    assert get_section_geometry(VerificationInput(section_id="TRAVE 25X60"), repo) == (25.0, 60.0)
@@ -0,0 +1,142 @@
+import math
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.core_calculus.core.shear import (
+    allowable_shear_stresses,
+    cracked_lever_arm,
+    shear_slu_batch,
+    shear_ta_batch,
+)
+from src.domain.domain.models import VerificationInput
+from src.methods.verification.dispatcher import (
+    compute_verification_result,
+    compute_verification_results,
+)
+
+B, D, AS = 30.0, 46.0, 3 * math.pi * 2.0**2 / 4
+PHI, ASW = 0.8, 2 * math.pi * 0.8**2 / 4
+
+
+def test_ta_tau_stirrup_stress_and_spacing():
+    tc0, tc1 = allowable_shear_stresses(250.0)
+    assert (tc0, tc1) == pytest.approx((4.0 + 100 / 75, 14.0 + 100 / 35))
+    V = np.array([5000.0, 12000.0, 30000.0])
+    res = shear_ta_batch(
+        V,
+        B,
+        D,
+        AS,
+        tau_c0=tc0,
+        tau_c1=tc1,
+        sigma_sw_allow=2200.0,
+        stirrup_diameter=PHI,
+        stirrup_step=[20.0, 5.0, 10.0],
+    )
+    n = 15.0
+    x = (-n * AS + math.sqrt((n * AS) ** 2 + 2 * B * n * AS * D)) / B
+    z = D - x / 3
+    assert cracked_lever_arm(B, D, AS) == pytest.approx(z)
+    assert res.tau_max == pytest.approx(V / (B * z))
+    assert res.needs_stirrups.tolist() == [False, True, True]
+    assert res.redesign.tolist() == [False, False, True]
+    assert res.sigma_sw[1] == pytest.approx(5.0 * B * res.tau_max[1] / ASW)
+    assert res.asw_required[1] == pytest.approx(B * res.tau_max[1] / 2200.0)
+    assert res.spacing_max[0] == 33.0  # min(33.3, 0.8 d, 1000 Asw / b) floored
+    assert res.verified.tolist() == [True, True, False]
+
+
+def test_slu_resistances_match_ntc_formulas():
+    fck, fcd, fywd = 250.0, 0.85 * 250.0 / 1.5, 4500.0 / 1.15
+    V = np.array([5000.0, 12000.0, 60000.0])
+    res = shear_slu_batch(
+        V,
+        0.0,
+        B,
+        50.0,
+        D,
+        AS,
+        fck=fck,
+        fcd=fcd,
+        fywd=fywd,
+        stirrup_diameter=PHI,
+        stirrup_step=10.0,
+    )
+    f_mpa = fck * 0.0980665
+    k = 1 + math.sqrt(200 / (10 * D))
+    v = 0.18 * k * (100 * AS / (B * D) * f_mpa) ** (1 / 3) / 1.5 / 0.0980665
+    V_rdc = v * B * D
+    V_rsd = 0.9 * D * ASW / 10.0 * fywd
+    V_rcd = 0.9 * B * D * 0.5 * fcd * 1.0 * 0.5  # (cot 45 + cot 90) sin² 45
+    assert res.resistance[0] == pytest.approx(V_rdc)
+    assert res.resistance[1] == pytest.approx(min(V_rsd, V_rcd))
+    assert res.needs_stirrups.tolist() == [False, True, True]
+    assert res.redesign.tolist() == [False, False, V[2] > V_rcd]
+    assert res.spacing_required[1] == pytest.approx(ASW / (V[1] / (0.9 * D * fywd)))
+    with pytest.raises(ValueError):
+        shear_slu_batch(
+            1.0, 0.0, B, 50.0, D, AS, fck=fck, fcd=fcd, fywd=fywd, stirrup_diameter=PHI, code="1996"
+        )
+
+
+def test_slu_size_effect_factor_is_capped_at_two_for_shallow_members():
+    fck, fcd, fywd = 250.0, 0.85 * 250.0 / 1.5, 4500.0 / 1.15
+    d = np.array([12.0, 20.0, 30.0])  # 1 + sqrt(200 / 120) = 2.29 > 2
+    As = 0.01 * 100.0 * d
+    res = shear_slu_batch(
+        1.0, 0.0, 100.0, d + 3.0, d, As, fck=fck, fcd=fcd, fywd=fywd, stirrup_diameter=PHI
+    )
+    f_mpa = fck * 0.0980665
+    k = np.minimum(1 + np.sqrt(200 / (10 * d)), 2.0)
+    v = 0.18 * k * (100 * 0.01 * f_mpa) ** (1 / 3) / 1.5 / 0.0980665
+    assert k.tolist()[:2] == [2.0, 2.0]
+    assert res.resistance == pytest.approx(v * 100.0 * d)
+
+
+def test_batch_rows_get_shear_report_like_single_rows():
+    repo = SimpleNamespace(
+        find_by_id=lambda _id: SimpleNamespace(id="s1", name="T", width=B, height=50.0)
+    )
+    rows = [
+        VerificationInput(
+            section_id="s1",
+            verification_method=method,
+            Mx=2000.0,
+            As_inf=AS,
+            As_sup=3.0,
+            Ty=Ty,
+            stirrup_step=15.0,
+            stirrup_diameter=8.0,
+        )
+        for method, Ty in (("TA", 0.0), ("TA", 4000.0), ("SLU", 30000.0), ("TA", 25000.0))
+    ]
+    batch = compute_verification_results(rows, repo, None)
+    assert "VERIFICA A TAGLIO" not in batch[0].messaggi
+    for row, out in zip(rows[1:], batch[1:]):
+        single = compute_verification_result(row, repo, None)
+        assert "VERIFICA A TAGLIO" in out.messaggi
+        assert out.messaggi == single.messaggi and out.esito == single.esito
+    assert batch[3].esito == "NON VERIFICATO"
+
+
+def test_ta_row_on_r120_concrete_uses_extrapolated_dm92_stresses():
+    repo = SimpleNamespace(
+        find_by_id=lambda _id: SimpleNamespace(id="s1", name="T", width=B, height=50.0)
+    )
+    r120 = SimpleNamespace(name="CLS R120", fck=120.0 * 0.83 / 10.197)  # Rck 120 kg/cm²
+    materials = SimpleNamespace(find_by_name=lambda name: r120 if name == "CLS R120" else None)
+    row = VerificationInput(
+        section_id="s1",
+        verification_method="TA",
+        material_concrete="CLS R120",
+        Mx=2000.0,
+        As_inf=AS,
+        As_sup=3.0,
+        Ty=4000.0,
+        stirrup_step=15.0,
+        stirrup_diameter=8.0,
+    )
+    out = compute_verification_results([row], repo, materials)[0]
+    assert "(τ_c0 = 3.60, τ_c1 = 13.14 kg/cm²)" in "\n".join(out.messaggi)
@@ -0,0 +1,119 @@
+import json
+import sqlite3
+from pathlib import Path
+
+from core_models.materials import Material
+from historical_materials import HistoricalMaterial, HistoricalMaterialType
+from sections_app.models.sections import RectangularSection
+from sqlite_repository import (
+    SqliteMaterialRepository,
+    SqliteSectionRepository,
+    SqliteStore,
+    SqliteVerificationItemsRepository,
+)
+from verification_items import VerificationItem
+from verification_table import VerificationInput
+
+
+def test_section_crud_and_lookup(tmp_path: Path):
+    db = tmp_path / "rd2229.sqlite"
+    repo = SqliteSectionRepository(SqliteStore(db))
+    sec = RectangularSection(name="Trave 30x50", width=30, height=50)
+    assert repo.add_section(sec)
+    assert not repo.add_section(RectangularSection(name="Copia", width=30, height=50))
+
+    assert repo.find_by_name("Trave 30x50") is sec
+    assert repo.find_by_name(" trave 30X50", case_sensitive=False) is sec
+    assert [h[1] for h in repo.list_headers()] == ["Trave 30x50"]
+
+    repo.update_section(sec.id, RectangularSection(name="Trave 30x60", width=30, height=60))
+    # Un nuovo repository rilegge dal database (nessun caricamento all'apertura)
+    reopened = SqliteSectionRepository(SqliteStore(db))
+    assert reopened.find_by_id(sec.id).height == 60
+    assert reopened.find_by_type("RECTANGULAR")[0].name == "Trave 30x60"
+
+    reopened.delete_section(sec.id)
+    assert reopened.count() == 0
+    mode = sqlite3.connect(db).execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode.lower() == "wal"
+
+
+def test_bulk_import_from_json(tmp_path: Path):
+    sections_file = tmp_path / "sections.jsons"
+    sections_file.write_text(
+        json.dumps(
+            [RectangularSection(name=f"R{i}", width=20 + i, height=40).to_dict() for i in range(10)]
+        ),
+        encoding="utf-8",
+    )
+    materials_file = tmp_path / "materials.json"
+    materials_file.write_text(
+        json.dumps([Material(name="C20", type="concrete", code="C20").to_dict()]),
+        encoding="utf-8",
+    )
+    store = SqliteStore(":memory:")
+
+    sections = SqliteSectionRepository(store)
+    assert sections.import_json(sections_file) == 10
+    assert sections.import_json(sections_file) == 0
+    assert sections.find_by_name("R3").width == 23
+
+    materials = SqliteMaterialRepository(store)
+    assert materials.import_json(materials_file) == 1
+    assert materials.find_by_code("C20").name == "C20"
+    assert materials.find_by_name("C20") is materials.find_by_code("C20")
+
+
+def test_historical_reimport_updates_materials_by_code():
+    materials = SqliteMaterialRepository(SqliteStore(":memory:"))
+    materials.add(
+        Material(
+            id="H1", name="Vecchio", type="concrete", code="RD2229_R160", properties={"fck": 100.0}
+        )
+    )
+    assert materials.find_by_id("H1").name == "Vecchio"
+    assert materials.get_values("Vecchio").fck == 100.0
+
+    cls = HistoricalMaterial(
+        id="R160",
+        name="CLS R 160",
+        code="RD2229_R160",
+        source="RD 2229/39",
+        type=HistoricalMaterialType.CONCRETE,
+        fck=160.0,
+    )
+    steel = HistoricalMaterial(
+        id="AD",
+        name="Acciaio dolce",
+        code="RD2229_AD",
+        source="RD 2229/39",
+        type=HistoricalMaterialType.STEEL,
+        fyk=2300.0,
+    )
+    assert materials.import_historical_library([cls, steel]) == 2
+    assert materials.import_historical_library([cls, steel]) == 2
+
+    # Una riga per codice: il materiale esistente viene aggiornato, non duplicato
+    codes = [m.code for m in materials.get_all()]
+    assert sorted(codes) == ["RD2229_AD", "RD2229_R160"]
+    assert materials.find_by_code("RD2229_R160").id == "H1"
+    assert materials.find_by_id("H1").name == cls.name
+    assert materials.get_values("Vecchio") is None
+    assert materials.get_values(cls.name).fck == cls.fck
+
+
+def test_verification_items_round_trip():
+    repo = SqliteVerificationItemsRepository(SqliteStore(":memory:"))
+    item = VerificationItem(
+        id="E001", name="Trave 1", group="P1", input=VerificationInput(section_id="s1", Mx=10.0)
+    )
+    repo.save(item)
+    item.name = "Trave 1 bis"
+    repo.save(item)
+
+    loaded = repo.get_by_id("E001")
+    assert loaded.name == "Trave 1 bis"
+    assert loaded.input.Mx == 10.0
+    assert [i.id for i in repo.get_by_group("P1")] == ["E001"]
+    repo.delete("E001")
+    assert repo.get_all() == []
@@ -0,0 +1,55 @@
+import math
+
+import numpy as np
+import pytest
+
+from calculations.pilastri.stabilita import omega_ca, sigma_c_ridotta, verifica_stabilita_ta
+from src.core_calculus.core.crack_width import cracked_section_stresses
+
+EC, SCA, SFA, N_H = 300000.0, 85.0, 1600.0, 15.0
+AS = 3 * math.pi * 1.6**2 / 4  # 3 phi 16 per lato
+
+
+def test_omega_table_matches_legacy_function():
+    lam = [0.0, 50.0, 60.0, 85.0, 110.0, 140.0, 140.1]
+    assert omega_ca(lam) == pytest.approx([1.0, 1.0, 1.04, 1.32, 1.95, 3.0, 10.0])
+    assert omega_ca(77.5) == pytest.approx(1.2)
+    assert sigma_c_ridotta(SCA, 30.0, 20.0) == pytest.approx(0.7 * SCA * 0.85)
+
+
+def test_centered_column_hand_calculation():
+    b = h = 30.0
+    res = verifica_stabilita_ta(
+        -40000.0, 400.0, b, h, AS, AS, 4.0, beta_y=2.0, Ec=EC, sigma_ca=SCA, sigma_fa=SFA
+    )
+    Aci = b * h + N_H * 2 * AS
+    I_y = b * h**3 / 12 + N_H * 2 * AS * (h / 2 - 4.0) ** 2
+    lam = 800.0 / math.sqrt(I_y / Aci)
+    assert res.lamda_y == pytest.approx(lam)
+    assert res.omega == pytest.approx(omega_ca(lam))
+    assert res.sigma_c == pytest.approx(omega_ca(lam) * 40000.0 / Aci)
+    assert res.verificata and not res.snellezza_eccessiva
+
+
+def test_schedule_matches_row_by_row_and_eccentric_checks():
+    rng = np.random.default_rng(1)
+    n = 50
+    N = -rng.uniform(1e4, 1.2e5, n)
+    N[:5] = 2000.0  # tesi: verifica non necessaria
+    M = rng.uniform(-6e5, 6e5, n) * (rng.random(n) < 0.7)
+    L = rng.uniform(250.0, 600.0, n)
+    kw = dict(Ec=EC, sigma_ca=SCA, sigma_fa=SFA)
+    res = verifica_stabilita_ta(N, L, 30.0, 40.0, AS, AS, 4.0, M, **kw)
+    for i in range(n):
+        one = verifica_stabilita_ta(N[i], L[i], 30.0, 40.0, AS, AS, 4.0, M[i], **kw)
+        assert one.verificata == res.verificata[i]
+        assert one.sigma_c == pytest.approx(res.sigma_c[i])
+    assert res.verificata[:5].all() and not res.necessaria[:5].any()
+    assert 0 < res.verificata.sum() < n
+
+    i = int(np.flatnonzero(res.necessaria & (M != 0))[0])
+    st = cracked_section_stresses(
+        30.0, 40.0, AS, 4.0, AS, 4.0, res.omega[i] * N[i], res.a_M[i] * M[i], N_H
+    )
+    assert res.a_M[i] > 1.0
+    assert res.sigma_c[i] >= st.sigma_c - 1e-9
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from src.core_calculus.core.sweep import sweep_design_chart
+from src.core_calculus.core.verification_core import MaterialProperties
+from src.core_calculus.core.verification_engine import VerificationEngine
+
+TA_MATERIAL = MaterialProperties(fck=160.0, fyk=3800.0)
+SLU_MATERIAL = MaterialProperties(fck=250.0, fyk=4500.0, Es=2.06e6)
+
+
+def test_ta_admissible_moment_brings_the_engine_to_full_utilization():
+    res = sweep_design_chart(
+        "TA",
+        {"b": [25.0, 40.0], "h": [40.0, 60.0, 80.0], "As": [4.0, 12.0, 25.0]},
+        material=TA_MATERIAL,
+        fixed={"As_prime": 3.0},
+    )
+    assert res.shape == (2, 3, 3) and len(res) == 18
+    assert res.fixed["sigma_c_adm"] == 80.0 and res.fixed["n"] == TA_MATERIAL.n
+    b, h, As = (res.column(k) for k in ("b", "h", "As"))
+    check = VerificationEngine("TA").perform_verification_batch(
+        b, h, As, h - 4.0, 3.0, 4.0, TA_MATERIAL, Mx=res.outputs["M_adm"]
+    )
+    utilization = np.maximum(check.utilization_concrete, check.utilization_steel)
+    assert utilization == pytest.approx(np.ones(18))
+    assert check.neutral_axis_x == pytest.approx(res.outputs["x"])
+    governs = check.utilization_concrete >= check.utilization_steel - 1e-12
+    assert res.outputs["concrete_governs"].tolist() == governs.tolist()
+
+
+def test_slu_resisting_moment_matches_stress_block_formula():
+    res = sweep_design_chart(
+        "SLU",
+        {"h": [50.0, 70.0], "As": [6.0, 10.0]},
+        material=SLU_MATERIAL,
+        fixed={"b": 30.0},
+    )
+    fcd, fyd = 0.85 * 250.0 / 1.5, 4500.0 / 1.15
+    h, As = res.column("h"), res.column("As")
+    x = As * fyd / (0.8 * 30.0 * fcd)  # tensile bars yielded, no compressed bars
+    assert res.outputs["converged"].all()
+    assert res.outputs["x"] == pytest.approx(x, rel=1e-6)
+    assert res.outputs["M_rd"] == pytest.approx(As * fyd * (h - 4.0 - 0.4 * x), rel=1e-6)
+
+    crushed = sweep_design_chart(
+        "SLU", {"N": [0.0, -1.0e7]}, material=SLU_MATERIAL, fixed={"b": 30.0, "h": 50.0, "As": 6.0}
+    )
+    assert crushed.outputs["converged"].tolist() == [True, False]
+    assert np.isnan(crushed.outputs["M_rd"][1])
+
+
+def test_chunked_sweep_exports_grid_csv_and_npz(tmp_path):
+    grids = {"h": np.linspace(30.0, 90.0, 7), "As": np.linspace(2.0, 20.0, 5), "n": [10, 15]}
+    whole = sweep_design_chart("TA", grids, material=TA_MATERIAL, fixed={"b": 30.0})
+    chunked = sweep_design_chart("TA", grids, material=TA_MATERIAL, fixed={"b": 30.0}, chunk_size=4)
+    assert chunked.outputs["M_adm"] == pytest.approx(whole.outputs["M_adm"])
+    assert whole.grid("M_adm")[2, 3, 1] == pytest.approx(
+        sweep_design_chart(
+            "TA",
+            {"n": [15.0]},
+            material=TA_MATERIAL,
+            fixed={"b": 30.0, "h": 50.0, "As": 15.5},
+        ).outputs["M_adm"][0]
+    )
+
+    csv_path = chunked.to_csv(tmp_path / "chart.csv", chunk_size=8)
+    table = np.genfromtxt(csv_path, delimiter=",", names=True)
+    assert len(table) == 70
+    assert table["M_adm"] == pytest.approx(whole.outputs["M_adm"], rel=1e-9)
+    assert table["b"] == pytest.approx(np.full(70, 30.0))
+    with np.load(whole.save_npz(tmp_path / "chart.npz")) as npz:
+        assert npz["M_adm"].shape == (7, 5, 2)
+        assert npz["axis_n"].tolist() == [10.0, 15.0]
+
+    with pytest.raises(ValueError, match="unknown"):
+        sweep_design_chart("TA", {"fcd": [1.0]}, material=TA_MATERIAL)
+    with pytest.raises(ValueError, match="missing"):
+        sweep_design_chart("TA", {"b": [30.0]})
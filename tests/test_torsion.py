@@ -0,0 +1,176 @@
+import math
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.core_calculus.core.torsion import (
+    clear_torsion_cache,
+    rectangular_torsion_constants,
+    shear_torsion_batch,
+    torsion_constants_for,
+    torsion_slu_batch,
+    torsion_ta_batch,
+)
+from src.domain.domain.models import VerificationInput
+from src.methods.verification.dispatcher import (
+    compute_verification_result,
+    compute_verification_results,
+)
+
+B, H, DELTA = 30.0, 50.0, 4.0
+ASW = math.pi * 0.8**2 / 4  # one leg phi 8
+
+
+def test_section_constants_are_cached_per_section():
+    clear_torsion_cache()
+    c = torsion_constants_for("trave-1", B, H, DELTA)
+    assert c.A == pytest.approx((B - 8) * (H - 8))
+    assert c.p == pytest.approx(2 * (B - 8 + H - 8))
+    assert c.t == pytest.approx(max(B * H / (2 * (B + H)), 8.0))
+    assert c.tau_factor == pytest.approx((3 + 2.6 / (0.45 + H / B)) / (H * B**2))
+    assert torsion_constants_for("trave-1", B, H, DELTA) is c
+    assert torsion_constants_for("trave-1", B, 60.0, DELTA) is not c
+    assert rectangular_torsion_constants.cache_info().currsize == 2
+
+
+def test_ta_bredt_stresses_and_design():
+    c = rectangular_torsion_constants(B, H, DELTA)
+    T = np.array([5.0e4, 1.2e5, 1.2e5, 2.0e6])
+    res = torsion_ta_batch(
+        T,
+        tau_factor=c.tau_factor,
+        A=c.A,
+        p=c.p,
+        tau_c0=6.0,
+        tau_c1=18.0,
+        sigma_fa=2200.0,
+        stirrup_leg_area=ASW,
+        stirrup_step=[10.0, 10.0, 0.0, 10.0],
+        Al=4.0,
+        with_shear=[False, False, False, True],
+    )
+    assert res.tau_max == pytest.approx(c.tau_factor * T)
+    assert res.needs_reinforcement.tolist() == [False, True, True, True]
+    assert res.redesign.tolist() == [False, False, False, True]
+    assert res.sigma_long[1] == pytest.approx(T[1] * c.p / (2 * c.A * 4.0))
+    assert res.sigma_stirrup[1] == pytest.approx(T[1] * 10.0 / (2 * c.A * ASW))
+    assert res.al_required[1] == pytest.approx(T[1] * c.p / (2 * c.A * 2200.0))
+    assert res.spacing_required[1] == pytest.approx(2 * c.A * ASW * 2200.0 / T[1])
+    assert res.verified.tolist() == [True, True, False, False]
+
+
+def test_slu_ultimate_torque_is_minimum_of_three_mechanisms():
+    c = rectangular_torsion_constants(B, H, DELTA)
+    fcd, fyd = 141.7, 3913.0
+    res = torsion_slu_batch(
+        [1.0e5, 4.0e5],
+        A=c.A,
+        p=c.p,
+        t=c.t,
+        fcd=fcd,
+        fyd=fyd,
+        stirrup_leg_area=ASW,
+        stirrup_step=10.0,
+        Al=4.0,
+    )
+    mtu1 = 2 * 4.0 * fyd * c.A / c.p
+    mtu2 = 2 * ASW * fyd * c.A / 10.0
+    mtu3 = 2 * c.A * c.t * 0.5 * fcd * 0.5
+    assert res.strut_resistance[0] == pytest.approx(mtu3)
+    assert res.resistance[0] == pytest.approx(min(mtu1, mtu2, mtu3))
+    assert res.verified.tolist() == [1.0e5 <= min(mtu1, mtu2, mtu3), False]
+
+
+def test_stirrup_torque_grows_with_cot_theta():
+    c = rectangular_torsion_constants(B, H, DELTA)
+    fyd = 3913.0
+    res = torsion_slu_batch(
+        1.0e5,
+        A=c.A,
+        p=c.p,
+        t=c.t,
+        fcd=1000.0,  # struts and longitudinal bars do not govern
+        fyd=fyd,
+        stirrup_leg_area=ASW,
+        stirrup_step=10.0,
+        Al=40.0,
+        theta=30.0,
+    )
+    mtu2 = 2 * ASW / 10.0 * fyd * c.A / math.tan(math.radians(30.0))  # alpha = 90
+    assert res.resistance[()] == pytest.approx(mtu2)
+    assert res.spacing_required[()] == pytest.approx(2 * ASW * fyd * c.A * math.sqrt(3) / 1.0e5)
+
+
+def test_torsion_report_in_batch_and_single_rows():
+    repo = SimpleNamespace(
+        find_by_id=lambda _id: SimpleNamespace(id="s1", name="T", width=B, height=H)
+    )
+    rows = [
+        VerificationInput(
+            section_id="s1",
+            verification_method=method,
+            Mx=2000.0,
+            As_inf=9.4,
+            As_sup=3.0,
+            Mz=Mz,
+            At=At,
+            stirrup_step=10.0,
+            stirrup_diameter=8.0,
+        )
+        for method, Mz, At in (("TA", 0.0, 0.0), ("TA", 2500.0, 4.0), ("SLU", 2500.0, 0.0))
+    ]
+    batch = compute_verification_results(rows, repo, None)
+    assert "VERIFICA A TORSIONE" not in batch[0].messaggi
+    for row, out in zip(rows[1:], batch[1:]):
+        assert "VERIFICA A TORSIONE" in out.messaggi
+        assert out.messaggi == compute_verification_result(row, repo, None).messaggi
+    assert batch[2].esito == "NON VERIFICATO"  # no longitudinal torsion bars
+
+
+def test_shear_and_torsion_demands_add_on_the_same_stirrups():
+    c = rectangular_torsion_constants(B, H, DELTA)
+    T = np.array([2.0e5, 2.0e5, 2.0e5])
+    res = shear_torsion_batch(
+        T,
+        [0.03, 0.03, 0.0],
+        A=c.A,
+        f_stirrup=3913.0,
+        stirrup_leg_area=ASW,
+        stirrup_step=10.0,
+        shear_strut_utilization=[0.2, 0.85, 0.0],
+        torsion_strut_resistance=1.0e6,
+    )
+    torsion_leg = 2.0e5 / (2 * c.A * 3913.0)
+    assert res.asw_required[0] == pytest.approx(0.03 + 2 * torsion_leg)
+    assert res.asw_required[2] == pytest.approx(2 * torsion_leg)
+    assert res.asw_provided == pytest.approx(2 * ASW / 10.0)
+    assert res.spacing_required[0] == pytest.approx(2 * ASW / res.asw_required[0])
+    assert res.interaction == pytest.approx([0.4, 1.05, 0.2])
+    assert res.verified.tolist() == [True, False, True]
+
+
+def test_row_passing_shear_and_torsion_alone_fails_combined():
+    repo = SimpleNamespace(
+        find_by_id=lambda _id: SimpleNamespace(id="s1", name="T", width=B, height=H)
+    )
+    row = VerificationInput(
+        section_id="s1",
+        verification_method="SLU",
+        Mx=2000.0,
+        As_inf=9.4,
+        As_sup=3.0,
+        Ty=10000.0,
+        Mz=1500.0,
+        At=8.0,
+        stirrup_step=10.0,
+        stirrup_diameter=8.0,
+    )
+    out = compute_verification_results([row], repo, None)[0]
+    report = "\n".join(out.messaggi)
+    assert "Esito taglio: VERIFICATO" in report
+    assert "Esito torsione: VERIFICATO" in report
+    assert "Esito taglio + torsione: NON VERIFICATO" in report
+    assert "Interazione bielle T/TRcd + V/VRcd" in report
+    assert out.esito == "NON VERIFICATO"
+    assert out.messaggi == compute_verification_result(row, repo, None).messaggi
@@ -0,0 +1,71 @@
+import numpy as np
+
+from src.core_calculus.core.verification_core import (
+    LoadCase,
+    MaterialProperties,
+    ReinforcementLayer,
+    SectionGeometry,
+    VerificationType,
+)
+from src.core_calculus.core.verification_engine import VerificationEngine
+
+
+def _scalar(engine, material, b, h, As, d, As_p, d_p, **loads):
+    return engine.perform_verification(
+        section=SectionGeometry(width=b, height=h),
+        reinforcement_tensile=ReinforcementLayer(area=As, distance=d),
+        reinforcement_compressed=ReinforcementLayer(area=As_p, distance=d_p),
+        material=material,
+        loads=LoadCase(**loads),
+    )
+
+
+def test_batch_matches_scalar_simple_bending():
+    engine = VerificationEngine("TA")
+    material = MaterialProperties(fck=160.0, fyk=3800.0)
+    rng = np.random.default_rng(0)
+    size = 50
+    b = rng.uniform(20, 50, size)
+    h = rng.uniform(30, 80, size)
+    As = rng.uniform(2, 20, size)
+    As_p = rng.uniform(0, 8, size)
+    d = h - 4.0
+    d_p = np.full(size, 4.0)
+    Mx = rng.uniform(1e4, 5e6, size)
+    N = np.where(np.arange(size) % 3 == 0, 1000.0, 0.0)
+
+    batch = engine.perform_verification_batch(b, h, As, d, As_p, d_p, material, N=N, Mx=Mx)
+
+    assert len(batch) == size
+    for i in range(size):
+        ref = _scalar(engine, material, b[i], h[i], As[i], d[i], As_p[i], d_p[i], N=N[i], Mx=Mx[i])
+        assert batch.verification_type[i] == ref.verification_type
+        assert np.isclose(batch.neutral_axis_x[i], ref.neutral_axis.x)
+        assert np.isclose(batch.sigma_c_max[i], ref.stress_state.sigma_c_max)
+        assert np.isclose(batch.sigma_s_tensile[i], ref.stress_state.sigma_s_tensile)
+        assert np.isclose(batch.sigma_s_compressed[i], ref.stress_state.sigma_s_compressed)
+        assert np.isclose(batch.utilization_concrete[i], ref.utilization_concrete)
+        assert np.isclose(batch.utilization_steel[i], ref.utilization_steel)
+        assert bool(batch.is_verified[i]) == ref.is_verified
+
+
+def test_batch_falls_back_for_other_verification_types():
+    engine = VerificationEngine("TA")
+    material = MaterialProperties(fck=160.0, fyk=3800.0)
+    batch = engine.perform_verification_batch(
+        [30.0, 30.0],
+        [50.0, 50.0],
+        [6.0, 6.0],
+        [46.0, 46.0],
+        [2.0, 2.0],
+        [4.0, 4.0],
+        material,
+        Mx=[1e5, 0.0],
+        Ty=[0.0, 2000.0],
+    )
+    assert batch.verification_type[0] == VerificationType.BENDING_SIMPLE
+    assert batch.verification_type[1] == VerificationType.SHEAR
+    assert 1 in batch.messages and 0 not in batch.messages
+
+    ref = _scalar(engine, material, 30.0, 50.0, 6.0, 46.0, 2.0, 4.0, Ty=2000.0)
+    assert np.isclose(batch.sigma_c_max[1], ref.stress_state.sigma_c_max)
@@ -10,6 +10,29 @@ from verification_items import VerificationItem
 logger: logging.Logger = logging.getLogger(__name__)
 
 
+def item_to_dict(item: VerificationItem) -> dict:
+    """Struttura JSON di un elemento (condivisa dai backend di persistenza)."""
+    return {
+        "id": item.id,
+        "name": item.name,
+        "group": item.group,
+        "input": asdict(item.input),
+    }
+
+
+def item_from_dict(data: dict) -> VerificationItem:
+    """Ricostruisce un elemento dalla struttura prodotta da `item_to_dict`."""
+    from verification_table import VerificationInput
+
+    input_data = data.get("input", {}) if isinstance(data, dict) else {}
+    return VerificationItem(
+        id=data.get("id", ""),
+        name=data.get("name", ""),
+        group=data.get("group"),
+        input=VerificationInput(**input_data),
+    )
+
+
 class VerificationItemsRepository:
     """Repository persistente degli elementi soggetti a verifica.
 
@@ -71,16 +94,7 @@ class VerificationItemsRepository:
                 return
             for idx, item in enumerate(raw):
                 try:
-                    from verification_table import VerificationInput
-
-                    input_data = item.get("input", {}) if isinstance(item, dict) else {}
-                    ver_input = VerificationInput(**input_data)
-                    ver_item = VerificationItem(
-                        id=item.get("id", ""),
-                        name=item.get("name", ""),
-                        group=item.get("group"),
-                        input=ver_input,
-                    )
+                    ver_item = item_from_dict(item)
                     if ver_item.id:
                         self._items[ver_item.id] = ver_item
                 except (TypeError, ValueError, KeyError) as exc:
@@ -93,16 +107,7 @@ class VerificationItemsRepository:
         try:
             if self._path.parent.exists() is False and str(self._path.parent) != ".":
                 self._path.parent.mkdir(parents=True, exist_ok=True)
-            payload = []
-            for item in self._items.values():
-                payload.append(
-                    {
-                        "id": item.id,
-                        "name": item.name,
-                        "group": item.group,
-                        "input": asdict(item.input),
-                    }
-                )
+            payload = [item_to_dict(item) for item in self._items.values()]
             tmp: Path = self._path.with_suffix(self._path.suffix + ".tmp")
             with tmp.open("w", encoding="utf-8") as fh:
                 json.dump(payload, fh, indent=2, ensure_ascii=False)